@@ -0,0 +1,231 @@
+"""
+Shared helpers for the package build scripts
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import sys
+import subprocess
+import shutil
+from pathlib import Path
+
+try:
+    import xxhash
+except ImportError:  # Optional accelerator, fall back to hashlib
+    xxhash = None
+
+
+# Project files that feed every package build
+BUILD_INPUTS = ("setup.py", "pyproject.toml", "requirements.txt", "cli.py", "config.example.yml", "README.md")
+SOURCE_DIR = "src"
+CACHE_KEY_FILE = ".cache_key"
+BUILD_LOG_FILE = "build.log"
+
+
+def _iter_source_files(directory):
+    """Yield all Python files below directory in a stable order"""
+    with os.scandir(directory) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    yield from _iter_source_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+
+
+def inputs_digest(extra_inputs=()):
+    """Content hash of all build inputs (xxHash3-128 when available)"""
+    hasher = xxhash.xxh3_128() if xxhash else hashlib.blake2b(digest_size=16)
+    paths = [*BUILD_INPUTS, *_iter_source_files(SOURCE_DIR), *map(str, extra_inputs)]
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            continue
+        hasher.update(path.encode())
+        hasher.update(len(data).to_bytes(8, "little"))
+        hasher.update(data)
+    return hasher.hexdigest()
+
+
+def is_up_to_date(build_dir, digest, artifact_pattern):
+    """Check whether build_dir holds artifacts built from inputs matching digest"""
+    cache_key = build_dir / CACHE_KEY_FILE
+    try:
+        if cache_key.read_text().strip() != digest:
+            return False
+    except FileNotFoundError:
+        return False
+    return any(build_dir.glob(artifact_pattern))
+
+
+def write_if_changed(path, content):
+    """
+    Write content to path only when it differs from what is already there.
+    
+    Leaves the mtime of unchanged files alone so downstream tools do not
+    see a spurious modification.
+    """
+    path = Path(path)
+    new_content = content.encode()
+    try:
+        if path.read_bytes() == new_content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(new_content)
+    return True
+
+
+def record_build(build_dir, digest):
+    """Remember the input digest of the artifacts now in build_dir"""
+    (build_dir / CACHE_KEY_FILE).write_text(digest)
+
+
+@contextlib.contextmanager
+def build_log(dist_subdir):
+    """Open dist/<dist_subdir>/build.log once and yield its file descriptor"""
+    log_dir = os.path.join("dist", dist_subdir)
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, BUILD_LOG_FILE)
+    log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    print(f"Build tool output is written to {log_path}")
+    try:
+        yield log_fd
+    finally:
+        os.close(log_fd)
+
+
+def _output_kwargs(log_fd):
+    """Redirect child stdout/stderr straight into the build log when one is open"""
+    if log_fd is None:
+        return {}
+    return {"stdout": log_fd, "stderr": subprocess.STDOUT}
+
+
+def run(cmd, log_fd=None, **kwargs):
+    """subprocess.run() that streams output into the build log, if given"""
+    # env is deliberately left unset: the child inherits the parent environment
+    # without a per-call dict being built, and the build tools keep the proxy,
+    # locale and (on Windows) SystemRoot/TEMP variables they depend on
+    return subprocess.run(cmd, **_output_kwargs(log_fd), **kwargs)
+
+
+async def sh(*args, log_fd=None):
+    """Run a command without blocking the event loop, raising CalledProcessError on failure"""
+    proc = await asyncio.create_subprocess_exec(*args, **_output_kwargs(log_fd))
+    returncode = await proc.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, args)
+
+
+def run_concurrently(*commands, log_fd=None):
+    """Run independent commands at the same time, bounded by the CPU count"""
+    async def _main():
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        async def _run(command):
+            async with semaphore:
+                await sh(*command, log_fd=log_fd)
+        
+        await asyncio.gather(*(_run(command) for command in commands))
+    
+    asyncio.run(_main())
+
+
+def clean_artifacts(suffixes):
+    """Remove stale build artifacts from the working directory in a single pass"""
+    if os.scandir not in os.supports_fd or os.unlink not in os.supports_dir_fd:
+        # Windows: no directory file descriptors
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith(suffixes):
+                    os.unlink(entry.path)
+        return
+    
+    # Sweep and unlinkat() relative to one open directory fd, like 'find -delete',
+    # so no path is resolved again per file
+    dir_fd = os.open(".", os.O_RDONLY)
+    try:
+        with os.scandir(dir_fd) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith(suffixes):
+                    os.unlink(entry.name, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def latest_sdist():
+    """Return the most recently built source distribution in dist/"""
+    with os.scandir("dist") as entries:
+        dist_files = [entry for entry in entries if entry.is_file() and entry.name.endswith(".tar.gz")]
+    if not dist_files:
+        print("ERROR: No source distribution found!")
+        sys.exit(1)
+    
+    return Path(max(dist_files, key=lambda entry: entry.stat().st_mtime).path)
+
+
+def move_artifact(src, dest_dir):
+    """Move a build artifact into dest_dir, renaming in place when possible"""
+    dest = dest_dir / src.name
+    try:
+        os.replace(src, dest)
+    except OSError:
+        # Cross-filesystem move: copy the contents only, then drop the source
+        shutil.copyfile(src, dest)
+        src.unlink()
+
+
+def build_linux_package(kind, package_suffix, dist_subdir, package_builder, before_package=None, log_fd=None):
+    """
+    Run the shared sdist -> native package pipeline.
+    
+    Args:
+        kind: Human readable package type, e.g. "DEB"
+        package_suffix: File suffix of the produced packages, e.g. ".deb"
+        dist_subdir: Subdirectory of dist/ that receives the packages
+        package_builder: Callable taking the sdist path and log fd, returning the built package files
+        before_package: Optional callable run after the sdist is built
+        log_fd: Optional build log file descriptor for tool output
+    """
+    print(f"Building {kind} package...")
+    
+    # Create build directory
+    build_dir = Path("dist") / dist_subdir
+    build_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Skip the whole pipeline when nothing changed since the last build
+    digest = inputs_digest(extra_inputs=[__file__, sys.argv[0]])
+    if is_up_to_date(build_dir, digest, f"*{package_suffix}"):
+        print(f"SUCCESS: {kind} package is up to date, skipping build.")
+        print(f"PACKAGE: Package location: {build_dir}")
+        return
+    
+    # Clean previous builds
+    clean_artifacts((package_suffix, ".tar.gz"))
+    
+    # Build source distribution
+    run([sys.executable, "setup.py", "sdist"], log_fd, check=True)
+    
+    if before_package:
+        before_package()
+    
+    latest_dist = latest_sdist()
+    print(f"Using source distribution: {latest_dist}")
+    
+    package_files = package_builder(latest_dist, log_fd)
+    
+    # Move packages to dist directory
+    if not package_files:
+        print(f"ERROR: No {kind} files were created!")
+        sys.exit(1)
+    
+    for package_file in package_files:
+        move_artifact(package_file, build_dir)
+    record_build(build_dir, digest)
+    print(f"SUCCESS: {kind} package built successfully!")
+    print(f"PACKAGE: Package location: {build_dir}")
@@ -3,62 +3,138 @@
 Master build script for creating all package types (EXE, DEB, RPM)
 """
 
+import asyncio
+import functools
 import os
+import re
 import sys
-import subprocess
 import platform
 from pathlib import Path
 
 
+try:
+    import distro
+except ImportError:  # Optional, fall back to parsing /etc/os-release
+    distro = None
+
+
+# distro.id() / ID_LIKE values -> package family
+_DISTRO_FAMILIES = {
+    "ubuntu": "debian",
+    "debian": "debian",
+    "rhel": "rpm",
+    "redhat": "rpm",
+    "centos": "rpm",
+    "fedora": "rpm",
+}
+
+_DEBIAN_RE = re.compile(r"ubuntu|debian", re.IGNORECASE)
+_RPM_RE = re.compile(r"redhat|centos|fedora", re.IGNORECASE)
+
+
+def _detect_linux_family():
+    """Map the running Linux distribution to a package family"""
+    if distro is not None:
+        for distro_id in (distro.id(), *distro.like().split()):
+            if distro_id in _DISTRO_FAMILIES:
+                return _DISTRO_FAMILIES[distro_id]
+        return "linux"
+    
+    try:
+        content = Path("/etc/os-release").read_text()
+    except FileNotFoundError:
+        return "linux"
+    if _DEBIAN_RE.search(content):
+        return "debian"
+    elif _RPM_RE.search(content):
+        return "rpm"
+    return "linux"
+
+
+@functools.lru_cache(maxsize=1)
 def detect_platform():
-    """Detect the current platform"""
+    """Detect the current platform (computed once per process)"""
     system = platform.system().lower()
     if system == "windows":
         return "windows"
     elif system == "linux":
-        # Try to detect distribution
-        try:
-            with open("/etc/os-release", "r") as f:
-                content = f.read().lower()
-                if "ubuntu" in content or "debian" in content:
-                    return "debian"
-                elif "redhat" in content or "centos" in content or "fedora" in content:
-                    return "rpm"
-        except FileNotFoundError:
-            pass
-        return "linux"
+        return _detect_linux_family()
     else:
         return "unknown"
 
 
+# Build target -> (banner, script, label)
+BUILD_TARGETS = {
+    "windows": ("🪟 Building Windows EXE...", "build_scripts/build_exe.py", "Windows"),
+    "debian": ("🐧 Building DEB package...", "build_scripts/build_deb.py", "DEB"),
+    "rpm": ("🔴 Building RPM package...", "build_scripts/build_rpm.py", "RPM"),
+}
+
+DIST_DIRS = tuple(os.path.join("dist", target) for target in BUILD_TARGETS)
+
+TARGET_ALIASES = {
+    "exe": "windows",
+    "deb": "debian",
+}
+
+# Upper bound for a single package build, in seconds
+BUILD_TIMEOUT = 60 * 60
+
+
+async def _stream_output(proc, label):
+    """Print the child's output line by line as it is produced"""
+    async for line in proc.stdout:
+        print(f"[{label}] {line.decode(errors='replace').rstrip()}", flush=True)
+    return await proc.wait()
+
+
+async def run_build(target):
+    """Run a single build script as a subprocess and report its result"""
+    banner, script, label = BUILD_TARGETS[target]
+    print(banner, flush=True)
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    try:
+        returncode = await asyncio.wait_for(_stream_output(proc, label), timeout=BUILD_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        print(f"❌ {label} build timed out after {BUILD_TIMEOUT} seconds")
+        return False
+    
+    if returncode != 0:
+        print(f"❌ {label} build failed: {script} exited with status {returncode}")
+        return False
+    print(f"✅ {label} build completed!")
+    return True
+
+
+def run_builds(targets):
+    """Run the given build targets one after another, returning results in target order"""
+    # Every build script runs 'setup.py sdist' in the shared working tree and
+    # cleans/reads dist/ and the egg-info, so the targets must not overlap
+    async def _main():
+        return [await run_build(target) for target in targets]
+    
+    return asyncio.run(_main())
+
+
 def build_windows():
     """Build Windows EXE"""
-    print("🪟 Building Windows EXE...")
-    try:
-        subprocess.run([sys.executable, "build_scripts/build_exe.py"], check=True)
-        print("✅ Windows build completed!")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Windows build failed: {e}")
+    return run_builds(["windows"])[0]
 
 
 def build_debian():
     """Build DEB package"""
-    print("🐧 Building DEB package...")
-    try:
-        subprocess.run([sys.executable, "build_scripts/build_deb.py"], check=True)
-        print("✅ DEB build completed!")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ DEB build failed: {e}")
+    return run_builds(["debian"])[0]
 
 
 def build_rpm():
     """Build RPM package"""
-    print("🔴 Building RPM package...")
-    try:
-        subprocess.run([sys.executable, "build_scripts/build_rpm.py"], check=True)
-        print("✅ RPM build completed!")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ RPM build failed: {e}")
+    return run_builds(["rpm"])[0]
 
 
 def build_all():
@@ -66,21 +142,14 @@ def build_all():
     print("🚀 Starting build process for all platforms...")
     
     # Create dist directory structure
-    dist_dir = Path("dist")
-    dist_dir.mkdir(exist_ok=True)
-    
-    for platform_dir in ["windows", "debian", "rpm"]:
-        (dist_dir / platform_dir).mkdir(exist_ok=True)
+    for dist_dir in DIST_DIRS:
+        os.makedirs(dist_dir, exist_ok=True)
     
     # Build based on current platform
     current_platform = detect_platform()
     
-    if current_platform == "windows":
-        build_windows()
-    elif current_platform == "debian":
-        build_debian()
-    elif current_platform == "rpm":
-        build_rpm()
+    if current_platform in BUILD_TARGETS:
+        run_builds([current_platform])
     else:
         print(f"⚠️  Unknown platform: {current_platform}")
         print("Available build scripts:")
@@ -92,19 +161,20 @@ def build_all():
 def main():
     """Main function"""
     if len(sys.argv) > 1:
-        target = sys.argv[1].lower()
-        if target == "windows" or target == "exe":
-            build_windows()
-        elif target == "debian" or target == "deb":
-            build_debian()
-        elif target == "rpm":
-            build_rpm()
-        elif target == "all":
+        targets = [TARGET_ALIASES.get(arg.lower(), arg.lower()) for arg in sys.argv[1:]]
+        if "all" in targets:
             build_all()
-        else:
-            print(f"❌ Unknown target: {target}")
+            return
+        
+        unknown = [target for target in targets if target not in BUILD_TARGETS]
+        if unknown:
+            print(f"❌ Unknown target: {', '.join(unknown)}")
             print("Available targets: windows, debian, rpm, all")
             sys.exit(1)
+        
+        # Targets share dist/ and the sdist, so they run in sequence
+        if not all(run_builds(list(dict.fromkeys(targets)))):
+            sys.exit(1)
     else:
         # Default to building for current platform
         build_all()
@@ -3,49 +3,50 @@
 Build script for creating DEB package for Debian/Ubuntu
 """
 
-import os
 import sys
 import subprocess
-import shutil
 from pathlib import Path
 
+from _build_common import build_linux_package, build_log, run, write_if_changed
 
-def install_dependencies():
-    """Install required dependencies for building"""
-    print("Installing build dependencies...")
-    subprocess.run(["sudo", "apt-get", "update"], check=True)
-    subprocess.run(["sudo", "apt-get", "install", "-y", "python3-stdeb", "dh-python"], check=True)
 
+BUILD_PACKAGES = ["python3-stdeb", "dh-python"]
 
-def build_deb():
-    """Build the DEB package"""
-    print("Building DEB package...")
-    
-    # Create build directory
-    build_dir = Path("dist/debian")
-    build_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Clean previous builds
-    for item in Path(".").glob("*.deb"):
-        item.unlink()
-    for item in Path(".").glob("*.tar.gz"):
-        item.unlink()
-    
-    # Build source distribution
-    subprocess.run([sys.executable, "setup.py", "sdist"], check=True)
-    
-    # Convert to DEB
-    dist_files = list(Path("dist").glob("*.tar.gz"))
-    if not dist_files:
-        print("ERROR: No source distribution found!")
-        sys.exit(1)
+
+def dependencies_installed():
+    """Check whether all build dependencies are already installed"""
+    try:
+        result = subprocess.run(
+            ["dpkg-query", "-W", "-f=${Status}\n", *BUILD_PACKAGES],
+            capture_output=True, text=True
+        )
+    except FileNotFoundError:
+        return False
     
-    latest_dist = max(dist_files, key=lambda x: x.stat().st_mtime)
-    print(f"Using source distribution: {latest_dist}")
+    statuses = result.stdout.splitlines()
+    return (
+        result.returncode == 0
+        and len(statuses) == len(BUILD_PACKAGES)
+        and all(status == "install ok installed" for status in statuses)
+    )
+
+
+def install_dependencies(log_fd=None):
+    """Install required dependencies for building"""
+    if dependencies_installed():
+        print("Build dependencies already installed, skipping.")
+        return
     
+    print("Installing build dependencies...")
+    run(["sudo", "apt-get", "update"], log_fd, check=True)
+    run(["sudo", "apt-get", "install", "-y", *BUILD_PACKAGES], log_fd, check=True)
+
+
+def package_deb(latest_dist, log_fd=None):
+    """Convert the source distribution into DEB packages"""
     # Extract and build DEB
     try:
-        subprocess.run(["py2dsc", str(latest_dist)], check=True)
+        run(["py2dsc", str(latest_dist)], log_fd, check=True)
     except subprocess.CalledProcessError as e:
         print(f"ERROR: Failed to convert to DEB format: {e}")
         print("This might be due to stdeb compatibility issues with Python 3.12")
@@ -55,8 +56,8 @@ def build_deb():
     debian_dir = Path("deb_dist/git-repo-manager-1.0.0/debian")
     if debian_dir.exists():
         try:
-            subprocess.run(["dpkg-buildpackage", "-rfakeroot", "-uc", "-us"], 
-                          cwd=debian_dir.parent, check=True)
+            run(["dpkg-buildpackage", "-rfakeroot", "-uc", "-us"], log_fd,
+                cwd=debian_dir.parent, check=True)
         except subprocess.CalledProcessError as e:
             print(f"ERROR: Failed to build DEB package: {e}")
             sys.exit(1)
@@ -64,16 +65,12 @@ def build_deb():
         print(f"ERROR: Debian directory not found at {debian_dir}")
         sys.exit(1)
     
-    # Move DEB to dist directory
-    deb_files = list(Path(".").glob("*.deb"))
-    if deb_files:
-        for deb_file in deb_files:
-            shutil.move(str(deb_file), str(build_dir))
-        print("SUCCESS: DEB package built successfully!")
-        print(f"PACKAGE: Package location: {build_dir}")
-    else:
-        print("ERROR: No DEB files were created!")
-        sys.exit(1)
+    return list(Path(".").glob("*.deb"))
+
+
+def build_deb(log_fd=None):
+    """Build the DEB package"""
+    build_linux_package("DEB", ".deb", "debian", package_deb, log_fd=log_fd)
 
 
 def create_debian_control():
@@ -100,11 +97,11 @@ Description: GitLab Repository Management Tool
     debian_dir = Path("debian")
     debian_dir.mkdir(exist_ok=True)
     
-    with open(debian_dir / "control", "w") as f:
-        f.write(control_content)
+    write_if_changed(debian_dir / "control", control_content)
 
 
 if __name__ == "__main__":
-    install_dependencies()
-    create_debian_control()
-    build_deb() 
\ No newline at end of file
+    with build_log("debian") as log_fd:
+        install_dependencies(log_fd)
+        create_debian_control()
+        build_deb(log_fd) 
\ No newline at end of file
@@ -7,16 +7,56 @@ import os
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _build_common import build_log, inputs_digest, is_up_to_date, record_build, run
 
-def install_dependencies():
+
+def install_dependencies(log_fd=None):
     """Install required dependencies for building"""
     print("Installing build dependencies...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
+    run([sys.executable, "-m", "pip", "install", "pyinstaller"], log_fd, check=True)
+
+
+SPEC_DIR = Path("build/windows")
+SPEC_FILE = SPEC_DIR / "git-repo-manager.spec"
 
 
-def build_exe():
+def ensure_spec(config_example, readme, log_fd=None):
+    """
+    Generate the PyInstaller spec file once and reuse it on later runs.
+    
+    The spec is regenerated when it is missing or older than this script,
+    since the PyInstaller options below are its only input.
+    """
+    if SPEC_FILE.exists() and SPEC_FILE.stat().st_mtime >= Path(__file__).stat().st_mtime:
+        print(f"Reusing PyInstaller spec: {SPEC_FILE}")
+        return SPEC_FILE
+    
+    # pyi-makespec command with absolute paths
+    cmd = [
+        "pyi-makespec",
+        "--onefile",
+        "--name=git-repo-manager",
+        f"--specpath={SPEC_DIR}",
+        f"--add-data={config_example};.",
+        f"--add-data={readme};.",
+        "--hidden-import=click",
+        "--hidden-import=yaml",
+        "--hidden-import=requests",
+        "cli.py"
+    ]
+    
+    try:
+        run(cmd, log_fd, check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"ERROR: Error generating PyInstaller spec: {e}")
+        sys.exit(1)
+    return SPEC_FILE
+
+
+def build_exe(log_fd=None):
     """Build the Windows EXE"""
     print("Building Windows EXE...")
     
@@ -38,24 +78,26 @@ def build_exe():
         print(f"ERROR: README.md not found at {readme}")
         sys.exit(1)
     
-    # PyInstaller command with absolute paths
+    # Skip PyInstaller entirely when nothing changed since the last build
+    digest = inputs_digest(extra_inputs=[__file__])
+    if is_up_to_date(build_dir, digest, "git-repo-manager*"):
+        print("SUCCESS: Windows EXE is up to date, skipping build.")
+        print(f"PACKAGE: Executable location: {build_dir / 'git-repo-manager.exe'}")
+        return
+    
+    spec_file = ensure_spec(config_example, readme, log_fd)
+    
+    # Build from the generated spec so PyInstaller can reuse its analysis cache
     cmd = [
         "pyinstaller",
-        "--onefile",
-        "--name=git-repo-manager",
         "--distpath=dist/windows",
         "--workpath=build/windows",
-        "--specpath=build/windows",
-        f"--add-data={config_example};.",
-        f"--add-data={readme};.",
-        "--hidden-import=click",
-        "--hidden-import=yaml",
-        "--hidden-import=requests",
-        "cli.py"
+        str(spec_file)
     ]
     
     try:
-        subprocess.run(cmd, check=True)
+        run(cmd, log_fd, check=True)
+        record_build(build_dir, digest)
         print("SUCCESS: Windows EXE built successfully!")
         print(f"PACKAGE: Executable location: {build_dir / 'git-repo-manager.exe'}")
     except subprocess.CalledProcessError as e:
@@ -70,20 +112,18 @@ def create_windows_package():
     package_dir = Path("dist/windows/package")
     package_dir.mkdir(parents=True, exist_ok=True)
     
-    # Copy executable
-    exe_path = Path("dist/windows/git-repo-manager.exe")
-    if exe_path.exists():
-        shutil.copy2(exe_path, package_dir)
-    
-    # Copy config example
-    config_example = Path("config.example.yml")
-    if config_example.exists():
-        shutil.copy2(config_example, package_dir)
-    
-    # Copy README
-    readme = Path("README.md")
-    if readme.exists():
-        shutil.copy2(readme, package_dir)
+    # Copy executable, config example and README (contents only, no metadata)
+    package_files = [
+        Path("dist/windows/git-repo-manager.exe"),
+        Path("config.example.yml"),
+        Path("README.md"),
+    ]
+    # Copies are independent; overlap them for latency-bound (network) drives
+    with ThreadPoolExecutor(max_workers=len(package_files)) as executor:
+        list(executor.map(
+            lambda src: shutil.copyfile(src, package_dir / src.name),
+            [src for src in package_files if src.exists()]
+        ))
     
     # Create batch file for easy execution
     batch_content = """@echo off
@@ -98,6 +138,7 @@ git-repo-manager.exe %*
 
 
 if __name__ == "__main__":
-    install_dependencies()
-    build_exe()
-    create_windows_package() 
\ No newline at end of file
+    with build_log("windows") as log_fd:
+        install_dependencies(log_fd)
+        build_exe(log_fd)
+        create_windows_package() 
\ No newline at end of file
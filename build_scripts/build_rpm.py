@@ -3,71 +3,61 @@
 Build script for creating RPM package for Red Hat/CentOS/Fedora
 """
 
-import os
+import importlib.util
 import sys
 import subprocess
-import shutil
 from pathlib import Path
 
+from _build_common import build_linux_package, build_log, run, run_concurrently, write_if_changed
 
-def install_dependencies():
-    """Install required dependencies for building"""
-    print("Installing build dependencies...")
-    subprocess.run(["sudo", "yum", "install", "-y", "rpm-build", "python3-setuptools"], check=True)
-    subprocess.run([sys.executable, "-m", "pip", "install", "rpmvenv"], check=True)
 
+BUILD_PACKAGES = ["rpm-build", "python3-setuptools"]
 
-def build_rpm():
-    """Build the RPM package"""
-    print("Building RPM package...")
-    
-    # Create build directory
-    build_dir = Path("dist/rpm")
-    build_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Clean previous builds
-    for item in Path(".").glob("*.rpm"):
-        item.unlink()
-    for item in Path(".").glob("*.tar.gz"):
-        item.unlink()
-    
-    # Build source distribution
-    subprocess.run([sys.executable, "setup.py", "sdist"], check=True)
-    
-    # Create RPM spec file
-    create_rpm_spec()
-    
-    # Build RPM
-    dist_files = list(Path("dist").glob("*.tar.gz"))
-    if not dist_files:
-        print("ERROR: No source distribution found!")
-        sys.exit(1)
+
+def dependencies_installed():
+    """Check whether all system build dependencies are already installed"""
+    try:
+        result = subprocess.run(["rpm", "-q", *BUILD_PACKAGES], capture_output=True)
+    except FileNotFoundError:
+        return False
+    return result.returncode == 0
+
+
+def install_dependencies(log_fd=None):
+    """Install required dependencies for building"""
+    print("Installing build dependencies...")
+    commands = []
+    if dependencies_installed():
+        print("System build dependencies already installed, skipping yum.")
+    else:
+        commands.append(["sudo", "yum", "install", "-y", *BUILD_PACKAGES])
     
-    latest_dist = max(dist_files, key=lambda x: x.stat().st_mtime)
-    print(f"Using source distribution: {latest_dist}")
+    if importlib.util.find_spec("rpmvenv") is None:
+        commands.append([sys.executable, "-m", "pip", "install", "rpmvenv"])
     
-    # Build RPM
+    # yum and pip installs are independent, so overlap them
+    run_concurrently(*commands, log_fd=log_fd)
+
+
+def package_rpm(latest_dist, log_fd=None):
+    """Build RPM packages from the source distribution"""
     try:
-        subprocess.run(["rpmbuild", "-ta", str(latest_dist)], check=True)
+        run(["rpmbuild", "-ta", str(latest_dist)], log_fd, check=True)
     except subprocess.CalledProcessError as e:
         print(f"ERROR: Failed to build RPM package: {e}")
         sys.exit(1)
     
-    # Move RPM to dist directory
     rpm_dir = Path.home() / "rpmbuild/RPMS/noarch"
-    if rpm_dir.exists():
-        rpm_files = list(rpm_dir.glob("*.rpm"))
-        if rpm_files:
-            for rpm_file in rpm_files:
-                shutil.move(str(rpm_file), str(build_dir))
-            print("SUCCESS: RPM package built successfully!")
-            print(f"PACKAGE: Package location: {build_dir}")
-        else:
-            print("ERROR: No RPM files were created!")
-            sys.exit(1)
-    else:
+    if not rpm_dir.exists():
         print(f"ERROR: RPM build directory not found at {rpm_dir}")
         sys.exit(1)
+    
+    return list(rpm_dir.glob("*.rpm"))
+
+
+def build_rpm(log_fd=None):
+    """Build the RPM package"""
+    build_linux_package("RPM", ".rpm", "rpm", package_rpm, before_package=create_rpm_spec, log_fd=log_fd)
 
 
 def create_rpm_spec():
@@ -123,10 +113,10 @@ Features include:
 - Initial release
 """
     
-    with open("git-repo-manager.spec", "w") as f:
-        f.write(spec_content)
+    write_if_changed("git-repo-manager.spec", spec_content)
 
 
 if __name__ == "__main__":
-    install_dependencies()
-    build_rpm() 
\ No newline at end of file
+    with build_log("rpm") as log_fd:
+        install_dependencies(log_fd)
+        build_rpm(log_fd) 
\ No newline at end of file
@@ -5,252 +5,74 @@ GitLab Repository Management CLI Tool
 A modular, object-oriented CLI tool for managing GitLab repositories and Composer dependencies.
 """
 
+import importlib
+import logging
+import logging.handlers
+import queue
+import sys
+
 import click
-import os
-from src.config import GitLabConfig, RepositoryConfig, GroupConfig, ComposerConfig, GitHubConfig
-from src.services import UserRepositoryService, GroupRepositoryService, ComposerService, GitHubUserService, GitHubOrganizationService
-from src.config_generator import ConfigGenerator
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports subcommands only when they are needed
+    
+    Subcommands are registered as ``"module.path:attribute"`` strings and
+    resolved on first lookup, so ``--version`` and a single subcommand
+    invocation never build the parser state of every other command.
+    """
+    
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+    
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+    
+    def _lazy_load(self, cmd_name):
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(':')
+        return getattr(importlib.import_module(module_name), attr_name)
+
+
+# Services, clients and config are in turn imported inside each command body,
+# so even loading every command for --help skips the HTTP/client stack.
+@click.group(cls=LazyGroup, lazy_subcommands={
+    'clone-user': 'src.commands.gitlab:clone_user',
+    'clone-groups': 'src.commands.gitlab:clone_groups',
+    'clone-all': 'src.commands.gitlab:clone_all',
+    'clone-github-user': 'src.commands.github:clone_github_user',
+    'clone-github-org': 'src.commands.github:clone_github_org',
+    'update-composer': 'src.commands.composer:update_composer',
+    'init-config': 'src.commands.configuration:init_config',
+    'config-info': 'src.commands.configuration:config_info',
+    'validate-config': 'src.commands.configuration:validate_config',
+})
+@click.option('--log-level', type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR'], case_sensitive=False),
+              default='INFO', show_default=True, help='Set logging level for progress messages')
 @click.version_option(version='1.0.0')
-def cli():
+def cli(log_level):
     """GitLab Repository Management Tool
     
     A modular CLI tool for managing GitLab repositories and Composer dependencies.
     """
-    pass
-
-
-@cli.command()
-@click.option('--gitlab-url', help='GitLab instance URL (overrides config)')
-@click.option('--token', envvar='GITLAB_PRIVATE_TOKEN', help='GitLab Personal Access Token (overrides config)')
-@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
-@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
-@click.option('--output-dir', help='Custom output directory for cloned repositories')
-def clone_user(gitlab_url, token, repo_dir, max_workers, output_dir):
-    """Clone all repositories owned by the authenticated user"""
-    click.echo("🚀 Starting user repository cloning process...")
-    
-    # Initialize configurations from config file
-    gitlab_config = GitLabConfig.from_config()
-    repo_config = RepositoryConfig.from_config()
-    
-    # Override with command line options if provided
-    if gitlab_url:
-        gitlab_config.url = gitlab_url
-    if token:
-        gitlab_config.private_token = token
-    if repo_dir:
-        repo_config.repo_dir = repo_dir
-    if max_workers:
-        repo_config.max_concurrent_downloads = max_workers
-    
-    # Create and run service
-    service = UserRepositoryService(gitlab_config, repo_config)
-    service.clone_user_repositories(output_dir=output_dir)
-
-
-@cli.command()
-@click.option('--gitlab-url', help='GitLab instance URL (overrides config)')
-@click.option('--token', envvar='GITLAB_PRIVATE_TOKEN', help='GitLab Personal Access Token (overrides config)')
-@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
-@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
-@click.option('--group-ids', multiple=True, type=int, help='GitLab group IDs to clone from (overrides config)')
-@click.option('--output-dir', help='Custom output directory for cloned repositories')
-def clone_groups(gitlab_url, token, repo_dir, max_workers, group_ids, output_dir):
-    """Clone all repositories from specified GitLab groups"""
-    click.echo("🚀 Starting group repository cloning process...")
-    
-    # Initialize configurations from config file
-    gitlab_config = GitLabConfig.from_config()
-    repo_config = RepositoryConfig.from_config()
-    group_config = GroupConfig.from_config()
-    
-    # Override with command line options if provided
-    if gitlab_url:
-        gitlab_config.url = gitlab_url
-    if token:
-        gitlab_config.private_token = token
-    if repo_dir:
-        repo_config.repo_dir = repo_dir
-    if max_workers:
-        repo_config.max_concurrent_downloads = max_workers
-    if group_ids:
-        group_config.target_group_ids = list(group_ids)
-    
-    # Create and run service
-    service = GroupRepositoryService(gitlab_config, repo_config, group_config)
-    service.clone_group_repositories(output_dir=output_dir)
-
-
-@cli.command()
-@click.option('--directory', default=os.getcwd(), help='Directory to search for composer.json files')
-def update_composer(directory):
-    """Update Composer dependencies in all projects"""
-    click.echo("🔧 Starting Composer dependency update process...")
-    
-    # Create and run service
-    service = ComposerService()
-    service.update_composer_dependencies(directory)
-
-
-@cli.command()
-@click.option('--force', is_flag=True, help='Overwrite existing config file')
-@click.option('--non-interactive', is_flag=True, help='Use default values without prompting')
-def init_config(force, non_interactive):
-    """Initialize configuration file in user's home directory"""
-    click.echo("⚙️  Initializing configuration...")
-    
-    generator = ConfigGenerator()
-    try:
-        success = generator.generate_config(force=force, interactive=not non_interactive)
-        
-        if success:
-            if non_interactive:
-                click.echo("\n📋 Next steps:")
-                click.echo("1. Edit the config file with your GitLab token")
-                click.echo("2. Update group IDs as needed")
-                click.echo("3. Run 'git-repo-manager clone-groups' to start cloning")
-            else:
-                click.echo("\n✅ Configuration completed successfully!")
-                click.echo("You can now run 'git-repo-manager clone-groups' to start cloning")
-    except ValueError as e:
-        click.echo(f"❌ {e}")
-        return
-
-
-@cli.command()
-def config_info():
-    """Show information about the configuration file"""
-    click.echo("📁 Configuration Information")
-    click.echo("=" * 30)
-    
-    generator = ConfigGenerator()
-    generator.show_config_info()
-
-
-@cli.command()
-def validate_config():
-    """Validate the configuration file"""
-    click.echo("🔍 Validating configuration...")
-    
-    generator = ConfigGenerator()
-    is_valid = generator.validate_config()
-    
-    if is_valid:
-        click.echo("✅ Configuration is ready to use!")
-    else:
-        click.echo("❌ Please fix the configuration issues above")
-
-
-@cli.command()
-@click.option('--github-url', help='GitHub API URL (overrides config)')
-@click.option('--token', envvar='GITHUB_ACCESS_TOKEN', help='GitHub Access Token (overrides config)')
-@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
-@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
-@click.option('--username', help='GitHub username to clone from (optional)')
-@click.option('--output-dir', help='Custom output directory for cloned repositories')
-def clone_github_user(github_url, token, repo_dir, max_workers, username, output_dir):
-    """Clone repositories from a GitHub user"""
-    click.echo("🚀 Starting GitHub user repository cloning process...")
-    
-    # Initialize configurations from config file
-    github_config = GitHubConfig.from_config()
-    repo_config = RepositoryConfig.from_config()
-    
-    # Override with command line options if provided
-    if github_url:
-        github_config.url = github_url
-    if token:
-        github_config.access_token = token
-    if repo_dir:
-        repo_config.repo_dir = repo_dir
-    if max_workers:
-        repo_config.max_concurrent_downloads = max_workers
-    
-    # Create and run service
-    service = GitHubUserService(github_config, repo_config)
-    service.clone_user_repositories(username, output_dir=output_dir)
-
-
-@cli.command()
-@click.option('--github-url', help='GitHub API URL (overrides config)')
-@click.option('--token', envvar='GITHUB_ACCESS_TOKEN', help='GitHub Access Token (overrides config)')
-@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
-@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
-@click.option('--output-dir', help='Custom output directory for cloned repositories')
-@click.argument('organization', required=True)
-def clone_github_org(github_url, token, repo_dir, max_workers, output_dir, organization):
-    """Clone repositories from a GitHub organization"""
-    click.echo("🚀 Starting GitHub organization repository cloning process...")
-    
-    # Initialize configurations from config file
-    github_config = GitHubConfig.from_config()
-    repo_config = RepositoryConfig.from_config()
-    
-    # Override with command line options if provided
-    if github_url:
-        github_config.url = github_url
-    if token:
-        github_config.access_token = token
-    if repo_dir:
-        repo_config.repo_dir = repo_dir
-    if max_workers:
-        repo_config.max_concurrent_downloads = max_workers
-    
-    # Create and run service
-    service = GitHubOrganizationService(github_config, repo_config)
-    service.clone_organization_repositories(organization, output_dir=output_dir)
-
-
-@cli.command()
-@click.option('--gitlab-url', help='GitLab instance URL (overrides config)')
-@click.option('--token', envvar='GITLAB_PRIVATE_TOKEN', help='GitLab Personal Access Token (overrides config)')
-@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
-@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
-@click.option('--group-ids', multiple=True, type=int, help='GitLab group IDs to clone from (overrides config)')
-@click.option('--update-composer', is_flag=True, help='Update Composer dependencies after cloning')
-@click.option('--output-dir', help='Custom output directory for cloned repositories')
-def clone_all(gitlab_url, token, repo_dir, max_workers, group_ids, update_composer, output_dir):
-    """Clone all repositories and optionally update Composer dependencies"""
-    click.echo("🚀 Starting complete repository management process...")
-    
-    # Initialize configurations from config file
-    gitlab_config = GitLabConfig.from_config()
-    repo_config = RepositoryConfig.from_config()
-    group_config = GroupConfig.from_config()
-    composer_config = ComposerConfig.from_config()
-    
-    # Override with command line options if provided
-    if gitlab_url:
-        gitlab_config.url = gitlab_url
-    if token:
-        gitlab_config.private_token = token
-    if repo_dir:
-        repo_config.repo_dir = repo_dir
-    if max_workers:
-        repo_config.max_concurrent_downloads = max_workers
-    if group_ids:
-        group_config.target_group_ids = list(group_ids)
-    
-    # Clone user repositories
-    click.echo("\n📦 Cloning user repositories...")
-    user_service = UserRepositoryService(gitlab_config, repo_config)
-    user_service.clone_user_repositories(output_dir=output_dir)
-    
-    # Clone group repositories
-    click.echo("\n📦 Cloning group repositories...")
-    group_service = GroupRepositoryService(gitlab_config, repo_config, group_config)
-    group_service.clone_group_repositories(output_dir=output_dir)
-    
-    # Update Composer dependencies if requested or auto-update is enabled
-    if update_composer or composer_config.auto_update:
-        click.echo("\n🔧 Updating Composer dependencies...")
-        composer_service = ComposerService()
-        composer_service.update_composer_dependencies(repo_config.repo_dir)
-    
-    click.echo("\n✅ Complete repository management process finished!")
+    # Progress messages go through logging so they are only formatted when shown.
+    # Records are queued and written by one listener thread, so clone workers never
+    # wait on the stdout lock; force=True rebinds to the current stdout on every invocation
+    handler = logging.StreamHandler(sys.stdout)
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    # QueueHandler formats each record before queueing it, so the bare-message
+    # format is set there; the listener's handler writes the result unchanged
+    logging.basicConfig(level=log_level.upper(), format='%(message)s',
+                        handlers=[logging.handlers.QueueHandler(log_queue)], force=True)
+    listener.start()
+    # Flush what is still queued once the subcommand has finished
+    click.get_current_context().call_on_close(listener.stop)
 
 
 if __name__ == '__main__':
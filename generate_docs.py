@@ -4,12 +4,19 @@ Documentation generator for Git Repository Manager.
 This script generates API documentation from source code.
 """
 
-import os
-import sys
+import concurrent.futures
+import contextlib
+import functools
 import inspect
+import io
 import importlib
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, TextIO
+
+@functools.lru_cache(maxsize=None)
+def _signature(func) -> str:
+    """Return the formatted signature of a function, computed once per function."""
+    return str(inspect.signature(func))
 
 def get_module_info(module_name: str) -> Dict[str, Any]:
     """Extract information from a module."""
@@ -22,9 +29,12 @@ def get_module_info(module_name: str) -> Dict[str, Any]:
             'functions': []
         }
         
-        # Get classes
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if obj.__module__ == module_name:
+        # Walk the module namespace once; sorted to keep the documented order stable
+        for name, obj in sorted(vars(module).items()):
+            if getattr(obj, '__module__', None) != module_name:
+                continue
+            
+            if inspect.isclass(obj):
                 class_info = {
                     'name': name,
                     'docstring': obj.__doc__ or '',
@@ -32,24 +42,23 @@ def get_module_info(module_name: str) -> Dict[str, Any]:
                 }
                 
                 # Get methods
-                for method_name, method_obj in inspect.getmembers(obj, inspect.isfunction):
-                    if method_obj.__module__ == module_name:
+                for method_name, method_obj in sorted(vars(obj).items()):
+                    if isinstance(method_obj, staticmethod):
+                        method_obj = method_obj.__func__
+                    if inspect.isfunction(method_obj) and method_obj.__module__ == module_name:
                         method_info = {
                             'name': method_name,
                             'docstring': method_obj.__doc__ or '',
-                            'signature': str(inspect.signature(method_obj))
+                            'signature': _signature(method_obj)
                         }
                         class_info['methods'].append(method_info)
                 
                 info['classes'].append(class_info)
-        
-        # Get functions
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
-            if obj.__module__ == module_name:
+            elif inspect.isfunction(obj):
                 function_info = {
                     'name': name,
                     'docstring': obj.__doc__ or '',
-                    'signature': str(inspect.signature(obj))
+                    'signature': _signature(obj)
                 }
                 info['functions'].append(function_info)
         
@@ -58,8 +67,13 @@ def get_module_info(module_name: str) -> Dict[str, Any]:
         print(f"Warning: Could not import {module_name}: {e}")
         return {'name': module_name, 'error': str(e)}
 
-def generate_api_docs() -> str:
-    """Generate API documentation from source code."""
+def _writeln(out: TextIO, text: str = "") -> None:
+    """Write a single line of Markdown to out."""
+    out.write(text)
+    out.write("\n")
+
+def generate_api_docs(out: TextIO) -> None:
+    """Write API documentation generated from source code to out."""
     modules = [
         'src.config',
         'src.gitlab_client',
@@ -69,96 +83,102 @@ def generate_api_docs() -> str:
         'src.services'
     ]
     
-    docs = []
-    docs.append("# API Documentation")
-    docs.append("")
-    docs.append("This documentation is auto-generated from the source code.")
-    docs.append("")
+    _writeln(out, "# API Documentation")
+    _writeln(out)
+    _writeln(out, "This documentation is auto-generated from the source code.")
+    _writeln(out)
     
-    for module_name in modules:
-        module_info = get_module_info(module_name)
-        
+    # Imports are independent, so overlap them; results are rendered in list order
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(modules)) as executor:
+        module_infos = list(executor.map(get_module_info, modules))
+    
+    for module_name, module_info in zip(modules, module_infos):
         if 'error' in module_info:
-            docs.append(f"## {module_name}")
-            docs.append(f"")
-            docs.append(f"Error: {module_info['error']}")
-            docs.append("")
+            _writeln(out, f"## {module_name}")
+            _writeln(out)
+            _writeln(out, f"Error: {module_info['error']}")
+            _writeln(out)
             continue
         
-        docs.append(f"## {module_info['name']}")
-        docs.append("")
+        _writeln(out, f"## {module_info['name']}")
+        _writeln(out)
         
         if module_info['docstring']:
-            docs.append(module_info['docstring'])
-            docs.append("")
+            _writeln(out, module_info['docstring'])
+            _writeln(out)
         
         # Classes
         if module_info['classes']:
-            docs.append("### Classes")
-            docs.append("")
+            _writeln(out, "### Classes")
+            _writeln(out)
             
             for class_info in module_info['classes']:
-                docs.append(f"#### {class_info['name']}")
-                docs.append("")
+                _writeln(out, f"#### {class_info['name']}")
+                _writeln(out)
                 
                 if class_info['docstring']:
-                    docs.append(class_info['docstring'])
-                    docs.append("")
+                    _writeln(out, class_info['docstring'])
+                    _writeln(out)
                 
                 # Methods
                 if class_info['methods']:
-                    docs.append("**Methods:**")
-                    docs.append("")
+                    _writeln(out, "**Methods:**")
+                    _writeln(out)
                     
                     for method_info in class_info['methods']:
-                        docs.append(f"- `{method_info['name']}{method_info['signature']}`")
+                        _writeln(out, f"- `{method_info['name']}{method_info['signature']}`")
                         if method_info['docstring']:
-                            docs.append(f"  - {method_info['docstring'].split('.')[0]}.")
-                        docs.append("")
+                            _writeln(out, f"  - {method_info['docstring'].split('.')[0]}.")
+                        _writeln(out)
         
         # Functions
         if module_info['functions']:
-            docs.append("### Functions")
-            docs.append("")
+            _writeln(out, "### Functions")
+            _writeln(out)
             
             for function_info in module_info['functions']:
-                docs.append(f"#### {function_info['name']}")
-                docs.append("")
-                docs.append(f"```python")
-                docs.append(f"{function_info['name']}{function_info['signature']}")
-                docs.append(f"```")
-                docs.append("")
+                _writeln(out, f"#### {function_info['name']}")
+                _writeln(out)
+                _writeln(out, f"```python")
+                _writeln(out, f"{function_info['name']}{function_info['signature']}")
+                _writeln(out, f"```")
+                _writeln(out)
                 
                 if function_info['docstring']:
-                    docs.append(function_info['docstring'])
-                    docs.append("")
+                    _writeln(out, function_info['docstring'])
+                    _writeln(out)
+
+def _cli_help(cli, args: List[str]) -> str:
+    """Render Click help for the given arguments in-process and return it."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        try:
+            exit_code = cli.main(args + ['--help'], prog_name='cli.py', standalone_mode=False)
+        except SystemExit as e:
+            exit_code = e.code
     
-    return "\n".join(docs)
+    if exit_code not in (None, 0):
+        raise RuntimeError(f"help exited with status {exit_code}")
+    return buf.getvalue()
 
-def generate_cli_docs() -> str:
-    """Generate CLI documentation."""
+def generate_cli_docs(out: TextIO) -> None:
+    """Write CLI documentation to out."""
+    _writeln(out, "# CLI Reference")
+    _writeln(out)
+    
     try:
-        import click
         from cli import cli
         
-        docs = []
-        docs.append("# CLI Reference")
-        docs.append("")
-        docs.append("This documentation is auto-generated from the CLI commands.")
-        docs.append("")
+        _writeln(out, "This documentation is auto-generated from the CLI commands.")
+        _writeln(out)
         
         # Get CLI help
-        import subprocess
-        result = subprocess.run([sys.executable, 'cli.py', '--help'], 
-                              capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            docs.append("## Global Help")
-            docs.append("")
-            docs.append("```bash")
-            docs.append(result.stdout)
-            docs.append("```")
-            docs.append("")
+        _writeln(out, "## Global Help")
+        _writeln(out)
+        _writeln(out, "```bash")
+        _writeln(out, _cli_help(cli, []))
+        _writeln(out, "```")
+        _writeln(out)
         
         # Get help for each command
         commands = [
@@ -174,22 +194,17 @@ def generate_cli_docs() -> str:
         
         for command in commands:
             try:
-                result = subprocess.run([sys.executable, 'cli.py', command, '--help'], 
-                                      capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    docs.append(f"## {command}")
-                    docs.append("")
-                    docs.append("```bash")
-                    docs.append(result.stdout)
-                    docs.append("```")
-                    docs.append("")
+                help_text = _cli_help(cli, [command])
+                _writeln(out, f"## {command}")
+                _writeln(out)
+                _writeln(out, "```bash")
+                _writeln(out, help_text)
+                _writeln(out, "```")
+                _writeln(out)
             except Exception as e:
                 print(f"Warning: Could not get help for {command}: {e}")
-        
-        return "\n".join(docs)
     except Exception as e:
-        return f"# CLI Reference\n\nError generating CLI documentation: {e}"
+        _writeln(out, f"Error generating CLI documentation: {e}")
 
 def main():
     """Generate documentation files."""
@@ -200,15 +215,13 @@ def main():
     docs_dir.mkdir(exist_ok=True)
     
     # Generate API documentation
-    api_docs = generate_api_docs()
     with open(docs_dir / "api_auto.md", "w", encoding="utf-8") as f:
-        f.write(api_docs)
+        generate_api_docs(f)
     print("Generated api_auto.md")
     
     # Generate CLI documentation
-    cli_docs = generate_cli_docs()
     with open(docs_dir / "cli_auto.md", "w", encoding="utf-8") as f:
-        f.write(cli_docs)
+        generate_cli_docs(f)
     print("Generated cli_auto.md")
     
     # Generate README for docs
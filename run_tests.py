@@ -3,35 +3,68 @@
 Test runner script for the GitLab/GitHub Repository Management Tool
 """
 
+import concurrent.futures
+import importlib.util
 import sys
+import shutil
 import subprocess
 import os
 
 
-def run_command(command, description):
-    """Run a command and print the result"""
+def run_streaming_command(command, description):
+    """Run a command with its output going straight to the terminal"""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
     print(f"Command: {' '.join(command)}")
-    print(f"{'='*60}")
+    print(f"{'='*60}", flush=True)
+    
+    returncode = subprocess.run(command).returncode
+    if returncode == 0:
+        print("✅ SUCCESS")
+        return True
+    print("❌ FAILED")
+    print(f"Exit code: {returncode}")
+    return False
+
+
+def run_command(command, description):
+    """Run a command and print the result"""
+    report = [
+        f"\n{'='*60}",
+        f"Running: {description}",
+        f"Command: {' '.join(command)}",
+        f"{'='*60}",
+    ]
     
     try:
         result = subprocess.run(command, capture_output=True, text=True, check=True)
-        print("✅ SUCCESS")
+        report.append("✅ SUCCESS")
         if result.stdout:
-            print("Output:")
-            print(result.stdout)
-        return True
+            report.append("Output:")
+            report.append(result.stdout)
+        success = True
     except subprocess.CalledProcessError as e:
-        print("❌ FAILED")
-        print(f"Exit code: {e.returncode}")
+        report.append("❌ FAILED")
+        report.append(f"Exit code: {e.returncode}")
         if e.stdout:
-            print("Stdout:")
-            print(e.stdout)
+            report.append("Stdout:")
+            report.append(e.stdout)
         if e.stderr:
-            print("Stderr:")
-            print(e.stderr)
-        return False
+            report.append("Stderr:")
+            report.append(e.stderr)
+        success = False
+    
+    # Printed in one piece so checks running in parallel don't interleave
+    print("\n".join(report))
+    return success
+
+
+def run_optional_tool(command, description):
+    """Run a command if its executable is installed; a missing tool counts as passing"""
+    if shutil.which(command[0]) is None:
+        print(f"⚠️  {command[0]} not available, skipping {description.lower()}")
+        return True
+    return run_command(command, description)
 
 
 def main():
@@ -46,48 +79,27 @@ def main():
     
     # Install test dependencies
     print("\n📦 Installing test dependencies...")
-    if not run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
+    if not run_streaming_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
                       "Installing requirements"):
         print("❌ Failed to install dependencies")
         sys.exit(1)
     
-    # Run linting
-    print("\n🔍 Running linting...")
-    lint_success = True
+    # Linting and type checking are independent, so run them side by side
+    print("\n🔍 Running linting and type checking...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        lint_future = executor.submit(run_optional_tool, ["flake8", "src/", "cli.py"], "Flake8 linting")
+        type_future = executor.submit(run_optional_tool, ["mypy", "src/", "cli.py"], "MyPy type checking")
+        lint_success = lint_future.result()
+        type_success = type_future.result()
     
-    # Check if flake8 is available
-    try:
-        subprocess.run(["flake8", "--version"], capture_output=True, check=True)
-        if not run_command(["flake8", "src/", "cli.py"], "Flake8 linting"):
-            lint_success = False
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("⚠️  Flake8 not available, skipping linting")
-    
-    # Run type checking
-    print("\n🔍 Running type checking...")
-    type_success = True
-    
-    # Check if mypy is available
-    try:
-        subprocess.run(["mypy", "--version"], capture_output=True, check=True)
-        if not run_command(["mypy", "src/", "cli.py"], "MyPy type checking"):
-            type_success = False
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("⚠️  MyPy not available, skipping type checking")
-    
-    # Run unit tests
-    print("\n🧪 Running unit tests...")
-    test_success = run_command([
-        sys.executable, "-m", "pytest", "tests/", 
+    # Run unit and integration tests in one session so collection happens once;
+    # with pytest-xdist installed, spread the test modules over one worker per CPU
+    print("\n🧪 Running tests...")
+    parallel = ["-n", "auto", "--dist", "loadfile"] if importlib.util.find_spec("xdist") else []
+    test_success = run_streaming_command([
+        sys.executable, "-m", "pytest", "tests/", "--run-integration", *parallel,
         "-v", "--tb=short", "--cov=src", "--cov-report=term-missing"
-    ], "Unit tests with coverage")
-    
-    # Run integration tests (if any)
-    print("\n🔗 Running integration tests...")
-    integration_success = run_command([
-        sys.executable, "-m", "pytest", "tests/", 
-        "-m", "integration", "-v"
-    ], "Integration tests")
+    ], "Unit and integration tests with coverage")
     
     # Summary
     print("\n" + "="*60)
@@ -97,8 +109,7 @@ def main():
     results = [
         ("Linting", lint_success),
         ("Type Checking", type_success),
-        ("Unit Tests", test_success),
-        ("Integration Tests", integration_success)
+        ("Tests", test_success)
     ]
     
     all_passed = True
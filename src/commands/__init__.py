@@ -0,0 +1,10 @@
+"""
+CLI subcommands, loaded on demand by the top-level ``cli`` group
+"""
+
+
+def apply_overrides(config, **overrides):
+    """Set each override on config, skipping options the user left unset (None/empty)"""
+    for name, value in overrides.items():
+        if value:
+            setattr(config, name, value)
@@ -0,0 +1,32 @@
+"""
+Composer dependency commands
+"""
+
+import logging
+import os
+
+import click
+
+from src.commands import apply_overrides
+
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.option('--directory', default=os.getcwd(), help='Directory to search for composer.json files')
+@click.option('--max-workers', type=int, help='Maximum concurrent composer updates (overrides config)')
+@click.option('--force', is_flag=True, help='Update projects even if their composer files are unchanged since the last update')
+def update_composer(directory, max_workers, force):
+    """Update Composer dependencies in all projects"""
+    from src.config import ComposerConfig
+    from src.services import ComposerService
+    
+    logger.info("🔧 Starting Composer dependency update process...")
+    
+    composer_config = ComposerConfig.from_config()
+    apply_overrides(composer_config, max_concurrent_updates=max_workers)
+    
+    # Create and run service
+    service = ComposerService(composer_config.max_concurrent_updates, force=force)
+    service.update_composer_dependencies(directory)
@@ -0,0 +1,69 @@
+"""
+Configuration file commands
+"""
+
+import functools
+import logging
+
+import click
+
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _generator():
+    """Return the ConfigGenerator shared by the configuration commands"""
+    from src.config_generator import ConfigGenerator
+    return ConfigGenerator()
+
+
+@click.command()
+@click.option('--force', is_flag=True, help='Overwrite existing config file')
+@click.option('--non-interactive', is_flag=True, help='Use default values without prompting')
+def init_config(force, non_interactive):
+    """Initialize configuration file in user's home directory"""
+    # Written directly: nothing is queued for logging yet, and the interactive
+    # prompts that may follow are printed directly as well
+    click.echo("⚙️  Initializing configuration...")
+    
+    generator = _generator()
+    try:
+        success = generator.generate_config(force=force, interactive=not non_interactive)
+        
+        if success:
+            if non_interactive:
+                logger.info("\n📋 Next steps:")
+                logger.info("1. Edit the config file with your GitLab token")
+                logger.info("2. Update group IDs as needed")
+                logger.info("3. Run 'git-repo-manager clone-groups' to start cloning")
+            else:
+                logger.info("\n✅ Configuration completed successfully!")
+                logger.info("You can now run 'git-repo-manager clone-groups' to start cloning")
+    except ValueError as e:
+        logger.error("❌ %s", e)
+        return
+
+
+@click.command()
+def config_info():
+    """Show information about the configuration file"""
+    logger.info("📁 Configuration Information")
+    logger.info("=" * 30)
+    
+    generator = _generator()
+    generator.show_config_info()
+
+
+@click.command()
+def validate_config():
+    """Validate the configuration file"""
+    logger.info("🔍 Validating configuration...")
+    
+    generator = _generator()
+    is_valid = generator.validate_config()
+    
+    if is_valid:
+        logger.info("✅ Configuration is ready to use!")
+    else:
+        logger.error("❌ Please fix the configuration issues above")
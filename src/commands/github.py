@@ -0,0 +1,70 @@
+"""
+GitHub cloning commands
+"""
+
+import logging
+
+import click
+
+from src.commands import apply_overrides
+
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.option('--github-url', help='GitHub API URL (overrides config)')
+@click.option('--token', envvar='GITHUB_ACCESS_TOKEN', help='GitHub Access Token (overrides config)')
+@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
+@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
+@click.option('--username', help='GitHub username to clone from (optional)')
+@click.option('--output-dir', help='Custom output directory for cloned repositories')
+def clone_github_user(github_url, token, repo_dir, max_workers, username, output_dir):
+    """Clone repositories from a GitHub user"""
+    from src.config import GitHubConfig, RepositoryConfig
+    from src.http_session import create_session
+    from src.services import GitHubUserService
+    
+    logger.info("🚀 Starting GitHub user repository cloning process...")
+    
+    # Initialize configurations from config file
+    github_config = GitHubConfig.from_config()
+    repo_config = RepositoryConfig.from_config()
+    
+    # Override with command line options if provided
+    apply_overrides(github_config, url=github_url, access_token=token)
+    apply_overrides(repo_config, repo_dir=repo_dir, max_concurrent_downloads=max_workers)
+    
+    # Create and run service
+    with create_session(repo_config.max_concurrent_downloads) as session:
+        service = GitHubUserService(github_config, repo_config, session)
+        service.clone_user_repositories(username, output_dir=output_dir)
+
+
+@click.command()
+@click.option('--github-url', help='GitHub API URL (overrides config)')
+@click.option('--token', envvar='GITHUB_ACCESS_TOKEN', help='GitHub Access Token (overrides config)')
+@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
+@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
+@click.option('--output-dir', help='Custom output directory for cloned repositories')
+@click.argument('organization', required=True)
+def clone_github_org(github_url, token, repo_dir, max_workers, output_dir, organization):
+    """Clone repositories from a GitHub organization"""
+    from src.config import GitHubConfig, RepositoryConfig
+    from src.http_session import create_session
+    from src.services import GitHubOrganizationService
+    
+    logger.info("🚀 Starting GitHub organization repository cloning process...")
+    
+    # Initialize configurations from config file
+    github_config = GitHubConfig.from_config()
+    repo_config = RepositoryConfig.from_config()
+    
+    # Override with command line options if provided
+    apply_overrides(github_config, url=github_url, access_token=token)
+    apply_overrides(repo_config, repo_dir=repo_dir, max_concurrent_downloads=max_workers)
+    
+    # Create and run service
+    with create_session(repo_config.max_concurrent_downloads) as session:
+        service = GitHubOrganizationService(github_config, repo_config, session)
+        service.clone_organization_repositories(organization, output_dir=output_dir)
@@ -0,0 +1,119 @@
+"""
+GitLab cloning commands
+"""
+
+import logging
+
+import click
+
+from src.commands import apply_overrides
+
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.option('--gitlab-url', help='GitLab instance URL (overrides config)')
+@click.option('--token', envvar='GITLAB_PRIVATE_TOKEN', help='GitLab Personal Access Token (overrides config)')
+@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
+@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
+@click.option('--output-dir', help='Custom output directory for cloned repositories')
+def clone_user(gitlab_url, token, repo_dir, max_workers, output_dir):
+    """Clone all repositories owned by the authenticated user"""
+    from src.config import GitLabConfig, RepositoryConfig
+    from src.http_session import create_session
+    from src.services import UserRepositoryService
+    
+    logger.info("🚀 Starting user repository cloning process...")
+    
+    # Initialize configurations from config file
+    gitlab_config = GitLabConfig.from_config()
+    repo_config = RepositoryConfig.from_config()
+    
+    # Override with command line options if provided
+    apply_overrides(gitlab_config, url=gitlab_url, private_token=token)
+    apply_overrides(repo_config, repo_dir=repo_dir, max_concurrent_downloads=max_workers)
+    
+    # Create and run service
+    with create_session(repo_config.max_concurrent_downloads) as session:
+        service = UserRepositoryService(gitlab_config, repo_config, session)
+        service.clone_user_repositories(output_dir=output_dir)
+
+
+@click.command()
+@click.option('--gitlab-url', help='GitLab instance URL (overrides config)')
+@click.option('--token', envvar='GITLAB_PRIVATE_TOKEN', help='GitLab Personal Access Token (overrides config)')
+@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
+@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
+@click.option('--group-ids', multiple=True, type=int, help='GitLab group IDs to clone from (overrides config)')
+@click.option('--output-dir', help='Custom output directory for cloned repositories')
+def clone_groups(gitlab_url, token, repo_dir, max_workers, group_ids, output_dir):
+    """Clone all repositories from specified GitLab groups"""
+    from src.config import GitLabConfig, RepositoryConfig, GroupConfig
+    from src.http_session import create_session
+    from src.services import GroupRepositoryService
+    
+    logger.info("🚀 Starting group repository cloning process...")
+    
+    # Initialize configurations from config file
+    gitlab_config = GitLabConfig.from_config()
+    repo_config = RepositoryConfig.from_config()
+    group_config = GroupConfig.from_config()
+    
+    # Override with command line options if provided
+    apply_overrides(gitlab_config, url=gitlab_url, private_token=token)
+    apply_overrides(repo_config, repo_dir=repo_dir, max_concurrent_downloads=max_workers)
+    apply_overrides(group_config, target_group_ids=list(group_ids))
+    
+    # Create and run service
+    with create_session(repo_config.max_concurrent_downloads) as session:
+        service = GroupRepositoryService(gitlab_config, repo_config, group_config, session)
+        service.clone_group_repositories(output_dir=output_dir)
+
+
+@click.command()
+@click.option('--gitlab-url', help='GitLab instance URL (overrides config)')
+@click.option('--token', envvar='GITLAB_PRIVATE_TOKEN', help='GitLab Personal Access Token (overrides config)')
+@click.option('--repo-dir', help='Directory to save repositories (overrides config)')
+@click.option('--max-workers', type=int, help='Maximum concurrent downloads (overrides config)')
+@click.option('--group-ids', multiple=True, type=int, help='GitLab group IDs to clone from (overrides config)')
+@click.option('--update-composer', is_flag=True, help='Update Composer dependencies after cloning')
+@click.option('--output-dir', help='Custom output directory for cloned repositories')
+def clone_all(gitlab_url, token, repo_dir, max_workers, group_ids, update_composer, output_dir):
+    """Clone all repositories and optionally update Composer dependencies"""
+    from src.config import GitLabConfig, RepositoryConfig, GroupConfig, ComposerConfig
+    from src.http_session import create_session
+    from src.services import UserRepositoryService, GroupRepositoryService, ComposerService
+    
+    logger.info("🚀 Starting complete repository management process...")
+    
+    # Initialize configurations from config file
+    gitlab_config = GitLabConfig.from_config()
+    repo_config = RepositoryConfig.from_config()
+    group_config = GroupConfig.from_config()
+    composer_config = ComposerConfig.from_config()
+    
+    # Override with command line options if provided
+    apply_overrides(gitlab_config, url=gitlab_url, private_token=token)
+    apply_overrides(repo_config, repo_dir=repo_dir, max_concurrent_downloads=max_workers)
+    apply_overrides(group_config, target_group_ids=list(group_ids))
+    
+    # Both services list projects from the same GitLab host, so share connections
+    with create_session(repo_config.max_concurrent_downloads) as session:
+        # Clone user repositories
+        logger.info("\n📦 Cloning user repositories...")
+        user_service = UserRepositoryService(gitlab_config, repo_config, session)
+        user_service.clone_user_repositories(output_dir=output_dir)
+        
+        # Clone group repositories
+        logger.info("\n📦 Cloning group repositories...")
+        group_service = GroupRepositoryService(gitlab_config, repo_config, group_config, session)
+        group_service.clone_group_repositories(output_dir=output_dir)
+    
+    # Update Composer dependencies if requested or auto-update is enabled
+    if update_composer or composer_config.auto_update:
+        logger.info("\n🔧 Updating Composer dependencies...")
+        composer_service = ComposerService(composer_config.max_concurrent_updates)
+        composer_service.update_composer_dependencies(repo_config.repo_dir)
+    
+    logger.info("\n✅ Complete repository management process finished!")
@@ -1,73 +1,221 @@
+import concurrent.futures
+import functools
+import hashlib
+import json
+import logging
 import os
+import shutil
 import subprocess
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .config import user_cache_dir
+
+
+logger = logging.getLogger(__name__)
+
+# Composer already parallelises its own downloads, so keep the pool small
+DEFAULT_MAX_CONCURRENT_UPDATES = 4
+
+# Directories that never contain projects of their own and can be huge
+SKIP_DIRS = frozenset({'.git', 'node_modules', 'vendor', '.venv', '__pycache__'})
+
+
+def _iter_composer_dirs(root_dir: str) -> Iterator[str]:
+    """Yield every directory below root_dir (inclusive) that contains a composer.json"""
+    stack = [root_dir]
+    while stack:
+        dirpath = stack.pop()
+        subdirs = []
+        has_composer_json = False
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name == 'composer.json':
+                        has_composer_json = True
+        except OSError:
+            continue
+        
+        if has_composer_json:
+            yield dirpath
+        # Reverse so directories are visited in scandir order
+        stack.extend(reversed(subdirs))
+
+
+def _default_state_file() -> str:
+    """Location of the record of each project's composer files at its last successful update"""
+    return str(user_cache_dir() / 'composer_state.json')
+
+
+def _project_digest(dirpath: str) -> str:
+    """Hash composer.json and composer.lock (if present) of a project"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in ('composer.json', 'composer.lock'):
+        try:
+            with open(os.path.join(dirpath, name), 'rb') as file:
+                digest.update(file.read())
+        except FileNotFoundError:
+            pass
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_composer_command() -> str:
+    """Return the absolute path of the composer executable, resolved once per process"""
+    for cmd in ('composer', 'composer.bat', 'composer.cmd'):
+        path = shutil.which(cmd)
+        if path:
+            return path
+    
+    raise FileNotFoundError("Composer command not found. Make sure Composer is installed and in your PATH.")
 
 
 class ComposerManager:
     """Manages Composer operations"""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = DEFAULT_MAX_CONCURRENT_UPDATES, force: bool = False,
+                 state_file: Optional[str] = None):
         self.composer_cmd = self._find_composer_command()
+        self.max_workers = max(1, max_workers)
+        self.force = force
+        self.state_file = state_file or _default_state_file()
+    
+    def _load_state(self) -> Dict[str, str]:
+        """Load the recorded project digests, treating a missing or corrupt file as empty"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+    
+    def _save_state(self, state: Dict[str, str]) -> None:
+        """Atomically write the recorded project digests"""
+        try:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            tmp_path = f"{self.state_file}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(state, file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            logger.warning("Warning: Could not save composer update state to %s: %s", self.state_file, e)
+    
+    def _is_up_to_date(self, dirpath: str, state: Dict[str, str]) -> bool:
+        """Whether a project's composer files are unchanged since its last successful update"""
+        if self.force or not os.path.isdir(os.path.join(dirpath, 'vendor')):
+            return False
+        return state.get(os.path.abspath(dirpath)) == _project_digest(dirpath)
     
     def _find_composer_command(self) -> str:
         """Find the appropriate composer command for the system"""
-        commands = ['composer', 'composer.bat', 'composer.cmd']
+        return _resolve_composer_command()
+    
+    def _update_project(self, dirpath: str, stream: bool = False) -> Tuple[str, bool]:
+        """
+        Run 'composer update' in a single project and return its report
+        together with whether the update succeeded
+
+        Args:
+            dirpath (str): Directory containing composer.json.
+            stream (bool): Log Composer's output line by line as it runs instead of
+                buffering it into the report.
+        """
+        composer_path = os.path.join(dirpath, 'composer.json')
+        lines = [
+            f"\nFound composer.json at: {composer_path}",
+            f"Running 'composer update' in: {dirpath}",
+        ]
+        if stream:
+            logger.info("\n".join(lines))
+            lines = []
+        success = False
         
-        for cmd in commands:
-            try:
-                subprocess.run([cmd, '--version'], capture_output=True, check=True)
-                return cmd
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
+        try:
+            if stream:
+                # Relayed line by line through logging, so it stays in order with the other progress output
+                with subprocess.Popen([self.composer_cmd, 'update'], cwd=dirpath, stdout=subprocess.PIPE,
+                                      stderr=subprocess.STDOUT, text=True) as proc:
+                    for line in proc.stdout:
+                        logger.info(line.rstrip('\n'))
+                if proc.returncode:
+                    raise subprocess.CalledProcessError(proc.returncode, proc.args)
+            else:
+                result = subprocess.run([self.composer_cmd, 'update'], cwd=dirpath, capture_output=True, text=True, check=True)
+                
+                lines.append("Composer update output:")
+                lines.append(result.stdout)
+                if result.stderr:
+                    lines.append("Composer update errors (if any):")
+                    lines.append(result.stderr)
+            lines.append("Composer update completed successfully.")
+            success = True
+            
+        except FileNotFoundError:
+            lines.append("Error: 'composer' command not found. Make sure Composer is installed and in your PATH.")
+            lines.append("On Windows, try running: composer --version in your terminal to verify installation.")
+            lines.append("If composer is installed but not in PATH, you may need to add it to your system PATH.")
+        except subprocess.CalledProcessError as e:
+            lines.append(f"Error running 'composer update' in {dirpath}:")
+            if e.stdout:
+                lines.append(e.stdout)
+            if e.stderr:
+                lines.append(e.stderr)
+        except Exception as e:
+            lines.append(f"An unexpected error occurred in {dirpath}: {e}")
         
-        raise FileNotFoundError("Composer command not found. Make sure Composer is installed and in your PATH.")
+        return "\n".join(lines), success
+    
+    def _report(self, project_dirs: List[str], results: Iterable[Tuple[str, bool]], state: Dict[str, str]) -> None:
+        """Log each project's report and record the files of successful updates"""
+        for dirpath, (report, success) in zip(project_dirs, results):
+            logger.log(logging.INFO if success else logging.ERROR, report)
+            if success:
+                # Hashed after the update, since composer update rewrites composer.lock
+                state[os.path.abspath(dirpath)] = _project_digest(dirpath)
     
     def find_and_update_composer(self, root_dir: str) -> None:
         """
         Traverses a root directory and its subdirectories to find composer.json files.
-        If found, it runs 'composer update' in that directory.
+        If found, it runs 'composer update' in that directory, updating up to
+        max_workers projects concurrently. With a single worker Composer's output
+        is streamed live rather than buffered.
+        VCS, dependency and cache directories (see SKIP_DIRS) are not searched.
+        Projects whose composer.json and composer.lock are unchanged since their
+        last successful update are skipped unless force is set.
 
         Args:
             root_dir (str): The starting directory to search from.
         """
-        print(f"Starting search for composer.json in: {root_dir}")
+        logger.info("Starting search for composer.json in: %s", root_dir)
         
         if not os.path.isdir(root_dir):
-            print(f"Error: The specified search directory does not exist: {root_dir}")
+            logger.error("Error: The specified search directory does not exist: %s", root_dir)
             return
         
-        for dirpath, dirnames, filenames in os.walk(root_dir):
-            if 'composer.json' in filenames:
-                composer_path = os.path.join(dirpath, 'composer.json')
-                print(f"\nFound composer.json at: {composer_path}")
-                print(f"Changing directory to: {dirpath}")
-                
-                original_dir = os.getcwd()  # Store original directory
-                try:
-                    os.chdir(dirpath)
-                    print("Running 'composer update'...")
-                    
-                    result = subprocess.run([self.composer_cmd, 'update'], capture_output=True, text=True, check=True)
-                    
-                    print("Composer update output:")
-                    print(result.stdout)
-                    if result.stderr:
-                        print("Composer update errors (if any):")
-                        print(result.stderr)
-                    print("Composer update completed successfully.")
-                    
-                except FileNotFoundError:
-                    print("Error: 'composer' command not found. Make sure Composer is installed and in your PATH.")
-                    print("On Windows, try running: composer --version in your terminal to verify installation.")
-                    print("If composer is installed but not in PATH, you may need to add it to your system PATH.")
-                except subprocess.CalledProcessError as e:
-                    print(f"Error running 'composer update' in {dirpath}:")
-                    print(e.stdout)
-                    print(e.stderr)
-                except Exception as e:
-                    print(f"An unexpected error occurred in {dirpath}: {e}")
-                finally:
-                    os.chdir(original_dir)  # Always change back to the original directory
-                    print(f"Returned to original directory: {os.getcwd()}")
+        state = self._load_state()
+        project_dirs: List[str] = []
+        for dirpath in _iter_composer_dirs(root_dir):
+            if self._is_up_to_date(dirpath, state):
+                logger.info("Skipping %s: composer.json and composer.lock unchanged since last update", dirpath)
+            else:
+                project_dirs.append(dirpath)
+        
+        if project_dirs:
+            logger.info("Found %d composer.json file(s) to update. Updating with %d workers...", len(project_dirs), self.max_workers)
+        
+        if self.max_workers == 1:
+            # Sequential updates can show Composer's progress as it happens
+            results = (self._update_project(dirpath, stream=True) for dirpath in project_dirs)
+            self._report(project_dirs, results, state)
+        else:
+            # Each report is logged in one piece so concurrent updates don't interleave
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                self._report(project_dirs, executor.map(self._update_project, project_dirs), state)
+        
+        if project_dirs:
+            self._save_state(state)
         
-        print("\nSearch and update process completed.") 
\ No newline at end of file
+        logger.info("\nSearch and update process completed.") 
\ No newline at end of file
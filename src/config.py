@@ -1,10 +1,104 @@
+import copy
+import functools
+import hashlib
+import logging
 import os
-import yaml
+import pickle
+import struct
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 from pathlib import Path
 
 
+# (mtime_ns, size) of the source file, stored ahead of the pickled config
+_CACHE_HEADER = struct.Struct('<QQ')
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def user_home() -> Path:
+    """The user's home directory, resolved once per process"""
+    return Path.home()
+
+
+def default_max_workers() -> int:
+    """Default worker count: three quarters of the CPUs, but at least 4"""
+    return max(4, (os.cpu_count() or 4) * 3 // 4)
+
+
+def user_cache_dir() -> Path:
+    """Per-user cache directory ($XDG_CACHE_HOME/git-repo-manager, ~/.cache by default)"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(cache_home) / 'git-repo-manager'
+
+
+def _config_cache_path(path: str) -> Path:
+    """Location of the on-disk parse cache for a config file"""
+    key = hashlib.blake2b(os.path.abspath(path).encode('utf-8'), digest_size=8).hexdigest()
+    return user_cache_dir() / f"config-{key}.pickle"
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file once per (path, mtime, size); callers must not mutate the result
+    
+    The parsed data is also pickled to the user cache directory, so later runs
+    with an unchanged file skip YAML parsing entirely.
+    """
+    cache_path = _config_cache_path(path)
+    try:
+        blob = cache_path.read_bytes()
+        if _CACHE_HEADER.unpack_from(blob) == (mtime_ns, size):
+            return pickle.loads(blob[_CACHE_HEADER.size:])
+    except Exception:
+        pass  # Missing, stale or corrupt cache: fall back to parsing
+    
+    # yaml is only imported on a cache miss; warm runs never load it
+    import yaml
+    
+    # libyaml's C parser when PyYAML was built with it, otherwise the pure-Python one.
+    # Given bytes, the loader detects the encoding (UTF-8/16 per the YAML spec)
+    # itself, skipping a text-decoding layer in between
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'rb') as file:
+        config = yaml.load(file, Loader=loader)
+    
+    try:
+        # The config holds API tokens, so the cache is readable by the user only
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        blob = _CACHE_HEADER.pack(mtime_ns, size) + pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as file:
+            file.write(blob)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # The cache is only an optimisation
+    
+    return config
+
+
+def load_yaml_file(path: str) -> Any:
+    """Parse a YAML file through the shared parse cache, returning a copy the caller may modify"""
+    stat = os.stat(path)
+    return copy.deepcopy(_parse_yaml_file(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+# (config section, key, environment variable, type) for env vars that override the YAML
+_ENV_OVERRIDES = (
+    ('gitlab', 'url', 'GITLAB_URL', str),
+    ('gitlab', 'private_token', 'GITLAB_PRIVATE_TOKEN', str),
+    ('github', 'url', 'GITHUB_URL', str),
+    ('github', 'access_token', 'GITHUB_ACCESS_TOKEN', str),
+    ('repository', 'repo_dir', 'REPO_DIR', str),
+    ('repository', 'max_concurrent_downloads', 'MAX_CONCURRENT_DOWNLOADS', int),
+    ('repository', 'clone_filter', 'CLONE_FILTER', str),
+)
+
+_ENV_OVERRIDE_VARS = frozenset(env_var for _, _, env_var, _ in _ENV_OVERRIDES)
+
+
 class ConfigManager:
     """Manages configuration loading from YAML file and environment variables"""
     
@@ -12,7 +106,7 @@ class ConfigManager:
         if config_file == "config.yml":
             # Look for config in current directory first, then user home
             current_config = Path("config.yml")
-            user_config = Path.home() / ".git-repo-manager" / "config.yml"
+            user_config = user_home() / ".git-repo-manager" / "config.yml"
             
             if current_config.exists():
                 self.config_file = str(current_config)
@@ -31,48 +125,48 @@ class ConfigManager:
             self._config_data = self._load_yaml_config()
         return self._config_data
     
+    def flush_cache(self) -> None:
+        """Forget the loaded configuration so the next load_config re-reads the file and environment"""
+        self._config_data = None
+    
+    def section(self, name: str) -> Dict[str, Any]:
+        """Return one top-level section of the configuration (empty if absent)"""
+        return self.load_config().get(name) or {}
+    
     def _load_yaml_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         config_path = Path(self.config_file)
         
-        if not config_path.exists():
-            print(f"Warning: Config file '{self.config_file}' not found. Using default values.")
+        # One stat both checks existence and keys the shared parse cache
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            logger.warning("Warning: Config file '%s' not found. Using default values.", self.config_file)
             return self._get_default_config()
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                return self._merge_with_env(config)
-        except yaml.YAMLError as e:
-            print(f"Error parsing config file '{self.config_file}': {e}")
-            return self._get_default_config()
+            # Shared across instances; edits change mtime/size and force a re-parse
+            config = copy.deepcopy(_parse_yaml_file(str(config_path), stat.st_mtime_ns, stat.st_size))
+            return self._merge_with_env(config)
         except Exception as e:
-            print(f"Error loading config file '{self.config_file}': {e}")
+            import yaml
+            if isinstance(e, yaml.YAMLError):
+                logger.error("Error parsing config file '%s': %s", self.config_file, e)
+            else:
+                logger.error("Error loading config file '%s': %s", self.config_file, e)
             return self._get_default_config()
     
     def _merge_with_env(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Merge YAML config with environment variables (env vars take precedence)"""
-        # GitLab configuration
-        if 'gitlab' in config:
-            if os.getenv('GITLAB_URL'):
-                config['gitlab']['url'] = os.getenv('GITLAB_URL')
-            if os.getenv('GITLAB_PRIVATE_TOKEN'):
-                config['gitlab']['private_token'] = os.getenv('GITLAB_PRIVATE_TOKEN')
-        
-        # GitHub configuration
-        if 'github' in config:
-            if os.getenv('GITHUB_URL'):
-                config['github']['url'] = os.getenv('GITHUB_URL')
-            if os.getenv('GITHUB_ACCESS_TOKEN'):
-                config['github']['access_token'] = os.getenv('GITHUB_ACCESS_TOKEN')
+        environ = os.environ
+        # Usual case: none of the override variables are set at all
+        if _ENV_OVERRIDE_VARS.isdisjoint(environ):
+            return config
         
-        # Repository configuration
-        if 'repository' in config:
-            if os.getenv('REPO_DIR'):
-                config['repository']['repo_dir'] = os.getenv('REPO_DIR')
-            max_downloads = os.getenv('MAX_CONCURRENT_DOWNLOADS')
-            if max_downloads:
-                config['repository']['max_concurrent_downloads'] = int(max_downloads)
+        for section, key, env_var, coerce in _ENV_OVERRIDES:
+            value = environ.get(env_var)
+            if value and section in config:
+                config[section][key] = coerce(value)
         
         return config
     
@@ -89,14 +183,15 @@ class ConfigManager:
             },
             'repository': {
                 'repo_dir': os.getcwd(),
-                'max_concurrent_downloads': 5
+                'max_concurrent_downloads': default_max_workers()
             },
             'groups': {
                 'target_group_ids': []
             },
             'composer': {
                 'enabled': True,
-                'auto_update': False
+                'auto_update': False,
+                'max_concurrent_updates': 4
             }
         }
 
@@ -105,7 +200,7 @@ class ConfigManager:
 config_manager = ConfigManager()
 
 
-@dataclass
+@dataclass(slots=True)
 class GitLabConfig:
     """Configuration for GitLab API access"""
     url: str
@@ -114,8 +209,7 @@ class GitLabConfig:
     @classmethod
     def from_config(cls) -> 'GitLabConfig':
         """Create config from YAML configuration"""
-        config = config_manager.load_config()
-        gitlab_config = config.get('gitlab', {})
+        gitlab_config = config_manager.section('gitlab')
         return cls(
             url=gitlab_config.get('url', 'https://gitlab.com'),
             private_token=gitlab_config.get('private_token', '')
@@ -130,32 +224,39 @@ class GitLabConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryConfig:
     """Configuration for repository operations"""
     repo_dir: str
     max_concurrent_downloads: int
+    clone_filter: Optional[str] = None
+    executor: str = "thread"
+    shallow: bool = False
     
     @classmethod
     def from_config(cls) -> 'RepositoryConfig':
         """Create config from YAML configuration"""
-        config = config_manager.load_config()
-        repo_config = config.get('repository', {})
+        repo_config = config_manager.section('repository')
         return cls(
-            repo_dir=repo_config.get('repo_dir', os.getcwd()),
-            max_concurrent_downloads=repo_config.get('max_concurrent_downloads', 5)
+            # Resolve the working directory only when the config leaves repo_dir unset
+            repo_dir=repo_config.get('repo_dir') or os.getcwd(),
+            max_concurrent_downloads=repo_config.get('max_concurrent_downloads') or default_max_workers(),
+            clone_filter=repo_config.get('clone_filter'),
+            executor=repo_config.get('executor', 'thread'),
+            shallow=bool(repo_config.get('shallow', False))
         )
     
     @classmethod
     def from_env(cls) -> 'RepositoryConfig':
         """Create config from environment variables (legacy support)"""
         return cls(
-            repo_dir=os.getenv('REPO_DIR', os.getcwd()),
-            max_concurrent_downloads=int(os.getenv('MAX_CONCURRENT_DOWNLOADS', '5'))
+            repo_dir=os.getenv('REPO_DIR') or os.getcwd(),
+            max_concurrent_downloads=int(os.getenv('MAX_CONCURRENT_DOWNLOADS') or default_max_workers()),
+            clone_filter=os.getenv('CLONE_FILTER') or None
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupConfig:
     """Configuration for group operations"""
     target_group_ids: List[int]
@@ -163,8 +264,7 @@ class GroupConfig:
     @classmethod
     def from_config(cls) -> 'GroupConfig':
         """Create config from YAML configuration"""
-        config = config_manager.load_config()
-        groups_config = config.get('groups', {})
+        groups_config = config_manager.section('groups')
         return cls(
             target_group_ids=groups_config.get('target_group_ids', [])
         )
@@ -175,24 +275,25 @@ class GroupConfig:
         return cls(target_group_ids=[])
 
 
-@dataclass
+@dataclass(slots=True)
 class ComposerConfig:
     """Configuration for Composer operations"""
     enabled: bool
     auto_update: bool
+    max_concurrent_updates: int = 4
     
     @classmethod
     def from_config(cls) -> 'ComposerConfig':
         """Create config from YAML configuration"""
-        config = config_manager.load_config()
-        composer_config = config.get('composer', {})
+        composer_config = config_manager.section('composer')
         return cls(
             enabled=composer_config.get('enabled', True),
-            auto_update=composer_config.get('auto_update', False)
+            auto_update=composer_config.get('auto_update', False),
+            max_concurrent_updates=composer_config.get('max_concurrent_updates', 4)
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubConfig:
     """Configuration for GitHub API access"""
     access_token: str
@@ -201,8 +302,7 @@ class GitHubConfig:
     @classmethod
     def from_config(cls) -> 'GitHubConfig':
         """Create config from YAML configuration"""
-        config = config_manager.load_config()
-        github_config = config.get('github', {})
+        github_config = config_manager.section('github')
         return cls(
             access_token=github_config.get('access_token', ''),
             url=github_config.get('url', 'https://api.github.com')
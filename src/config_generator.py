@@ -1,14 +1,45 @@
+import logging
 import os
-import yaml
+import re
 from pathlib import Path
 from typing import Dict, Any
 
+from .config import default_max_workers, load_yaml_file, user_home
+
+
+# GitLab groups offered when none are configured
+_DEFAULT_GROUP_IDS = (
+    2969050,   # circlecreative
+    60830364,  # circle-creative-flutter
+    12276251,  # church-id
+    7629247,   # kreditimpian-id
+    6443630,   # itsynergy
+    4939058,   # pluses-media
+    2987114,   # o2system
+    2968903,   # baliparamartha
+    108468311, # x-api
+    110485899, # neo
+    60815546,  # sendx
+    60815062,  # motoriz
+    60789937,  # cicilsewa
+    60789934,  # tokobot
+    14193703,  # xignature
+    13844839,  # simplex
+    13844814,  # Lawtify
+)
+
+# Accepted answers to the interactive yes/no prompts
+_YES_ANSWERS = frozenset({'y', 'yes'})
+_NO_ANSWERS = frozenset({'n', 'no'})
+
+logger = logging.getLogger(__name__)
+
 
 class ConfigGenerator:
     """Generates configuration files for the GitLab Repository Manager"""
     
     def __init__(self):
-        self.home_dir = Path.home()
+        self.home_dir = user_home()
         self.config_path = self.home_dir / ".git-repo-manager" / "config.yml"
     
     def generate_config(self, force: bool = False, interactive: bool = True) -> bool:
@@ -28,8 +59,8 @@ class ConfigGenerator:
         
         # Check if config already exists
         if self.config_path.exists() and not force:
-            print(f"⚠️  Config file already exists: {self.config_path}")
-            print("Use --force to overwrite existing config")
+            logger.warning("⚠️  Config file already exists: %s", self.config_path)
+            logger.warning("Use --force to overwrite existing config")
             return False
         
         # Generate config data
@@ -38,18 +69,30 @@ class ConfigGenerator:
         else:
             config_data = self._get_default_config()
         
-        # Write config file
+        # Write to a temporary file and rename it into place, so an interrupted
+        # write never leaves a truncated config behind
+        tmp_path = self.config_path.with_suffix('.yml.tmp')
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2, sort_keys=False)
+            import yaml
             
-            print(f"✅ Config file generated: {self.config_path}")
+            # libyaml's C emitter when PyYAML was built with it, otherwise the pure-Python one
+            dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            # The config holds API tokens: create it readable by the user only,
+            # also when it replaces an existing file
+            tmp_path.unlink(missing_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                yaml.dump(config_data, f, Dumper=dumper, default_flow_style=False, indent=2, sort_keys=False)
+            os.replace(tmp_path, self.config_path)
+            
+            logger.info("✅ Config file generated: %s", self.config_path)
             if not interactive:
-                print("📝 Please edit the config file with your GitLab token and group IDs")
+                logger.info("📝 Please edit the config file with your GitLab token and group IDs")
             return True
             
         except Exception as e:
-            print(f"❌ Error generating config file: {e}")
+            tmp_path.unlink(missing_ok=True)
+            logger.error("❌ Error generating config file: %s", e)
             return False
     
     def _interactive_config(self) -> Dict[str, Any]:
@@ -120,7 +163,7 @@ class ConfigGenerator:
         if not repo_dir:
             repo_dir = default_repo_dir
         
-        default_workers = "5"
+        default_workers = str(default_max_workers())
         max_workers = input(f"Maximum concurrent downloads [{default_workers}]: ").strip()
         if not max_workers:
             max_workers = default_workers
@@ -128,7 +171,7 @@ class ConfigGenerator:
         try:
             max_workers = int(max_workers)
         except ValueError:
-            max_workers = 5
+            max_workers = default_max_workers()
         
         config['repository'] = {
             'repo_dir': repo_dir,
@@ -138,46 +181,22 @@ class ConfigGenerator:
         # Group Configuration
         print("\n👥 Group Configuration")
         print("-" * 25)
-        print("Enter GitLab group IDs to clone repositories from.")
+        print("Enter GitLab group IDs to clone repositories from, separated by commas or spaces.")
         print("You can find group IDs in the GitLab web interface.")
         print("Press Enter without a value to use default groups.")
         print()
         
-        group_ids = []
-        while True:
-            group_input = input("Enter group ID (or press Enter to finish): ").strip()
-            if not group_input:
-                break
-            
-            try:
-                group_id = int(group_input)
-                group_ids.append(group_id)
-                print(f"✅ Added group ID: {group_id}")
-            except ValueError:
-                print("❌ Invalid group ID. Please enter a number.")
+        group_input = input("Enter group IDs (blank for defaults): ").strip()
+        group_ids = [int(group_id) for group_id in re.findall(r'\d+', group_input)]
+        if re.search(r'[^\d,\s]', group_input):
+            print("⚠️  Ignored input that is not a group ID number.")
+        if group_ids:
+            print(f"✅ Added {len(group_ids)} group IDs: {', '.join(map(str, group_ids))}")
         
         # Use default groups if none provided
         if not group_ids:
             print("📋 Using default group IDs...")
-            group_ids = [
-                2969050,   # circlecreative
-                60830364,  # circle-creative-flutter
-                12276251,  # church-id
-                7629247,   # kreditimpian-id
-                6443630,   # itsynergy
-                4939058,   # pluses-media
-                2987114,   # o2system
-                2968903,   # baliparamartha
-                108468311, # x-api
-                110485899, # neo
-                60815546,  # sendx
-                60815062,  # motoriz
-                60789937,  # cicilsewa
-                60789934,  # tokobot
-                14193703,  # xignature
-                13844839,  # simplex
-                13844814,  # Lawtify
-            ]
+            group_ids = list(_DEFAULT_GROUP_IDS)
         
         config['groups'] = {
             'target_group_ids': group_ids
@@ -188,12 +207,12 @@ class ConfigGenerator:
         print("-" * 25)
         
         composer_enabled = input("Enable Composer dependency updates? (y/N): ").strip().lower()
-        composer_enabled = composer_enabled in ['y', 'yes']
+        composer_enabled = composer_enabled in _YES_ANSWERS
         
         auto_update = False
         if composer_enabled:
             auto_update = input("Automatically update Composer dependencies after cloning? (y/N): ").strip().lower()
-            auto_update = auto_update in ['y', 'yes']
+            auto_update = auto_update in _YES_ANSWERS
         
         config['composer'] = {
             'enabled': composer_enabled,
@@ -214,7 +233,7 @@ class ConfigGenerator:
         print()
         
         confirm = input("Save this configuration? (Y/n): ").strip().lower()
-        if confirm in ['n', 'no']:
+        if confirm in _NO_ANSWERS:
             print("❌ Configuration cancelled.")
             raise ValueError("Configuration cancelled by user")
         
@@ -229,32 +248,15 @@ class ConfigGenerator:
             },
             'repository': {
                 'repo_dir': str(self.home_dir / 'gitlab-repos'),
-                'max_concurrent_downloads': 5
+                'max_concurrent_downloads': default_max_workers()
             },
             'groups': {
-                'target_group_ids': [
-                    2969050,   # circlecreative
-                    60830364,  # circle-creative-flutter
-                    12276251,  # church-id
-                    7629247,   # kreditimpian-id
-                    6443630,   # itsynergy
-                    4939058,   # pluses-media
-                    2987114,   # o2system
-                    2968903,   # baliparamartha
-                    108468311, # x-api
-                    110485899, # neo
-                    60815546,  # sendx
-                    60815062,  # motoriz
-                    60789937,  # cicilsewa
-                    60789934,  # tokobot
-                    14193703,  # xignature
-                    13844839,  # simplex
-                    13844814,  # Lawtify
-                ]
+                'target_group_ids': list(_DEFAULT_GROUP_IDS)
             },
             'composer': {
                 'enabled': True,
-                'auto_update': False
+                'auto_update': False,
+                'max_concurrent_updates': 4
             }
         }
     
@@ -269,57 +271,58 @@ class ConfigGenerator:
     def show_config_info(self):
         """Show information about the config file"""
         if self.config_exists():
-            print(f"📁 Config file location: {self.config_path}")
-            print(f"📄 Config file exists: Yes")
+            logger.info("📁 Config file location: %s", self.config_path)
+            logger.info("📄 Config file exists: Yes")
             
             # Show config file size
             size = self.config_path.stat().st_size
-            print(f"📊 Config file size: {size} bytes")
+            logger.info("📊 Config file size: %d bytes", size)
             
             # Show last modified
             mtime = self.config_path.stat().st_mtime
             from datetime import datetime
             mtime_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-            print(f"🕒 Last modified: {mtime_str}")
+            logger.info("🕒 Last modified: %s", mtime_str)
         else:
-            print(f"📁 Config file location: {self.config_path}")
-            print(f"📄 Config file exists: No")
-            print("💡 Run 'git-repo-manager init-config' to create config file")
+            logger.info("📁 Config file location: %s", self.config_path)
+            logger.info("📄 Config file exists: No")
+            logger.info("💡 Run 'git-repo-manager init-config' to create config file")
     
     def validate_config(self) -> bool:
         """Validate the existing config file"""
         if not self.config_exists():
-            print("❌ Config file does not exist")
+            logger.error("❌ Config file does not exist")
             return False
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            # Shares the parse cache with ConfigManager, so validating then loading parses once
+            config = load_yaml_file(str(self.config_path))
             
             # Check required sections
             required_sections = ['gitlab', 'repository', 'groups', 'composer']
             for section in required_sections:
                 if section not in config:
-                    print(f"❌ Missing required section: {section}")
+                    logger.error("❌ Missing required section: %s", section)
                     return False
             
             # Check GitLab token
             if not config['gitlab'].get('private_token') or config['gitlab']['private_token'] == 'your-gitlab-token-here':
-                print("⚠️  GitLab token not configured")
-                print("   Please update the 'private_token' in the gitlab section")
+                logger.warning("⚠️  GitLab token not configured")
+                logger.warning("   Please update the 'private_token' in the gitlab section")
             
             # Check group IDs
             group_ids = config['groups'].get('target_group_ids', [])
             if not group_ids:
-                print("⚠️  No group IDs configured")
-                print("   Please add group IDs to the 'target_group_ids' list")
+                logger.warning("⚠️  No group IDs configured")
+                logger.warning("   Please add group IDs to the 'target_group_ids' list")
             
-            print("✅ Config file is valid")
+            logger.info("✅ Config file is valid")
             return True
             
-        except yaml.YAMLError as e:
-            print(f"❌ Invalid YAML in config file: {e}")
-            return False
         except Exception as e:
-            print(f"❌ Error reading config file: {e}")
+            import yaml
+            if isinstance(e, yaml.YAMLError):
+                logger.error("❌ Invalid YAML in config file: %s", e)
+            else:
+                logger.error("❌ Error reading config file: %s", e)
             return False 
\ No newline at end of file
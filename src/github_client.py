@@ -1,14 +1,47 @@
+import concurrent.futures
+import logging
 import requests
-import sys
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 from .config import GitHubConfig
+from .http_session import DEFAULT_PAGE_WORKERS, create_session, decode_json, fetch_json_page, get_with_rate_limit
+
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubAPIError(RuntimeError):
+    """A GitHub API request failed"""
+
+
+class GitHubAuthError(GitHubAPIError):
+    """GitHub rejected the configured access token"""
+
+
+def _last_page_number(links: Dict[str, Dict[str, str]]) -> Optional[int]:
+    """Extract the page number of the 'last' Link header entry, if GitHub sent one"""
+    last_url = links.get('last', {}).get('url')
+    if not last_url:
+        return None
+    try:
+        return int(parse_qs(urlparse(last_url).query)['page'][0])
+    except (KeyError, IndexError, ValueError):
+        return None
 
 
 class GitHubClient:
     """Client for interacting with GitHub API"""
     
-    def __init__(self, config: GitHubConfig):
+    # Largest page size the GitHub API accepts; fewer pages means fewer round-trips
+    PER_PAGE = 100
+    
+    def __init__(self, config: GitHubConfig, session: Optional[requests.Session] = None,
+                 max_workers: int = DEFAULT_PAGE_WORKERS):
         self.config = config
+        # Upper bound on pages fetched at once when the page count is known up front
+        self.max_workers = max(1, max_workers)
+        # Reuse one session so paginated listing keeps its connection alive
+        self.session = session or create_session()
         self.headers = {
             "Authorization": f"token {config.access_token}",
             "Accept": "application/vnd.github.v3+json",
@@ -16,70 +49,106 @@ class GitHubClient:
         }
     
     def get_current_user(self) -> Dict[str, Any]:
-        """Fetches the authenticated user information."""
+        """
+        Fetches the authenticated user information.
+        
+        Raises:
+            GitHubAuthError: If the token is rejected
+            GitHubAPIError: For any other HTTP or connection error
+        """
         user_api_url = "https://api.github.com/user"
         
         try:
-            response = requests.get(user_api_url, headers=self.headers)
+            response = get_with_rate_limit(self.session, user_api_url, self.headers)
             response.raise_for_status()
-            return response.json()
+            return decode_json(response)
         except requests.exceptions.HTTPError as e:
             if response.status_code == 401:
-                print(f"Error: Authentication failed when getting user info. Check your GitHub Token. {e}\n\nTo create or check your GitHub Personal Access Token, visit: https://github.com/settings/tokens")
-            else:
-                print(f"HTTP Error fetching user info: {e}")
-            sys.exit(1)
+                raise GitHubAuthError(f"Authentication failed when getting user info. Check your GitHub Token. {e}\n\nTo create or check your GitHub Personal Access Token, visit: https://github.com/settings/tokens") from e
+            raise GitHubAPIError(f"HTTP Error fetching user info: {e}") from e
         except requests.exceptions.RequestException as e:
-            print(f"An unexpected error occurred during user info API request: {e}")
-            sys.exit(1)
+            raise GitHubAPIError(f"An unexpected error occurred during user info API request: {e}") from e
     
-    def get_user_repositories(self, username: str) -> List[Dict[str, Any]]:
+    def _get_page(self, api_url: str, page: int) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, str]]]:
         """
-        Fetches a list of repositories for a specific GitHub user.
-        Includes both public and private repositories accessible via the token.
+        Fetch one page of a listing and return its items and Link header entries.
+        
+        Pages are revalidated with If-None-Match against a local cache, so an
+        unchanged page comes back as an empty 304 and is served from disk.
+        Raises HTTPError for error responses.
         """
-        repositories = []
-        page = 1
-        per_page = 100  # Max per_page for GitHub API
+        return fetch_json_page(self.session, f"{api_url}&page={page}", self.headers, 'github',
+                               lambda response: dict(response.links))
+    
+    def _paginate(self, api_url: str, repositories: List[Dict[str, Any]]) -> None:
+        """
+        Append every page of a listing to repositories.
         
-        api_url = f"https://api.github.com/users/{username}/repos?per_page={per_page}"
+        When the first response's Link header names the last page, the remaining
+        pages are fetched concurrently; otherwise 'next' links are followed one by one.
+        Pages fetched before an error stay in repositories.
+        """
+        current_page_repos, links = self._get_page(api_url, 1)
+        last_page = _last_page_number(links)
         
-        print(f"Fetching repositories for GitHub user '{username}'...")
+        if current_page_repos and last_page and last_page > 1:
+            repositories.extend(current_page_repos)
+            pages = range(2, last_page + 1)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(pages))) as executor:
+                for page_repos, _ in executor.map(lambda page: self._get_page(api_url, page), pages):
+                    repositories.extend(page_repos)
+            return
         
-        while True:
-            paged_url = f"{api_url}&page={page}"
-            try:
-                response = requests.get(paged_url, headers=self.headers)
-                response.raise_for_status()
-                current_page_repos = response.json()
-                
-                if not current_page_repos:
-                    break  # No more repositories
-                
-                for repo_data in current_page_repos:
-                    repositories.append(repo_data)
-                
-                # Check if there are more pages
-                if 'next' in response.links:
-                    page += 1
-                else:
-                    break
-                    
-            except requests.exceptions.HTTPError as e:
-                if response.status_code == 401:
-                    print(f"Error: Authentication failed. Check your GitHub Token. {e}\n\nTo create or check your GitHub Personal Access Token, visit: https://github.com/settings/tokens")
-                elif response.status_code == 403:
-                    print(f"Error: API rate limit exceeded or forbidden. {e}")
-                elif response.status_code == 404:
-                    print(f"Error: User '{username}' not found or you do not have access. {e}\n\nIf this is a private user or you expect access, check your GitHub Personal Access Token permissions: https://github.com/settings/tokens")
-                else:
-                    print(f"HTTP Error fetching repositories: {e}")
-                break
-            except requests.exceptions.RequestException as e:
-                print(f"An unexpected error occurred during API request: {e}")
+        page = 1
+        while current_page_repos:
+            repositories.extend(current_page_repos)
+            if 'next' not in links:
                 break
+            page += 1
+            current_page_repos, links = self._get_page(api_url, page)
+    
+    def _list_repositories(self, path: str, owner_kind: Optional[str] = None,
+                           owner_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch every repository of a listing endpoint, reporting API errors.
+        
+        Args:
+            path: API path of the listing, e.g. '/users/octocat/repos'
+            owner_kind: 'user' or 'organization', used to explain a 404
+            owner_name: Name of the user or organization being listed
+        
+        Returns:
+            Repositories fetched before any error occurred
+        """
+        repositories: List[Dict[str, Any]] = []
+        api_url = f"https://api.github.com{path}?per_page={self.PER_PAGE}"
         
-        print(f"Found {len(repositories)} repositories for user '{username}'.")
+        try:
+            self._paginate(api_url, repositories)
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code == 401:
+                logger.error("Error: Authentication failed. Check your GitHub Token. %s\n\nTo create or check your GitHub Personal Access Token, visit: https://github.com/settings/tokens", e)
+            elif status_code == 403:
+                logger.error("Error: API rate limit exceeded or forbidden. %s", e)
+            elif status_code == 404 and owner_kind:
+                logger.error("Error: %s '%s' not found or you do not have access. %s\n\nIf this is a private %s or you expect access, check your GitHub Personal Access Token permissions: https://github.com/settings/tokens",
+                             owner_kind.capitalize(), owner_name, e, owner_kind)
+            else:
+                logger.error("HTTP Error fetching repositories: %s", e)
+        except requests.exceptions.RequestException as e:
+            logger.error("An unexpected error occurred during API request: %s", e)
+        
+        return repositories
+    
+    def get_user_repositories(self, username: str) -> List[Dict[str, Any]]:
+        """
+        Fetches a list of repositories for a specific GitHub user.
+        Includes both public and private repositories accessible via the token.
+        """
+        logger.info("Fetching repositories for GitHub user '%s'...", username)
+        repositories = self._list_repositories(f"/users/{username}/repos", 'user', username)
+        logger.info("Found %d repositories for user '%s'.", len(repositories), username)
         return repositories
     
     def get_organization_repositories(self, org_name: str) -> List[Dict[str, Any]]:
@@ -87,48 +156,9 @@ class GitHubClient:
         Fetches a list of repositories for a specific GitHub organization.
         Includes both public and private repositories accessible via the token.
         """
-        repositories = []
-        page = 1
-        per_page = 100  # Max per_page for GitHub API
-        
-        api_url = f"https://api.github.com/orgs/{org_name}/repos?per_page={per_page}"
-        
-        print(f"Fetching repositories for GitHub organization '{org_name}'...")
-        
-        while True:
-            paged_url = f"{api_url}&page={page}"
-            try:
-                response = requests.get(paged_url, headers=self.headers)
-                response.raise_for_status()
-                current_page_repos = response.json()
-                
-                if not current_page_repos:
-                    break  # No more repositories
-                
-                for repo_data in current_page_repos:
-                    repositories.append(repo_data)
-                
-                # Check if there are more pages
-                if 'next' in response.links:
-                    page += 1
-                else:
-                    break
-                    
-            except requests.exceptions.HTTPError as e:
-                if response.status_code == 401:
-                    print(f"Error: Authentication failed. Check your GitHub Token. {e}\n\nTo create or check your GitHub Personal Access Token, visit: https://github.com/settings/tokens")
-                elif response.status_code == 403:
-                    print(f"Error: API rate limit exceeded or forbidden. {e}")
-                elif response.status_code == 404:
-                    print(f"Error: Organization '{org_name}' not found or you do not have access. {e}\n\nIf this is a private organization or you expect access, check your GitHub Personal Access Token permissions: https://github.com/settings/tokens")
-                else:
-                    print(f"HTTP Error fetching repositories: {e}")
-                break
-            except requests.exceptions.RequestException as e:
-                print(f"An unexpected error occurred during API request: {e}")
-                break
-        
-        print(f"Found {len(repositories)} repositories for organization '{org_name}'.")
+        logger.info("Fetching repositories for GitHub organization '%s'...", org_name)
+        repositories = self._list_repositories(f"/orgs/{org_name}/repos", 'organization', org_name)
+        logger.info("Found %d repositories for organization '%s'.", len(repositories), org_name)
         return repositories
     
     def get_authenticated_user_repositories(self) -> List[Dict[str, Any]]:
@@ -136,44 +166,7 @@ class GitHubClient:
         Fetches a list of repositories owned by the authenticated user.
         Includes both public and private repositories.
         """
-        repositories = []
-        page = 1
-        per_page = 100  # Max per_page for GitHub API
-        
-        api_url = f"https://api.github.com/user/repos?per_page={per_page}"
-        
-        print("Fetching repositories for authenticated GitHub user...")
-        
-        while True:
-            paged_url = f"{api_url}&page={page}"
-            try:
-                response = requests.get(paged_url, headers=self.headers)
-                response.raise_for_status()
-                current_page_repos = response.json()
-                
-                if not current_page_repos:
-                    break  # No more repositories
-                
-                for repo_data in current_page_repos:
-                    repositories.append(repo_data)
-                
-                # Check if there are more pages
-                if 'next' in response.links:
-                    page += 1
-                else:
-                    break
-                    
-            except requests.exceptions.HTTPError as e:
-                if response.status_code == 401:
-                    print(f"Error: Authentication failed. Check your GitHub Token. {e}\n\nTo create or check your GitHub Personal Access Token, visit: https://github.com/settings/tokens")
-                elif response.status_code == 403:
-                    print(f"Error: API rate limit exceeded or forbidden. {e}")
-                else:
-                    print(f"HTTP Error fetching repositories: {e}")
-                break
-            except requests.exceptions.RequestException as e:
-                print(f"An unexpected error occurred during API request: {e}")
-                break
-        
-        print(f"Found {len(repositories)} repositories for authenticated user.")
-        return repositories 
\ No newline at end of file
+        logger.info("Fetching repositories for authenticated GitHub user...")
+        repositories = self._list_repositories("/user/repos")
+        logger.info("Found %d repositories for authenticated user.", len(repositories))
+        return repositories
@@ -1,128 +1,185 @@
+import concurrent.futures
+import logging
 import requests
 import sys
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Mapping, Optional, Tuple
 from .config import GitLabConfig
+from .http_session import DEFAULT_PAGE_WORKERS, create_session, decode_json, fetch_json_page, get_with_rate_limit
+
+
+_PAGINATION_HEADERS = ('X-Total-Pages', 'X-Next-Page')
+
+logger = logging.getLogger(__name__)
+
+
+def _total_pages(headers: Mapping[str, str]) -> int:
+    """Page count from X-Total-Pages; 0 when GitLab omits it (listings over 10,000 items)"""
+    try:
+        return int(headers.get('X-Total-Pages') or 0)
+    except ValueError:
+        return 0
+
+
+def _pagination_headers(response: requests.Response) -> Dict[str, str]:
+    """The pagination headers of a listing response, kept alongside its cached body"""
+    return {name: response.headers[name] for name in _PAGINATION_HEADERS if name in response.headers}
 
 
 class GitLabClient:
     """Client for interacting with GitLab API"""
     
-    def __init__(self, config: GitLabConfig):
+    # Largest page size the GitLab API accepts; fewer pages means fewer round-trips
+    PER_PAGE = 100
+    # simple=true returns the basic project fields only, which still include
+    # ssh_url_to_repo, path_with_namespace, name and namespace, at a fraction of the bytes
+    LISTING_PARAMS = f"per_page={PER_PAGE}&simple=true"
+    
+    def __init__(self, config: GitLabConfig, session: Optional[requests.Session] = None,
+                 max_workers: int = DEFAULT_PAGE_WORKERS):
         self.config = config
+        # Upper bound on pages fetched at once when the page count is known up front
+        self.max_workers = max(1, max_workers)
+        # Reuse one session so paginated listing keeps its connection alive;
+        # only a session created here is closed by close()
+        self._owns_session = session is None
+        self.session = session or create_session()
         self.headers = {
             "Private-Token": config.private_token,
             "Content-Type": "application/json"
         }
     
+    def close(self) -> None:
+        """Release pooled connections of a session this client created"""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self) -> 'GitLabClient':
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
     def get_current_user_id(self) -> int:
         """Fetches the ID of the authenticated user."""
         user_api_url = f"{self.config.url}/api/v4/user"
         
         try:
-            response = requests.get(user_api_url, headers=self.headers)
+            response = get_with_rate_limit(self.session, user_api_url, self.headers)
             response.raise_for_status()
-            user_data = response.json()
+            user_data = decode_json(response)
             return user_data['id']
         except requests.exceptions.HTTPError as e:
             if response.status_code == 401:
-                print(f"Error: Authentication failed when getting user ID. Check your GitLab Token and URL. {e}")
+                logger.error("Error: Authentication failed when getting user ID. Check your GitLab Token and URL. %s", e)
             else:
-                print(f"HTTP Error fetching user ID: {e}")
+                logger.error("HTTP Error fetching user ID: %s", e)
             sys.exit(1)
         except requests.exceptions.RequestException as e:
-            print(f"An unexpected error occurred during user ID API request: {e}")
+            logger.error("An unexpected error occurred during user ID API request: %s", e)
             sys.exit(1)
     
-    def get_user_owned_projects(self, user_id: int) -> List[Dict[str, Any]]:
+    def _get_page(self, api_url: str, page: int) -> Tuple[List[Dict[str, Any]], Mapping[str, str]]:
         """
-        Fetches a list of projects directly owned by the specified user ID.
-        Includes both public and private personal projects.
+        Fetch one page of a listing and return its items and pagination headers.
+        
+        Pages are revalidated with If-None-Match against a local cache, so an
+        unchanged page comes back as an empty 304 and is served from disk.
+        Raises HTTPError for error responses.
+        """
+        return fetch_json_page(self.session, f"{api_url}&page={page}", self.headers, 'gitlab', _pagination_headers)
+    
+    def _iter_pages(self, api_url: str) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield every page of a listing, in order, as soon as it is available.
+        
+        When the first response reports X-Total-Pages, the remaining pages are
+        fetched concurrently; otherwise X-Next-Page is followed one page at a time.
+        """
+        current_page_projects, headers = self._get_page(api_url, 1)
+        total_pages = _total_pages(headers)
+        
+        if current_page_projects and total_pages > 1:
+            yield current_page_projects
+            pages = range(2, total_pages + 1)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(pages))) as executor:
+                for page_projects, _ in executor.map(lambda page: self._get_page(api_url, page), pages):
+                    yield page_projects
+            return
+        
+        while current_page_projects:
+            yield current_page_projects
+            next_page = headers.get('X-Next-Page')
+            if not next_page:
+                break
+            current_page_projects, headers = self._get_page(api_url, int(next_page))
+    
+    def _paginate(self, api_url: str, projects: List[Dict[str, Any]]) -> None:
+        """Append every page of a listing to projects; pages fetched before an error stay in projects"""
+        for page_projects in self._iter_pages(api_url):
+            projects.extend(page_projects)
+    
+    def iter_user_owned_projects(self, user_id: int) -> Iterator[Dict[str, Any]]:
         """
-        projects = []
-        page = 1
-        per_page = 100  # Max per_page for GitLab API
+        Yields the projects directly owned by the specified user ID, page by page.
+        Includes both public and private personal projects.
         
-        api_url = f"{self.config.url}/api/v4/users/{user_id}/projects?per_page={per_page}"
+        Callers can start work on the first page while later pages are still
+        being fetched. Exits on API errors, like get_user_owned_projects.
+        """
+        api_url = f"{self.config.url}/api/v4/users/{user_id}/projects?{self.LISTING_PARAMS}"
         
-        print(f"Fetching personal project list for user ID {user_id} from {self.config.url}...")
+        logger.info("Fetching personal project list for user ID %s from %s...", user_id, self.config.url)
         
-        while True:
-            paged_url = f"{api_url}&page={page}"
-            try:
-                response = requests.get(paged_url, headers=self.headers)
-                response.raise_for_status()
-                current_page_projects = response.json()
-                
-                if not current_page_projects:
-                    break  # No more projects
-                
-                for project_data in current_page_projects:
-                    projects.append(project_data)
-                
-                # Check if 'X-Next-Page' header exists to determine if there are more pages
-                if 'X-Next-Page' in response.headers and response.headers['X-Next-Page']:
-                    page += 1
-                else:
-                    break  # No more pages
-                    
-            except requests.exceptions.HTTPError as e:
-                if response.status_code == 401:
-                    print(f"Error: Authentication failed. Check your GitLab Token and URL. {e}")
-                elif response.status_code == 403:
-                    print(f"Error: API rate limit exceeded or forbidden. {e}")
-                else:
-                    print(f"HTTP Error fetching projects: {e}")
-                sys.exit(1)
-            except requests.exceptions.RequestException as e:
-                print(f"An unexpected error occurred during API request: {e}")
-                sys.exit(1)
+        found = 0
+        try:
+            for page_projects in self._iter_pages(api_url):
+                found += len(page_projects)
+                yield from page_projects
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code == 401:
+                logger.error("Error: Authentication failed. Check your GitLab Token and URL. %s", e)
+            elif status_code == 403:
+                logger.error("Error: API rate limit exceeded or forbidden. %s", e)
+            else:
+                logger.error("HTTP Error fetching projects: %s", e)
+            sys.exit(1)
+        except requests.exceptions.RequestException as e:
+            logger.error("An unexpected error occurred during API request: %s", e)
+            sys.exit(1)
         
-        print(f"Found {len(projects)} personal projects.")
-        return projects
+        logger.info("Found %d personal projects.", found)
+    
+    def get_user_owned_projects(self, user_id: int) -> List[Dict[str, Any]]:
+        """
+        Fetches a list of projects directly owned by the specified user ID.
+        Includes both public and private personal projects.
+        """
+        return list(self.iter_user_owned_projects(user_id))
     
     def get_group_projects(self, group_id: int) -> List[Dict[str, Any]]:
         """
         Fetches a list of all projects within a specified GitLab group.
         Includes both public and private projects accessible via the token.
         """
-        projects = []
-        page = 1
-        per_page = 100  # Max per_page for GitLab API
-        
-        api_url = f"{self.config.url}/api/v4/groups/{group_id}/projects?per_page={per_page}"
+        projects: List[Dict[str, Any]] = []
+        api_url = f"{self.config.url}/api/v4/groups/{group_id}/projects?{self.LISTING_PARAMS}"
         
-        print(f"  Fetching projects for group ID {group_id}...")
+        logger.info("  Fetching projects for group ID %s...", group_id)
         
-        while True:
-            paged_url = f"{api_url}&page={page}"
-            try:
-                response = requests.get(paged_url, headers=self.headers)
-                response.raise_for_status()
-                current_page_projects = response.json()
-                
-                if not current_page_projects:
-                    break  # No more projects
-                
-                for project_data in current_page_projects:
-                    projects.append(project_data)
-                
-                if 'X-Next-Page' in response.headers and response.headers['X-Next-Page']:
-                    page += 1
-                else:
-                    break
-                    
-            except requests.exceptions.HTTPError as e:
-                if response.status_code == 401:
-                    print(f"  Error for group {group_id}: Authentication failed. Check token. {e}")
-                elif response.status_code == 403:
-                    print(f"  Error for group {group_id}: API rate limit exceeded or forbidden. {e}")
-                elif response.status_code == 404:
-                    print(f"  Error: Group with ID {group_id} not found or you don't have access. {e}")
-                else:
-                    print(f"  HTTP Error fetching projects for group {group_id}: {e}")
-                break
-            except requests.exceptions.RequestException as e:
-                print(f"  An unexpected error for group {group_id} occurred during API request: {e}")
-                break
+        try:
+            self._paginate(api_url, projects)
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code == 401:
+                logger.error("  Error for group %s: Authentication failed. Check token. %s", group_id, e)
+            elif status_code == 403:
+                logger.error("  Error for group %s: API rate limit exceeded or forbidden. %s", group_id, e)
+            elif status_code == 404:
+                logger.error("  Error: Group with ID %s not found or you don't have access. %s", group_id, e)
+            else:
+                logger.error("  HTTP Error fetching projects for group %s: %s", group_id, e)
+        except requests.exceptions.RequestException as e:
+            logger.error("  An unexpected error for group %s occurred during API request: %s", group_id, e)
         
         return projects 
\ No newline at end of file
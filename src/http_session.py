@@ -0,0 +1,194 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import user_cache_dir
+
+
+# (connect, read) timeout in seconds for API requests
+REQUEST_TIMEOUT = (5, 30)
+
+# Transient server errors retried by the session adapter with a short backoff.
+# Rate limits (429) are left to get_with_rate_limit, which caps the wait
+RETRY_STATUSES = (500, 502, 503, 504)
+
+# Pages of one listing fetched at once when its page count is known up front
+DEFAULT_PAGE_WORKERS = 5
+
+# Rate-limit windows waited out per request, and the longest single wait in
+# seconds; a longer reset is reported as the error response instead
+RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_WAIT = 300
+
+logger = logging.getLogger(__name__)
+
+_rate_limit_lock = threading.Lock()
+_rate_limited_until = 0.0
+
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create a requests session that keeps connections alive between API calls.
+
+    Args:
+        pool_size: Connections kept per host, normally the number of concurrent workers
+
+    Returns:
+        Session with a pooled, retrying adapter mounted for http and https
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        # raise_on_status=False hands the last error response back to the
+        # clients so their raise_for_status() handling still applies
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=RETRY_STATUSES,
+                          respect_retry_after_header=False, raise_on_status=False),
+    )
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _rate_limit_delay(response: requests.Response) -> Optional[float]:
+    """
+    Seconds to wait before retrying a rate-limited response, or None if it was not rate limited.
+    
+    Covers 429 and the 403 GitHub sends with X-RateLimit-Remaining: 0. The wait
+    comes from Retry-After, else from the (X-)RateLimit-Reset epoch timestamp.
+    """
+    status = response.status_code
+    headers = response.headers
+    if status == 403:
+        remaining = headers.get('RateLimit-Remaining', headers.get('X-RateLimit-Remaining'))
+        if remaining != '0':
+            return None
+    elif status != 429:
+        return None
+    
+    try:
+        if headers.get('Retry-After'):
+            return max(0.0, float(headers['Retry-After']))
+        reset = headers.get('RateLimit-Reset') or headers.get('X-RateLimit-Reset')
+        if reset:
+            return max(0.0, float(reset) - time.time())
+    except ValueError:
+        pass
+    return None
+
+
+def get_with_rate_limit(session: requests.Session, url: str, headers: Mapping[str, str]) -> requests.Response:
+    """
+    GET url, sleeping through rate-limit windows instead of failing on them.
+    
+    Up to RATE_LIMIT_RETRIES waits of at most MAX_RATE_LIMIT_WAIT seconds each;
+    after that the rate-limited response is returned for the caller's error
+    handling. Concurrent requests hitting the same window log it only once.
+    """
+    global _rate_limited_until
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        delay = _rate_limit_delay(response)
+        if delay is None or delay > MAX_RATE_LIMIT_WAIT or attempt == RATE_LIMIT_RETRIES:
+            return response
+        
+        until = time.time() + delay
+        with _rate_limit_lock:
+            first_report = until > _rate_limited_until + 1
+            _rate_limited_until = max(_rate_limited_until, until)
+        if first_report:
+            logger.warning("API rate limit reached; waiting %.0f seconds for it to reset...", delay)
+        time.sleep(delay)
+    return response
+
+
+def decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, with orjson when it is installed.
+
+    Parses the raw bytes directly, skipping the charset detection and text
+    decoding that Response.json() goes through.
+    """
+    return _json_loads(response.content)
+
+
+def _page_cache_path(namespace: str, url: str) -> Path:
+    """Location of the cached ETag and body of a listing page"""
+    key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    return user_cache_dir() / namespace / f"{key}.pickle"
+
+
+def _read_cached_page(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a cached page ({'etag', 'items', 'meta'}), or None if there is no usable entry"""
+    try:
+        entry = pickle.loads(cache_path.read_bytes())
+        return entry if 'meta' in entry else None
+    except Exception:
+        return None
+
+
+def _write_cached_page(cache_path: Path, etag: Optional[str], items: Any, meta: Any) -> None:
+    """Store a page for later If-None-Match revalidation; failures only lose the cache"""
+    if not etag:
+        return
+    try:
+        # Listings may include private repositories, so keep the cache user-only
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        blob = pickle.dumps({'etag': etag, 'items': items, 'meta': meta}, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        pass
+
+
+def fetch_json_page(session: requests.Session, url: str, headers: Mapping[str, str], cache_namespace: str,
+                    pagination: Callable[[requests.Response], Any]) -> Tuple[Any, Any]:
+    """
+    GET one page of a JSON listing, revalidating it against a local ETag cache.
+
+    Args:
+        session: Session to send the request on
+        url: Full page URL
+        headers: Request headers; If-None-Match is added when the page is cached
+        cache_namespace: Cache subdirectory, one per API
+        pagination: Extracts the pagination metadata to keep from a 200 response
+
+    Returns:
+        Decoded body and pagination metadata, from the cache when the server answers 304
+
+    Raises:
+        requests.exceptions.HTTPError: For error responses
+    """
+    cache_path = _page_cache_path(cache_namespace, url)
+    cached = _read_cached_page(cache_path)
+    if cached:
+        headers = {**headers, "If-None-Match": cached['etag']}
+    
+    response = get_with_rate_limit(session, url, headers)
+    if cached and response.status_code == 304:
+        return cached['items'], cached['meta']
+    
+    response.raise_for_status()
+    items = decode_json(response)
+    meta = pagination(response)
+    _write_cached_page(cache_path, response.headers.get('ETag'), items, meta)
+    return items, meta
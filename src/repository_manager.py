@@ -1,15 +1,141 @@
 import os
 import subprocess
 import concurrent.futures
-from typing import List, Dict, Any, Tuple, Optional
+import itertools
+import logging
+import re
+import sys
+from typing import Dict, Any, Iterable, Iterator, List, Set, Tuple, Optional
 from .config import RepositoryConfig
 
 
+logger = logging.getLogger(__name__)
+
+# (repository URL, path relative to the output directory, clone all branches)
+CloneTask = Tuple[str, str, bool]
+
+
+# Let each git process use all cores for checkout and pack work (0 = one per CPU),
+# skip fsmonitor, which only costs startup time in short-lived clones, and never
+# start an automatic gc in the middle of a batch
+GIT_PARALLEL_OPTS = (
+    "-c", "fetch.parallel=0",
+    "-c", "submodule.fetchJobs=0",
+    "-c", "checkout.workers=0",
+    "-c", "pack.threads=0",
+    "-c", "core.fsmonitor=false",
+    "-c", "gc.auto=0",
+)
+
+
+def _run_git(args: List[str], cwd: str, check: bool = True,
+             capture_stdout: bool = False) -> subprocess.CompletedProcess:
+    """Run a git command with the parallelism options, capturing stderr as text
+    
+    stdout goes to /dev/null unless capture_stdout is set, so clone and fetch
+    output is never piped into Python only to be discarded. stderr is kept for
+    error messages. GIT_TERMINAL_PROMPT=0 makes a repository that needs
+    credentials fail fast instead of blocking a worker on a prompt nobody can answer.
+    """
+    return subprocess.run(["git", *GIT_PARALLEL_OPTS, *args], cwd=cwd, check=check, text=True,
+                          stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          env={**os.environ, "GIT_TERMINAL_PROMPT": "0"})
+
+
+# Branch names in for-each-ref --format=%(refname) output, one ref per line
+_LOCAL_BRANCH_RE = re.compile(r"^refs/heads/(.+)$", re.MULTILINE)
+_REMOTE_BRANCH_RE = re.compile(r"^(refs/remotes/origin/(?!HEAD$)(.+))$", re.MULTILINE)
+
+
+def _remote_branches(refs: str) -> Iterator[Tuple[str, str]]:
+    """Yield (branch, ref) for each origin branch in for-each-ref output, skipping origin/HEAD"""
+    for match in _REMOTE_BRANCH_RE.finditer(refs):
+        yield match.group(2), match.group(1)
+
+
+def _create_local_branches(repo_path: str) -> None:
+    """Create a tracking local branch for every origin branch that has none
+    
+    One for-each-ref lists local and remote branches together, instead of a
+    show-ref per remote branch. Each missing branch is then made with its own
+    git branch --track, which writes the upstream config under git's lock and
+    quoting; a branch that cannot be created does not stop the others, and the
+    first failure is raised once all have been tried.
+    """
+    result = _run_git(["for-each-ref", "--format=%(refname)", "refs/heads/", "refs/remotes/origin/"], cwd=repo_path,
+                      capture_stdout=True)
+    local_branches = set(_LOCAL_BRANCH_RE.findall(result.stdout))
+    
+    failure: Optional[subprocess.CalledProcessError] = None
+    for branch, ref in _remote_branches(result.stdout):
+        if branch in local_branches:
+            continue
+        try:
+            _run_git(["branch", "--track", branch, ref], cwd=repo_path)
+        except subprocess.CalledProcessError as e:
+            failure = failure or e
+    if failure is not None:
+        raise failure
+
+
+def _init_worker_logging(level: int) -> None:
+    """Log straight to stdout in a pool worker process
+    
+    A forked copy of a QueueHandler's queue is never drained by the parent's
+    listener, so inherited handlers would silently drop worker messages.
+    """
+    logging.basicConfig(level=level, format='%(message)s', stream=sys.stdout, force=True)
+
+
+def _non_empty(items: Iterable[Dict[str, Any]]) -> Optional[Iterable[Dict[str, Any]]]:
+    """Return an iterable over items, or None if there are none, consuming at most one item"""
+    iterator = iter(items)
+    first = next(iterator, None)
+    if first is None:
+        return None
+    return itertools.chain((first,), iterator)
+
+
 class RepositoryManager:
     """Manages Git repository operations"""
     
     def __init__(self, config: RepositoryConfig):
         self.config = config
+        # Parent directories already created, so repositories sharing a group
+        # directory make it once per run rather than once per clone
+        self._created_dirs: Set[str] = set()
+    
+    def _ensure_parent_dir(self, repo_path: str) -> None:
+        """Create the directory that will contain repo_path, unless this manager already has"""
+        parent = os.path.dirname(repo_path)
+        if parent not in self._created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            self._created_dirs.add(parent)
+    
+    def executor(self) -> concurrent.futures.Executor:
+        """Pool for running clone/pull jobs, per config.executor ("thread" or "process")
+        
+        Threads are enough while workers wait on git; a process pool also moves
+        the Python-side work (paths, output, ref parsing) off the GIL.
+        """
+        if self.config.executor == "process":
+            return concurrent.futures.ProcessPoolExecutor(max_workers=self.config.max_concurrent_downloads,
+                                                          initializer=_init_worker_logging,
+                                                          initargs=(logging.getLogger().getEffectiveLevel(),))
+        return concurrent.futures.ThreadPoolExecutor(max_workers=self.config.max_concurrent_downloads)
+    
+    def _clone_args(self, repo_url: str, repo_path: str, shallow: bool = False) -> List[str]:
+        """
+        Build the clone command: a partial clone when clone_filter is set (e.g.
+        blob:none, tree:0), and a single-commit clone of the default branch when shallow.
+        """
+        args = ["clone"]
+        clone_filter = self.config.clone_filter
+        if clone_filter and clone_filter != "none":
+            args.append(f"--filter={clone_filter}")
+        if shallow:
+            args += ["--depth=1", "--single-branch", "--no-tags"]
+        return [*args, repo_url, repo_path]
     
     def clone_or_pull_repo(self, repo_url: str, repo_name_with_namespace: str, output_dir: Optional[str] = None) -> Tuple[str, str]:
         """
@@ -24,22 +150,33 @@ class RepositoryManager:
         base_dir = output_dir if output_dir else self.config.repo_dir
         repo_path = os.path.join(base_dir, repo_name_with_namespace)
         
-        # Ensure the parent directories for the repo_path exist
-        os.makedirs(os.path.dirname(repo_path), exist_ok=True)
-        
         if os.path.exists(repo_path):
-            print(f"  Processing '{repo_name_with_namespace}': Exists. Pulling...")
-            try:
-                subprocess.run(["git", "pull"], cwd=repo_path, check=True, capture_output=True, text=True)
-                status_message = f"Pulled changes for '{repo_name_with_namespace}'."
-            except subprocess.CalledProcessError as e:
-                status_message = f"Error pulling changes for '{repo_name_with_namespace}': {e.stderr.strip()}"
-            except FileNotFoundError:
-                status_message = f"Error: 'git' command not found for '{repo_name_with_namespace}'. Make sure Git is installed and in your PATH."
+            logger.info("  Processing '%s': Exists. Pulling...", repo_name_with_namespace)
+            # Without its own .git, git would act on an enclosing repository instead
+            if not os.path.exists(os.path.join(repo_path, ".git")):
+                status_message = f"Error pulling changes for '{repo_name_with_namespace}': {repo_path} is not a Git repository."
+            else:
+                try:
+                    # Fetch, then fast-forward only: no merge or rebase machinery, and
+                    # local commits or edits are never overwritten
+                    # A shallow clone fetches without --depth: new commits then connect to
+                    # the existing tip, so the fast-forward below still applies
+                    fetch_args = ["fetch", "--prune", "--quiet"]
+                    if self.config.shallow:
+                        fetch_args.append("--no-tags")
+                    _run_git(fetch_args, cwd=repo_path)
+                    _run_git(["merge", "--ff-only", "--quiet", "@{u}"], cwd=repo_path)
+                    status_message = f"Pulled changes for '{repo_name_with_namespace}'."
+                except subprocess.CalledProcessError as e:
+                    status_message = f"Error pulling changes for '{repo_name_with_namespace}': {e.stderr.strip()}"
+                except FileNotFoundError:
+                    status_message = f"Error: 'git' command not found for '{repo_name_with_namespace}'. Make sure Git is installed and in your PATH."
         else:
-            print(f"  Processing '{repo_name_with_namespace}': Cloning...")
+            logger.info("  Processing '%s': Cloning...", repo_name_with_namespace)
             try:
-                subprocess.run(["git", "clone", repo_url, repo_path], cwd=base_dir, check=True, capture_output=True, text=True)
+                # Parent directories are only needed for a new clone, so updates skip the mkdir walk
+                self._ensure_parent_dir(repo_path)
+                _run_git(self._clone_args(repo_url, repo_path, self.config.shallow), cwd=base_dir)
                 status_message = f"Cloned '{repo_name_with_namespace}'."
             except subprocess.CalledProcessError as e:
                 status_message = f"Error cloning '{repo_name_with_namespace}': {e.stderr.strip()}"
@@ -64,24 +201,12 @@ class RepositoryManager:
         status_type = "FAILED"
         status_message = ""
         
-        os.makedirs(os.path.dirname(full_local_repo_path), exist_ok=True)
-        
         if os.path.exists(full_local_repo_path):
-            print(f"  Processing '{local_repo_path_relative}': Exists. Fetching all branches and creating local copies...")
+            logger.info("  Processing '%s': Exists. Fetching all branches and creating local copies...", local_repo_path_relative)
             try:
-                subprocess.run(["git", "fetch", "--all", "--prune"], cwd=full_local_repo_path, check=True, capture_output=True, text=True)
-                
-                result = subprocess.run(["git", "branch", "-r"], cwd=full_local_repo_path, check=True, capture_output=True, text=True)
-                remote_branches = [
-                    branch.strip().replace("origin/", "")
-                    for branch in result.stdout.splitlines()
-                    if "->" not in branch and "origin/" in branch
-                ]
+                _run_git(["fetch", "--all", "--prune"], cwd=full_local_repo_path)
                 
-                for branch in remote_branches:
-                    check_local_branch = subprocess.run(["git", "show-ref", "--verify", f"refs/heads/{branch}"], cwd=full_local_repo_path, capture_output=True, text=True)
-                    if check_local_branch.returncode != 0:
-                        subprocess.run(["git", "branch", branch, f"origin/{branch}"], cwd=full_local_repo_path, check=True, capture_output=True, text=True)
+                _create_local_branches(full_local_repo_path)
                 
                 status_type = "SUCCESS"
                 status_message = f"Fetched all branches and created local branches for '{local_repo_path_relative}'."
@@ -91,21 +216,12 @@ class RepositoryManager:
             except FileNotFoundError:
                 status_message = f"Error: 'git' command not found for '{local_repo_path_relative}'. Make sure Git is installed and in your PATH."
         else:
-            print(f"  Processing '{local_repo_path_relative}': Cloning...")
+            logger.info("  Processing '%s': Cloning...", local_repo_path_relative)
             try:
-                subprocess.run(["git", "clone", repo_url, full_local_repo_path], cwd=base_dir, check=True, capture_output=True, text=True)
+                self._ensure_parent_dir(full_local_repo_path)
+                _run_git(self._clone_args(repo_url, full_local_repo_path), cwd=base_dir)
                 
-                result = subprocess.run(["git", "branch", "-r"], cwd=full_local_repo_path, check=True, capture_output=True, text=True)
-                remote_branches = [
-                    branch.strip().replace("origin/", "")
-                    for branch in result.stdout.splitlines()
-                    if "->" not in branch and "origin/" in branch
-                ]
-                
-                for branch in remote_branches:
-                    check_local_branch = subprocess.run(["git", "show-ref", "--verify", f"refs/heads/{branch}"], cwd=full_local_repo_path, capture_output=True, text=True)
-                    if check_local_branch.returncode != 0:
-                        subprocess.run(["git", "branch", branch, f"origin/{branch}"], cwd=full_local_repo_path, check=True, capture_output=True, text=True)
+                _create_local_branches(full_local_repo_path)
                 
                 status_type = "SUCCESS"
                 status_message = f"Cloned '{local_repo_path_relative}' and created all local branches."
@@ -116,55 +232,75 @@ class RepositoryManager:
         
         return local_repo_path_relative, status_type, status_message
     
-    def process_user_projects(self, projects: List[Dict[str, Any]], output_dir: Optional[str] = None) -> None:
-        """Process user-owned projects with concurrent execution"""
-        if not projects:
-            print("No personal projects found or an error occurred. Exiting.")
-            return
-        
-        print(f"\nStarting concurrent personal project download/update process with {self.config.max_concurrent_downloads} workers...")
+    def run_clone_batch(self, tasks: Iterable[CloneTask], output_dir: Optional[str] = None,
+                        announce_total: bool = False) -> None:
+        """
+        Clone or update every (url, relative path, all_branches) task in one pool
+        and log each status message as it completes.
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.max_concurrent_downloads) as executor:
-            futures = {
-                executor.submit(self.clone_or_pull_repo, project['ssh_url_to_repo'], project['path_with_namespace'], output_dir): project['path_with_namespace'] 
-                for project in projects
-            }
+        Tasks are submitted in the order given and may come from a lazy iterable;
+        callers that know repository sizes pass the largest first, so a big clone
+        does not start last and hold up the end of the run.
+        """
+        with self.executor() as executor:
+            futures = {}
+            for repo_url, relative_path, all_branches in tasks:
+                worker = self.clone_or_pull_all_branches if all_branches else self.clone_or_pull_repo
+                futures[executor.submit(worker, repo_url, relative_path, output_dir)] = relative_path
+            
+            if announce_total:
+                logger.info("\nTotal projects to process: %d", len(futures))
             
             for future in concurrent.futures.as_completed(futures):
                 repo_name_submitted = futures[future]
                 try:
-                    repo_name, status_message = future.result()
-                    print(f"  -> {status_message}")
+                    # Both workers put the status message last
+                    status_message = future.result()[-1]
+                    logger.info("  -> %s", status_message)
                 except Exception as exc:
-                    print(f"  -> {repo_name_submitted} generated an exception: {exc}")
+                    logger.error("  -> %s generated an exception: %s", repo_name_submitted, exc)
+    
+    def process_user_projects(self, projects: Iterable[Dict[str, Any]], output_dir: Optional[str] = None) -> None:
+        """
+        Process user-owned projects with concurrent execution
         
-        print("\n--- All personal GitLab projects processed! ---")
+        projects may be a lazy iterable; each project is submitted as soon as it
+        arrives, so cloning starts while later listing pages are still loading.
+        """
+        pending = _non_empty(projects)
+        if pending is None:
+            logger.warning("No personal projects found or an error occurred. Exiting.")
+            return
+        
+        logger.info("\nStarting concurrent personal project download/update process with %d workers...",
+                    self.config.max_concurrent_downloads)
+        
+        self.run_clone_batch(
+            ((project['ssh_url_to_repo'], project['path_with_namespace'], False) for project in pending),
+            output_dir
+        )
+        
+        logger.info("\n--- All personal GitLab projects processed! ---")
     
-    def process_group_projects(self, all_projects: List[Dict[str, Any]], output_dir: Optional[str] = None) -> None:
-        """Process group projects with concurrent execution"""
-        if not all_projects:
-            print("No projects found across any specified groups or an error occurred. Exiting.")
+    def process_group_projects(self, all_projects: Iterable[Dict[str, Any]], output_dir: Optional[str] = None) -> None:
+        """
+        Process group projects with concurrent execution
+        
+        all_projects may be a lazy iterable; each project is submitted as soon as
+        it arrives, so cloning starts while later groups are still being listed.
+        """
+        pending = _non_empty(all_projects)
+        if pending is None:
+            logger.warning("No projects found across any specified groups or an error occurred. Exiting.")
             return
         
-        print(f"\nTotal projects to process: {len(all_projects)}")
-        print(f"Starting concurrent project download/update process with {self.config.max_concurrent_downloads} workers...")
+        logger.info("\nStarting concurrent project download/update process with %d workers...", self.config.max_concurrent_downloads)
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.max_concurrent_downloads) as executor:
-            futures = {}
-            for project in all_projects:
-                ssh_url = project['ssh_url_to_repo']
-                group_base_name = project['namespace']['name']
-                project_name = project['name']
-                local_repo_path_relative = os.path.join(group_base_name, project_name)
-                
-                futures[executor.submit(self.clone_or_pull_all_branches, ssh_url, local_repo_path_relative, output_dir)] = local_repo_path_relative
-            
-            for future in concurrent.futures.as_completed(futures):
-                repo_name_submitted = futures[future]
-                try:
-                    repo_name, status_type, status_message = future.result()
-                    print(f"  -> {status_message}")
-                except Exception as exc:
-                    print(f"  -> {repo_name_submitted} generated an exception: {exc}")
+        self.run_clone_batch(
+            ((project['ssh_url_to_repo'], os.path.join(project['namespace']['name'], project['name']), True)
+             for project in pending),
+            output_dir,
+            announce_total=True
+        )
         
-        print("\n--- All group GitLab projects processed! ---") 
\ No newline at end of file
+        logger.info("\n--- All group GitLab projects processed! ---") 
\ No newline at end of file
@@ -6,36 +6,245 @@ This script can be run locally to test imports and basic functionality across mu
 
 import sys
 import subprocess
-import importlib
+import functools
+import io
+import json
 import os
-import platform
-from pathlib import Path
+import re
+import shlex
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_stdout_lock = threading.Lock()
+
+class _ThreadBufferedStdout:
+    """sys.stdout stand-in that sends the prints of a capturing thread to that thread's buffer."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        return (getattr(self._local, 'buffer', None) or self._stream).write(text)
+    
+    def flush(self):
+        (getattr(self._local, 'buffer', None) or self._stream).flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def run_captured(func, *args):
+    """Run func, collecting what it prints on this thread; returns (result, output)."""
+    with _stdout_lock:
+        if not isinstance(sys.stdout, _ThreadBufferedStdout):
+            sys.stdout = _ThreadBufferedStdout(sys.stdout)
+    local = sys.stdout._local
+    previous = getattr(local, 'buffer', None)
+    local.buffer = io.StringIO()
+    try:
+        return func(*args), local.buffer.getvalue()
+    finally:
+        local.buffer = previous
+
+# Directories never searched for Python sources
+SKIP_DIRS = frozenset({'venv', '.venv', '.git', '__pycache__', 'node_modules'})
+
+@functools.lru_cache(maxsize=1)
+def _discover_python_files():
+    """Walk the tree once for .py files, pruning skipped directories before descending."""
+    python_files = []
+    for root, dirs, files in os.walk('.'):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        python_files.extend(os.path.join(root, name) for name in files if name.endswith('.py'))
+    return python_files
+
+@functools.lru_cache(maxsize=None)
+def _py_argv(python_cmd):
+    """Split a command such as 'py -3.11' or 'python3.11' into argv, once per command."""
+    return tuple(shlex.split(python_cmd))
+
+def _probe_python_version(version):
+    """Return True/False for whether pythonX.Y is installed, or the error raised while checking."""
+    try:
+        cmd = [f'python{version}', '--version']
+        # Nothing on PATH needs no process
+        if not shutil.which(cmd[0]):
+            return False
+        # The running interpreter's version on PATH is a sure hit; any other is
+        # still run, since shims (pyenv, asdf) exist for versions not installed
+        if version == f"{sys.version_info.major}.{sys.version_info.minor}":
+            return True
+        # Only the exit status matters, so nothing is piped back
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+    except Exception as e:
+        return e
+
+def _py_launcher_versions():
+    """Versions the Windows py launcher knows, from one 'py -0p' listing."""
+    if not shutil.which('py'):
+        return set()
+    result = subprocess.run(['py', '-0p'], capture_output=True, text=True)
+    # Lines look like ' -V:3.12 *  C:\...' (or ' -3.12-64 ...' on older launchers)
+    return set(re.findall(r'^\s*-(?:V:)?(\d+\.\d+)', result.stdout, re.MULTILINE))
+
+@functools.lru_cache(maxsize=None)
+def _discover_python_versions():
+    """Find candidate versions, cached so discovery runs once per process."""
+    versions = ['3.10', '3.11', '3.12', '3.13']
+    if sys.platform == "win32":
+        try:
+            installed = _py_launcher_versions()
+        except Exception as e:
+            return tuple((version, e) for version in versions)
+        return tuple((version, version in installed) for version in versions)
+    
+    with ThreadPoolExecutor(max_workers=len(versions)) as executor:
+        return tuple(zip(versions, executor.map(_probe_python_version, versions)))
 
 def get_python_versions():
     """Get available Python versions to test."""
-    versions = ['3.10', '3.11', '3.12', '3.13']
     available_versions = []
     
-    for version in versions:
+    for version, found in _discover_python_versions():
+        if isinstance(found, Exception):
+            print(f"❌ Error checking Python {version}: {found}")
+        elif found:
+            available_versions.append(version)
+            print(f"✅ Found Python {version}")
+        else:
+            print(f"❌ Python {version} not found")
+    
+    return available_versions
+
+MODULES_TO_TEST = [
+    'src.config',
+    'src.gitlab_client',
+    'src.github_client',
+    'src.repository_manager',
+    'src.composer_manager',
+    'src.services',
+    'cli'
+]
+
+# Classes the basic functionality phase looks up, per module
+BASIC_CHECKS = [
+    ("Config loading", [('src.config', 'config_manager')]),
+    ("Dataclass imports", [('src.config', 'GitLabConfig'), ('src.config', 'GitHubConfig'), ('src.config', 'ComposerConfig')]),
+    ("Client class imports", [('src.gitlab_client', 'GitLabClient'), ('src.github_client', 'GitHubClient')]),
+    ("Manager class imports", [('src.repository_manager', 'RepositoryManager'), ('src.composer_manager', 'ComposerManager')]),
+    ("Service class imports", [('src.services', name) for name in (
+        'UserRepositoryService', 'GroupRepositoryService', 'ComposerService',
+        'GitHubUserService', 'GitHubOrganizationService')]),
+]
+
+PHASES = [
+    ('syntax', "1. Testing syntax with {}..."),
+    ('imports', "2. Testing imports with {}..."),
+    ('basic', "3. Testing basic functionality with {}..."),
+    ('cli', "4. Testing CLI help with {}..."),
+]
+
+# Runs all four phases in the interpreter under test, so each version costs one
+# interpreter start instead of four. Takes [files, modules, basic checks] as JSON
+# in argv[1] and prints one JSON line per phase; anything the project code
+# prints is kept off stdout. Later phases are skipped once syntax fails.
+_COMBINED_TEST_SCRIPT = r'''
+import contextlib, importlib, io, json, py_compile, sys
+
+files, modules, basic_checks = json.loads(sys.argv[1])
+out = sys.stdout
+
+def report(phase, ok, lines):
+    out.write(json.dumps({"phase": phase, "ok": ok, "lines": lines}) + "\n")
+    out.flush()
+
+def syntax():
+    lines, ok = [], True
+    for path in files:
+        try:
+            py_compile.compile(path, doraise=True)
+            lines.append(f"  ✅ {path}")
+        except py_compile.PyCompileError as e:
+            ok = False
+            lines.append(f"  ❌ {path}: {e.msg.strip()}")
+    return ok, lines
+
+def imports():
+    lines, ok = [], True
+    for name in modules:
         try:
-            # Try to find Python executable
-            if platform.system() == "Windows":
-                # On Windows, try python3.x or py -3.x
-                cmd = f'py -{version} --version'
-            else:
-                # On Unix-like systems, try python3.x
-                cmd = f'python{version} --version'
-            
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                available_versions.append(version)
-                print(f"✅ Found Python {version}")
-            else:
-                print(f"❌ Python {version} not found")
+            importlib.import_module(name)
+            lines.append(f"  ✅ {name}")
         except Exception as e:
-            print(f"❌ Error checking Python {version}: {e}")
+            ok = False
+            lines.append(f"  ❌ {name}: {e!r}")
+    return ok, lines
+
+def basic():
+    lines = []
+    try:
+        for label, names in basic_checks:
+            for module_name, attr in names:
+                getattr(importlib.import_module(module_name), attr)
+            if label == "Config loading":
+                importlib.import_module("src.config").config_manager.load_config()
+            lines.append(f"  ✅ {label}")
+        lines.append("  ✅ All basic functionality tests passed")
+        return True, lines
+    except Exception as e:
+        lines.append(f"  ❌ Basic functionality test failed: {e}")
+        return False, lines
+
+def cli_help():
+    from click.testing import CliRunner
+    from cli import cli
+    result = CliRunner().invoke(cli, ["--help"])
+    if result.exit_code == 0:
+        return True, ["  ✅ CLI help command works"]
+    return False, [f"  ❌ CLI help failed: {result.output.strip()}"]
+
+for phase, check in (("syntax", syntax), ("imports", imports), ("basic", basic), ("cli", cli_help)):
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ok, lines = check()
+    except Exception as e:
+        ok, lines = False, [f"  ❌ {phase} check error: {e}"]
+    report(phase, ok, lines)
+    if phase == "syntax" and not ok:
+        break
+'''
+
+def run_all_with_python(python_cmd):
+    """Run every phase in one python_cmd process; returns {phase: (ok, report lines)}."""
+    payload = json.dumps([_discover_python_files(), MODULES_TO_TEST, BASIC_CHECKS])
+    try:
+        result = subprocess.run([*_py_argv(python_cmd), '-c', _COMBINED_TEST_SCRIPT, payload],
+                                capture_output=True, text=True, encoding='utf-8', timeout=120)
+    except subprocess.TimeoutExpired:
+        return {phase: (False, ["  ❌ Timed out"]) for phase, _ in PHASES}
+    except Exception as e:
+        return {phase: (False, [f"  ⚠️  {e}"]) for phase, _ in PHASES}
     
-    return available_versions
+    outcomes = {}
+    for line in result.stdout.splitlines():
+        if line.startswith('{"phase"'):
+            entry = json.loads(line)
+            outcomes[entry['phase']] = (entry['ok'], entry['lines'])
+    
+    # Phases after a syntax failure are skipped (None); otherwise a missing
+    # report means the interpreter died before reaching that phase
+    if 'syntax' in outcomes:
+        missing = (None, ["  ⏭️  Skipped after syntax errors"])
+    else:
+        missing = (False, [f"  ❌ Not run: {result.stderr.strip()}"])
+    for phase, _ in PHASES:
+        outcomes.setdefault(phase, missing)
+    return outcomes
+
+def _status(ok, passed='✅ PASS', failed='❌ FAIL', skipped='⏭️  SKIPPED'):
+    """Label a phase outcome: True passed, False failed, None skipped."""
+    return skipped if ok is None else passed if ok else failed
 
 def test_python_version(version):
     """Test a specific Python version."""
@@ -44,34 +253,26 @@ def test_python_version(version):
     print(f"{'='*60}")
     
     # Determine the Python command
-    if platform.system() == "Windows":
+    if sys.platform == "win32":
         python_cmd = f'py -{version}'
     else:
         python_cmd = f'python{version}'
     
-    # Test 1: Syntax check
-    print(f"\n1. Testing syntax with {python_cmd}...")
-    syntax_ok = test_syntax_with_python(python_cmd)
-    
-    # Test 2: Import test
-    print(f"\n2. Testing imports with {python_cmd}...")
-    import_ok = test_imports_with_python(python_cmd)
-    
-    # Test 3: Basic functionality
-    print(f"\n3. Testing basic functionality with {python_cmd}...")
-    basic_ok = test_basic_functionality_with_python(python_cmd)
-    
-    # Test 4: CLI help
-    print(f"\n4. Testing CLI help with {python_cmd}...")
-    cli_ok = test_cli_help_with_python(python_cmd)
+    outcomes = run_all_with_python(python_cmd)
+    for phase, title in PHASES:
+        ok, lines = outcomes[phase]
+        print(f"\n{title.format(python_cmd)}")
+        for line in lines:
+            print(line)
+    syntax_ok, import_ok, basic_ok, cli_ok = (outcomes[phase][0] for phase, _ in PHASES)
     
     # Summary for this version
     print(f"\n{'='*40}")
     print(f"Python {version} Results:")
-    print(f"Syntax: {'✅ PASS' if syntax_ok else '❌ FAIL'}")
-    print(f"Imports: {'✅ PASS' if import_ok else '❌ FAIL'}")
-    print(f"Basic functionality: {'✅ PASS' if basic_ok else '❌ FAIL'}")
-    print(f"CLI help: {'✅ PASS' if cli_ok else '❌ FAIL'}")
+    print(f"Syntax: {_status(syntax_ok)}")
+    print(f"Imports: {_status(import_ok)}")
+    print(f"Basic functionality: {_status(basic_ok)}")
+    print(f"CLI help: {_status(cli_ok)}")
     
     return {
         'version': version,
@@ -80,146 +281,9 @@ def test_python_version(version):
         'basic': basic_ok,
         'cli': cli_ok
     }
-
-def test_syntax_with_python(python_cmd):
-    """Test Python syntax using the specified Python command."""
-    python_files = []
-    for root, dirs, files in os.walk('.'):
-        if 'venv' in root or '.git' in root or '__pycache__' in root:
-            continue
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
-    
-    syntax_errors = []
-    
-    for file_path in python_files:
-        try:
-            cmd = f'{python_cmd} -m py_compile "{file_path}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"  ✅ {file_path}")
-            else:
-                print(f"  ❌ {file_path}: {result.stderr.strip()}")
-                syntax_errors.append(file_path)
-        except Exception as e:
-            print(f"  ⚠️  {file_path}: {e}")
-            syntax_errors.append(file_path)
-    
-    return len(syntax_errors) == 0
-
-def test_imports_with_python(python_cmd):
-    """Test module imports using the specified Python command."""
-    modules_to_test = [
-        'src.config',
-        'src.gitlab_client',
-        'src.github_client', 
-        'src.repository_manager',
-        'src.composer_manager',
-        'src.services',
-        'cli'
-    ]
-    
-    failed_imports = []
-    
-    for module_name in modules_to_test:
-        try:
-            cmd = f'{python_cmd} -c "import {module_name}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"  ✅ {module_name}")
-            else:
-                print(f"  ❌ {module_name}: {result.stderr.strip()}")
-                failed_imports.append(module_name)
-        except Exception as e:
-            print(f"  ⚠️  {module_name}: {e}")
-            failed_imports.append(module_name)
-    
-    return len(failed_imports) == 0
-
-def test_basic_functionality_with_python(python_cmd):
-    """Test basic functionality using the specified Python command."""
-    test_code = '''
-import sys
-try:
-    # Test config loading
-    from src.config import config_manager
-    config = config_manager.load_config()
-    print("  ✅ Config loading")
-    
-    # Test dataclass imports
-    from src.config import GitLabConfig, GitHubConfig, ComposerConfig
-    print("  ✅ Dataclass imports")
-    
-    # Test client imports
-    from src.gitlab_client import GitLabClient
-    from src.github_client import GitHubClient
-    print("  ✅ Client class imports")
-    
-    # Test manager imports
-    from src.repository_manager import RepositoryManager
-    from src.composer_manager import ComposerManager
-    print("  ✅ Manager class imports")
-    
-    # Test services import
-    from src.services import UserRepositoryService, GroupRepositoryService, ComposerService, GitHubUserService, GitHubOrganizationService
-    print("  ✅ Service class imports")
-    
-    print("  ✅ All basic functionality tests passed")
-    sys.exit(0)
-except Exception as e:
-    print(f"  ❌ Basic functionality test failed: {e}")
-    sys.exit(1)
-'''
-    
-    try:
-        result = subprocess.run(
-            f'{python_cmd} -c "{test_code}"',
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode == 0:
-            print(result.stdout.strip())
-            return True
-        else:
-            print(result.stderr.strip())
-            return False
-    except subprocess.TimeoutExpired:
-        print("  ❌ Basic functionality test timed out")
-        return False
-    except Exception as e:
-        print(f"  ❌ Basic functionality test error: {e}")
-        return False
-
-def test_cli_help_with_python(python_cmd):
-    """Test CLI help using the specified Python command."""
-    try:
-        result = subprocess.run(
-            f'{python_cmd} cli.py --help',
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode == 0:
-            print("  ✅ CLI help command works")
-            return True
-        else:
-            print(f"  ❌ CLI help failed: {result.stderr.strip()}")
-            return False
-    except subprocess.TimeoutExpired:
-        print("  ❌ CLI help timed out")
-        return False
-    except Exception as e:
-        print(f"  ❌ CLI help error: {e}")
-        return False
-
 def main():
     """Run tests across all available Python versions."""
+    import platform  # only needed for this banner line
     print("Python Version Compatibility Test")
     print("=" * 60)
     print(f"Current Python: {sys.version}")
@@ -235,11 +299,14 @@ def main():
     
     print(f"\nFound {len(available_versions)} Python version(s) to test: {', '.join(available_versions)}")
     
-    # Test each version
+    # Test all versions at once, printing each version's report in order
     results = []
-    for version in available_versions:
-        result = test_python_version(version)
-        results.append(result)
+    with ThreadPoolExecutor(max_workers=len(available_versions)) as executor:
+        futures = [executor.submit(run_captured, test_python_version, version) for version in available_versions]
+        for future in futures:
+            result, output = future.result()
+            print(output, end='')
+            results.append(result)
     
     # Final summary
     print(f"\n{'='*60}")
@@ -255,10 +322,10 @@ def main():
         
         if not passed:
             all_passed = False
-            print(f"  - Syntax: {'✅' if result['syntax'] else '❌'}")
-            print(f"  - Imports: {'✅' if result['imports'] else '❌'}")
-            print(f"  - Basic: {'✅' if result['basic'] else '❌'}")
-            print(f"  - CLI: {'✅' if result['cli'] else '❌'}")
+            print(f"  - Syntax: {_status(result['syntax'], '✅', '❌', '⏭️')}")
+            print(f"  - Imports: {_status(result['imports'], '✅', '❌', '⏭️')}")
+            print(f"  - Basic: {_status(result['basic'], '✅', '❌', '⏭️')}")
+            print(f"  - CLI: {_status(result['cli'], '✅', '❌', '⏭️')}")
     
     if all_passed:
         print(f"\n🎉 All Python versions passed all tests!")
@@ -4,31 +4,36 @@ Simple test script to verify codebase compatibility with the current Python vers
 """
 
 import sys
-import subprocess
+import functools
 import importlib
 import os
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+# Shared with the multi-version runner so the two lists cannot drift apart
+from test_all_python_versions import BASIC_CHECKS, MODULES_TO_TEST
+
+# Directories never searched for Python sources
+SKIP_DIRS = frozenset({'venv', '.venv', '.git', '__pycache__', 'node_modules'})
+
+@functools.lru_cache(maxsize=1)
+def _discover_python_files():
+    """Walk the tree once for .py files, pruning skipped directories before descending."""
+    python_files = []
+    for root, dirs, files in os.walk('.'):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        python_files.extend(os.path.join(root, name) for name in files if name.endswith('.py'))
+    return python_files
 
 def test_imports():
-    """Test that all modules can be imported successfully."""
+    """Test that all modules can be imported successfully; returns (failures, loaded modules)."""
     print("Testing module imports...")
     
-    # List of modules to test
-    modules_to_test = [
-        'src.config',
-        'src.gitlab_client',
-        'src.github_client', 
-        'src.repository_manager',
-        'src.composer_manager',
-        'src.services',
-        'cli'
-    ]
-    
     failed_imports = []
+    loaded_modules = {}
     
-    for module_name in modules_to_test:
+    for module_name in MODULES_TO_TEST:
         try:
-            importlib.import_module(module_name)
+            loaded_modules[module_name] = importlib.import_module(module_name)
             print(f"✅ {module_name}")
         except ImportError as e:
             print(f"❌ {module_name}: {e}")
@@ -37,35 +42,27 @@ def test_imports():
             print(f"⚠️  {module_name}: {e}")
             failed_imports.append((module_name, e))
     
-    return failed_imports
+    return failed_imports, loaded_modules
+
+def _require(loaded_modules, module_name, *names):
+    """Look names up on a module from test_imports, importing it only if that did not."""
+    module = loaded_modules.get(module_name) or importlib.import_module(module_name)
+    return [getattr(module, name) for name in names]
 
-def test_basic_functionality():
-    """Test basic functionality without external dependencies."""
+def test_basic_functionality(loaded_modules=None):
+    """Test basic functionality without external dependencies, reusing modules loaded by test_imports."""
     print("\nTesting basic functionality...")
+    loaded_modules = loaded_modules or {}
     
     try:
-        # Test config loading
-        from src.config import config_manager
-        config = config_manager.load_config()
-        print("✅ Config loading")
-        
-        # Test dataclass imports
-        from src.config import GitLabConfig, GitHubConfig, ComposerConfig
-        print("✅ Dataclass imports")
-        
-        # Test client imports
-        from src.gitlab_client import GitLabClient
-        from src.github_client import GitHubClient
-        print("✅ Client class imports")
-        
-        # Test manager imports
-        from src.repository_manager import RepositoryManager
-        from src.composer_manager import ComposerManager
-        print("✅ Manager class imports")
-        
-        # Test services import
-        from src.services import UserRepositoryService, GroupRepositoryService, ComposerService, GitHubUserService, GitHubOrganizationService
-        print("✅ Service class imports")
+        for label, names in BASIC_CHECKS:
+            for module_name, attr in names:
+                _require(loaded_modules, module_name, attr)
+            if label == "Config loading":
+                # load_config memoizes, so this parses config.yml at most once
+                config_manager, = _require(loaded_modules, 'src.config', 'config_manager')
+                config_manager.load_config()
+            print(f"✅ {label}")
         
         return True
     except Exception as e:
@@ -77,51 +74,50 @@ def test_cli_help():
     print("\nTesting CLI help...")
     
     try:
-        result = subprocess.run(
-            [sys.executable, 'cli.py', '--help'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        # Invoke the click group in-process: same check, without starting another interpreter
+        from click.testing import CliRunner
+        from cli import cli
+        result = CliRunner().invoke(cli, ['--help'])
         
-        if result.returncode == 0:
+        if result.exit_code == 0:
             print("✅ CLI help command works")
             return True
         else:
-            print(f"❌ CLI help failed: {result.stderr}")
+            print(f"❌ CLI help failed: {result.output}{result.exception or ''}")
             return False
-    except subprocess.TimeoutExpired:
-        print("❌ CLI help timed out")
-        return False
     except Exception as e:
         print(f"❌ CLI help error: {e}")
         return False
 
+def _compile_source(file_path):
+    """Compile one file without writing bytecode; returns the error raised, or None."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            compile(f.read(), file_path, 'exec')
+        return None
+    except Exception as e:
+        return e
+
 def test_syntax():
     """Test Python syntax for all Python files."""
     print("\nTesting Python syntax...")
     
-    python_files = []
-    for root, dirs, files in os.walk('.'):
-        if 'venv' in root or '.git' in root or '__pycache__' in root:
-            continue
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
+    python_files = _discover_python_files()
     
     syntax_errors = []
     
-    for file_path in python_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                compile(f.read(), file_path, 'exec')
-            print(f"✅ {file_path}")
-        except SyntaxError as e:
-            print(f"❌ {file_path}: {e}")
-            syntax_errors.append((file_path, e))
-        except Exception as e:
-            print(f"⚠️  {file_path}: {e}")
-            syntax_errors.append((file_path, e))
+    # Parsing holds the GIL, so spread the files over one process per core
+    with ProcessPoolExecutor() as executor:
+        chunksize = max(1, len(python_files) // (4 * (os.cpu_count() or 1)))
+        for file_path, error in zip(python_files, executor.map(_compile_source, python_files, chunksize=chunksize)):
+            if error is None:
+                print(f"✅ {file_path}")
+            elif isinstance(error, SyntaxError):
+                print(f"❌ {file_path}: {error}")
+                syntax_errors.append((file_path, error))
+            else:
+                print(f"⚠️  {file_path}: {error}")
+                syntax_errors.append((file_path, error))
     
     return syntax_errors
 
@@ -165,10 +161,10 @@ def main():
     dep_errors = test_dependencies()
     
     # Test imports
-    import_errors = test_imports()
+    import_errors, loaded_modules = test_imports()
     
     # Test basic functionality
-    basic_ok = test_basic_functionality()
+    basic_ok = test_basic_functionality(loaded_modules)
     
     # Test CLI
     cli_ok = test_cli_help()
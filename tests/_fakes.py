@@ -0,0 +1,27 @@
+import json
+from types import SimpleNamespace
+
+import requests
+
+
+def fake_response(body=None, status_code=200, headers=None, links=None, error=None):
+    """A plain stand-in for requests.Response with just the attributes the clients read
+    
+    body is served JSON-encoded through .content, which decode_json parses, and
+    raise_for_status() raises error when one is given. An HTTPError created
+    without a response gets this one attached, as requests would do.
+    """
+    def raise_for_status():
+        if error is not None:
+            raise error
+    
+    response = SimpleNamespace(
+        status_code=status_code,
+        headers=headers or {},
+        links=links or {},
+        content=json.dumps(body).encode(),
+        raise_for_status=raise_for_status,
+    )
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is None:
+        error.response = response
+    return response
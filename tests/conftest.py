@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.config import GitHubConfig, GitLabConfig, RepositoryConfig
+from src.github_client import GitHubClient
+from src.gitlab_client import GitLabClient
+from src.http_session import create_session
+
+
+API_FIXTURES_DIR = Path(__file__).parent / "fixtures" / "api"
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-integration", action="store_true", default=False,
+                     help="also run tests marked integration (skipped by default)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="integration test; use --run-integration to run it")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path_factory, monkeypatch):
+    """Keep config parse caches and composer update state out of the real home directory"""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path_factory.mktemp('cache')))
+
+
+@pytest.fixture(scope='session')
+def http_session():
+    """One pooled requests session for every client built by the tests
+    
+    Services stay per test, since tests stub their clients; only the session is shared.
+    """
+    session = create_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def gitlab_config():
+    """A fresh GitLab configuration per test, since the config dataclasses are mutable"""
+    return GitLabConfig(url="https://gitlab.com", private_token="test-token")
+
+
+@pytest.fixture
+def github_config():
+    """A fresh GitHub configuration per test"""
+    return GitHubConfig(access_token="test-token", url="https://api.github.com")
+
+
+@pytest.fixture
+def repo_config():
+    """A fresh repository configuration per test"""
+    return RepositoryConfig(repo_dir="/test/repos", max_concurrent_downloads=5)
+
+
+@pytest.fixture(scope='session')
+def api_fixtures():
+    """Canned API payloads from tests/fixtures/api, keyed by dotted path (github/user.json -> 'github.user')"""
+    return {
+        ".".join(path.relative_to(API_FIXTURES_DIR).with_suffix("").parts): json.loads(path.read_bytes())
+        for path in API_FIXTURES_DIR.rglob("*.json")
+    }
+
+
+@pytest.fixture(scope='module')
+def github_client(http_session):
+    """One GitHubClient per test module; tests patch requests.Session.get rather than touching it"""
+    return GitHubClient(GitHubConfig(access_token="test-token", url="https://api.github.com"), http_session)
+
+
+@pytest.fixture(scope='module')
+def gitlab_client(http_session):
+    """One GitLabClient per test module; tests patch requests.Session.get rather than touching it"""
+    return GitLabClient(GitLabConfig(url="https://gitlab.com", private_token="test-token"), http_session)
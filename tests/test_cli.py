@@ -1,7 +1,28 @@
-from unittest.mock import patch, Mock
+import concurrent.futures
+import logging
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch
 import click
+import pytest
+from click.shell_completion import ShellComplete
 from click.testing import CliRunner
 from cli import cli
+from src.commands.configuration import _generator
+
+
+@pytest.fixture(scope='class')
+def runner():
+    """One CliRunner shared by every test in a class"""
+    return CliRunner()
+
+
+@pytest.fixture
+def configs():
+    """Patch the config classes the commands load; each from_config returns a MagicMock"""
+    names = ('GitLabConfig', 'GitHubConfig', 'RepositoryConfig', 'GroupConfig')
+    with ExitStack() as stack:
+        yield SimpleNamespace(**{name: stack.enter_context(patch(f'src.config.{name}')) for name in names})
 
 
 class TestCLI:
@@ -9,170 +30,117 @@ class TestCLI:
     
     def setup_method(self):
         """Set up test fixtures"""
-        self.runner = CliRunner()
+        _generator.cache_clear()
     
-    def test_cli_help(self):
+    def test_cli_help(self, runner):
         """Test CLI help command"""
-        result = self.runner.invoke(cli, ['--help'])
+        result = runner.invoke(cli, ['--help'])
         assert result.exit_code == 0
         assert "Usage:" in result.output
     
-    @patch('cli.UserRepositoryService')
-    @patch('cli.GitLabConfig')
-    @patch('cli.RepositoryConfig')
-    def test_clone_user_command(self, mock_repo_config, mock_gitlab_config, mock_service):
-        """Test clone-user command"""
-        # Mock configurations
-        mock_gitlab_config.from_config.return_value = Mock()
-        mock_repo_config.from_config.return_value = Mock()
-        
-        # Mock service
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
-        
-        result = self.runner.invoke(cli, ['clone-user'])
-        assert result.exit_code == 0
-    
-    @patch('cli.GroupRepositoryService')
-    @patch('cli.GitLabConfig')
-    @patch('cli.RepositoryConfig')
-    @patch('cli.GroupConfig')
-    def test_clone_groups_command(self, mock_group_config, mock_repo_config, mock_gitlab_config, mock_service):
-        """Test clone-groups command"""
-        # Mock configurations
-        mock_gitlab_config.from_config.return_value = Mock()
-        mock_repo_config.from_config.return_value = Mock()
-        mock_group_config.from_config.return_value = Mock()
+    def test_command_help_does_not_load_config(self, runner):
+        """Test that --help exits before any configuration is read"""
+        with patch('src.config.ConfigManager.load_config') as mock_load:
+            for command in cli.list_commands(None):
+                result = runner.invoke(cli, [command, '--help'])
+                assert result.exit_code == 0
         
-        # Mock service
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
-        
-        result = self.runner.invoke(cli, ['clone-groups'])
-        assert result.exit_code == 0
+        mock_load.assert_not_called()
     
-    @patch('cli.GitHubUserService')
-    @patch('cli.GitHubConfig')
-    @patch('cli.RepositoryConfig')
-    def test_clone_github_user_command(self, mock_repo_config, mock_github_config, mock_service):
-        """Test clone-github-user command"""
-        # Mock configurations
-        mock_github_config.from_config.return_value = Mock()
-        mock_repo_config.from_config.return_value = Mock()
+    def test_shell_completion_does_not_load_config(self):
+        """Test that completing commands and their options resolves them without running them"""
+        completion = ShellComplete(cli, {}, 'git-repo-manager', '_GIT_REPO_MANAGER_COMPLETE')
+        with patch('src.config.ConfigManager.load_config') as mock_load:
+            commands = [item.value for item in completion.get_completions([], 'clone-g')]
+            options = [item.value for item in completion.get_completions(['clone-user'], '--')]
         
-        # Mock service
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
-        
-        result = self.runner.invoke(cli, ['clone-github-user'])
-        assert result.exit_code == 0
+        assert commands == ['clone-github-org', 'clone-github-user', 'clone-groups']
+        assert '--output-dir' in options
+        mock_load.assert_not_called()
     
-    @patch('cli.GitHubOrganizationService')
-    @patch('cli.GitHubConfig')
-    @patch('cli.RepositoryConfig')
-    def test_clone_github_org_command(self, mock_repo_config, mock_github_config, mock_service):
-        """Test clone-github-org command"""
-        # Mock configurations
-        mock_github_config.from_config.return_value = Mock()
-        mock_repo_config.from_config.return_value = Mock()
+    def test_worker_log_messages_are_flushed(self, runner, configs):
+        """Test that progress logged from worker threads reaches stdout before the command returns"""
+        def clone_user_repositories(*args, **kwargs):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                for i in range(20):
+                    executor.submit(logging.getLogger('src.repository_manager').info, "  Processing 'repo%d': Cloning...", i)
+            logging.getLogger('src.repository_manager').info("--- All projects processed! ---")
         
-        # Mock service
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
-        
-        result = self.runner.invoke(cli, ['clone-github-org', 'testorg'])
-        assert result.exit_code == 0
+        with patch('src.services.UserRepositoryService') as mock_service:
+            mock_service.return_value.clone_user_repositories.side_effect = clone_user_repositories
+            
+            result = runner.invoke(cli, ['clone-user'])
+            assert result.exit_code == 0
+            assert result.output.count("Processing") == 20
+            # Messages are written bare, without a LEVEL:logger: prefix, and all
+            # progress shares the one queue, so the command's banner comes first
+            # and the summary logged after the pool has finished comes last
+            lines = result.output.splitlines()
+            assert "  Processing 'repo0': Cloning..." in lines
+            assert lines[0] == "🚀 Starting user repository cloning process..."
+            assert lines[-1] == "--- All projects processed! ---"
+            
+            result = runner.invoke(cli, ['--log-level', 'WARNING', 'clone-user'])
+            assert "Processing" not in result.output
     
-    @patch('cli.ComposerService')
-    def test_update_composer_command(self, mock_service):
-        """Test update-composer command"""
-        # Mock service
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
-        
-        result = self.runner.invoke(cli, ['update-composer'])
+    @pytest.mark.parametrize('args, target', [
+        (['clone-user'], 'src.services.UserRepositoryService'),
+        (['clone-groups'], 'src.services.GroupRepositoryService'),
+        (['clone-github-user'], 'src.services.GitHubUserService'),
+        (['clone-github-org', 'testorg'], 'src.services.GitHubOrganizationService'),
+        (['update-composer'], 'src.services.ComposerService'),
+        (['init-config'], 'src.config_generator.ConfigGenerator'),
+        (['init-config', '--non-interactive'], 'src.config_generator.ConfigGenerator'),
+        (['config-info'], 'src.config_generator.ConfigGenerator'),
+        (['validate-config'], 'src.config_generator.ConfigGenerator'),
+    ])
+    def test_command(self, runner, configs, args, target):
+        """Test that each command runs against its patched service or generator"""
+        with patch(target):
+            result = runner.invoke(cli, args)
         assert result.exit_code == 0
     
-    @patch('cli.ConfigGenerator')
-    def test_init_config_command(self, mock_generator):
-        """Test init-config command"""
-        # Mock generator
-        mock_generator_instance = Mock()
-        mock_generator.return_value = mock_generator_instance
-        
-        result = self.runner.invoke(cli, ['init-config'])
+    def test_clone_user_with_options(self, runner, configs):
+        """Test clone-user command with options"""
+        with patch('src.services.UserRepositoryService'):
+            result = runner.invoke(cli, [
+                'clone-user',
+                '--gitlab-url', 'https://gitlab.company.com',
+                '--token', 'custom-token',
+                '--repo-dir', '/custom/path',
+                '--max-workers', '10'
+            ])
         assert result.exit_code == 0
+        assert configs.RepositoryConfig.from_config.return_value.max_concurrent_downloads == 10
     
-    @patch('cli.ConfigGenerator')
-    def test_init_config_non_interactive_command(self, mock_generator):
-        """Test init-config non-interactive command"""
-        # Mock generator
-        mock_generator_instance = Mock()
-        mock_generator.return_value = mock_generator_instance
-        
-        result = self.runner.invoke(cli, ['init-config', '--non-interactive'])
+    def test_clone_github_user_with_options(self, runner, configs):
+        """Test clone-github-user command with options"""
+        with patch('src.services.GitHubUserService'):
+            result = runner.invoke(cli, [
+                'clone-github-user',
+                '--username', 'testuser',
+                '--github-url', 'https://api.github.com',
+                '--token', 'custom-token',
+                '--repo-dir', '/custom/path',
+                '--max-workers', '10'
+            ])
         assert result.exit_code == 0
+        assert configs.GitHubConfig.from_config.return_value.access_token == 'custom-token'
+
+
+class TestApplyOverrides:
+    """Test CLI option override helper"""
     
-    @patch('cli.ConfigGenerator')
-    def test_config_info_command(self, mock_generator):
-        """Test config-info command"""
-        # Mock generator
-        mock_generator_instance = Mock()
-        mock_generator.return_value = mock_generator_instance
+    def test_only_set_options_are_applied(self):
+        """Test that unset (None/empty) options keep the configured values"""
+        from src.commands import apply_overrides
+        from src.config import RepositoryConfig, GroupConfig
         
-        result = self.runner.invoke(cli, ['config-info'])
-        assert result.exit_code == 0
-    
-    @patch('cli.ConfigGenerator')
-    def test_validate_config_command(self, mock_generator):
-        """Test validate-config command"""
-        # Mock generator
-        mock_generator_instance = Mock()
-        mock_generator_instance.validate_config.return_value = True
-        mock_generator.return_value = mock_generator_instance
+        repo_config = RepositoryConfig(repo_dir="/configured", max_concurrent_downloads=5)
+        apply_overrides(repo_config, repo_dir=None, max_concurrent_downloads=10)
+        assert repo_config.repo_dir == "/configured"
+        assert repo_config.max_concurrent_downloads == 10
         
-        result = self.runner.invoke(cli, ['validate-config'])
-        assert result.exit_code == 0
-    
-    def test_clone_user_with_options(self):
-        """Test clone-user command with options"""
-        with patch('cli.UserRepositoryService') as mock_service:
-            mock_service_instance = Mock()
-            mock_service.return_value = mock_service_instance
-            
-            with patch('cli.GitLabConfig') as mock_gitlab_config:
-                mock_gitlab_config.from_config.return_value = Mock()
-                
-                with patch('cli.RepositoryConfig') as mock_repo_config:
-                    mock_repo_config.from_config.return_value = Mock()
-                    
-                    result = self.runner.invoke(cli, [
-                        'clone-user',
-                        '--gitlab-url', 'https://gitlab.company.com',
-                        '--token', 'custom-token',
-                        '--repo-dir', '/custom/path',
-                        '--max-workers', '10'
-                    ])
-                    assert result.exit_code == 0
-    
-    def test_clone_github_user_with_options(self):
-        """Test clone-github-user command with options"""
-        with patch('cli.GitHubUserService') as mock_service:
-            mock_service_instance = Mock()
-            mock_service.return_value = mock_service_instance
-            
-            with patch('cli.GitHubConfig') as mock_github_config:
-                mock_github_config.from_config.return_value = Mock()
-                
-                with patch('cli.RepositoryConfig') as mock_repo_config:
-                    mock_repo_config.from_config.return_value = Mock()
-                    
-                    result = self.runner.invoke(cli, [
-                        'clone-github-user',
-                        '--username', 'testuser',
-                        '--github-url', 'https://api.github.com',
-                        '--token', 'custom-token',
-                        '--repo-dir', '/custom/path',
-                        '--max-workers', '10'
-                    ])
-                    assert result.exit_code == 0 
\ No newline at end of file
+        group_config = GroupConfig(target_group_ids=[1, 2])
+        apply_overrides(group_config, target_group_ids=list(()))
+        assert group_config.target_group_ids == [1, 2]
@@ -0,0 +1,158 @@
+import subprocess
+import pytest
+from unittest.mock import patch, Mock
+from src.composer_manager import ComposerManager, _iter_composer_dirs, _resolve_composer_command
+
+
+def _make_project(path):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "composer.json").write_text("{}")
+
+
+class TestIterComposerDirs:
+    """Test composer.json discovery"""
+    
+    def test_finds_nested_projects(self, tmp_path):
+        """Test that projects at any depth are found, including the root"""
+        _make_project(tmp_path)
+        _make_project(tmp_path / "group" / "project1")
+        _make_project(tmp_path / "group" / "sub" / "project2")
+        (tmp_path / "empty").mkdir()
+        
+        found = set(_iter_composer_dirs(str(tmp_path)))
+        assert found == {
+            str(tmp_path),
+            str(tmp_path / "group" / "project1"),
+            str(tmp_path / "group" / "sub" / "project2"),
+        }
+    
+    def test_skips_vendor_and_vcs_dirs(self, tmp_path):
+        """Test that dependency, cache and VCS directories are not searched"""
+        _make_project(tmp_path / "project")
+        _make_project(tmp_path / "project" / "vendor" / "acme" / "lib")
+        _make_project(tmp_path / "project" / "node_modules" / "pkg")
+        _make_project(tmp_path / ".git" / "hooks")
+        _make_project(tmp_path / "project" / ".venv" / "share")
+        _make_project(tmp_path / "project" / "__pycache__")
+        
+        assert list(_iter_composer_dirs(str(tmp_path))) == [str(tmp_path / "project")]
+
+
+class TestResolveComposerCommand:
+    """Test composer executable lookup"""
+    
+    def setup_method(self):
+        _resolve_composer_command.cache_clear()
+    
+    def teardown_method(self):
+        _resolve_composer_command.cache_clear()
+    
+    def test_returns_first_match_on_path(self):
+        """Test that the first candidate found on PATH is used and cached"""
+        def which(cmd):
+            return '/usr/local/bin/composer.bat' if cmd == 'composer.bat' else None
+        
+        with patch('src.composer_manager.shutil.which', side_effect=which) as mock_which:
+            assert _resolve_composer_command() == '/usr/local/bin/composer.bat'
+            assert _resolve_composer_command() == '/usr/local/bin/composer.bat'
+        
+        assert mock_which.call_count == 2
+    
+    def test_raises_when_not_installed(self):
+        """Test that a missing composer raises FileNotFoundError"""
+        with patch('src.composer_manager.shutil.which', return_value=None):
+            with pytest.raises(FileNotFoundError):
+                _resolve_composer_command()
+
+
+class TestComposerManager:
+    """Test ComposerManager class"""
+    
+    @patch.object(ComposerManager, '_find_composer_command', return_value='composer')
+    def test_find_and_update_runs_in_project_dir(self, mock_find, tmp_path):
+        """Test that composer update runs with cwd set to each project"""
+        _make_project(tmp_path / "project")
+        manager = ComposerManager()
+        
+        with patch('src.composer_manager.subprocess.run', return_value=Mock(stdout="", stderr="")) as mock_run:
+            manager.find_and_update_composer(str(tmp_path))
+        
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ['composer', 'update']
+        assert mock_run.call_args.kwargs['cwd'] == str(tmp_path / "project")
+    
+    @patch.object(ComposerManager, '_find_composer_command', return_value='composer')
+    def test_find_and_update_continues_after_failure(self, mock_find, tmp_path):
+        """Test that a failing project does not stop the others"""
+        _make_project(tmp_path / "a")
+        _make_project(tmp_path / "b")
+        manager = ComposerManager()
+        
+        error = subprocess.CalledProcessError(1, ['composer', 'update'], output="", stderr="boom")
+        with patch('src.composer_manager.subprocess.run', side_effect=[error, Mock(stdout="", stderr="")]) as mock_run:
+            manager.find_and_update_composer(str(tmp_path))
+        
+        assert mock_run.call_count == 2
+    
+    @patch.object(ComposerManager, '_find_composer_command', return_value='composer')
+    def test_find_and_update_logs_reports_in_order(self, mock_find, tmp_path, caplog):
+        """Test that concurrent updates log one whole report per project"""
+        for name in ("a", "b", "c"):
+            _make_project(tmp_path / name)
+        manager = ComposerManager(max_workers=3)
+        
+        with patch('src.composer_manager.subprocess.run', return_value=Mock(stdout="", stderr="")), \
+                caplog.at_level("INFO", logger="src.composer_manager"):
+            manager.find_and_update_composer(str(tmp_path))
+        
+        output = caplog.text
+        discovered = list(_iter_composer_dirs(str(tmp_path)))
+        positions = [output.index(f"Running 'composer update' in: {dirpath}") for dirpath in discovered]
+        assert positions == sorted(positions)
+        assert output.count("Composer update completed successfully.") == 3
+    
+    def test_single_worker_streams_output(self, tmp_path, caplog):
+        """Test that a single worker relays composer's output line by line through logging"""
+        composer = tmp_path / "composer"
+        composer.write_text("#!/bin/sh\necho \"Loading composer repositories\"\necho \"Nothing to install\"\n")
+        composer.chmod(0o755)
+        _make_project(tmp_path / "project")
+        
+        with patch.object(ComposerManager, '_find_composer_command', return_value=str(composer)), \
+                caplog.at_level("INFO", logger="src.composer_manager"):
+            ComposerManager(max_workers=1).find_and_update_composer(str(tmp_path / "project"))
+        
+        messages = caplog.messages
+        start = messages.index("Loading composer repositories")
+        assert messages[start - 1].endswith(f"Running 'composer update' in: {tmp_path / 'project'}")
+        assert messages[start + 1] == "Nothing to install"
+        assert messages[start + 2] == "Composer update completed successfully."
+    
+    @patch.object(ComposerManager, '_find_composer_command', return_value='composer')
+    def test_unchanged_project_is_skipped(self, mock_find, tmp_path):
+        """Test that a second run skips projects whose composer files did not change"""
+        _make_project(tmp_path / "project")
+        (tmp_path / "project" / "vendor").mkdir()
+        
+        with patch('src.composer_manager.subprocess.run', return_value=Mock(stdout="", stderr="")) as mock_run:
+            ComposerManager().find_and_update_composer(str(tmp_path))
+            ComposerManager().find_and_update_composer(str(tmp_path))
+            assert mock_run.call_count == 1
+            
+            (tmp_path / "project" / "composer.json").write_text('{"require": {}}')
+            ComposerManager().find_and_update_composer(str(tmp_path))
+            assert mock_run.call_count == 2
+    
+    @patch.object(ComposerManager, '_find_composer_command', return_value='composer')
+    def test_force_and_missing_vendor_bypass_skip(self, mock_find, tmp_path):
+        """Test that force, or a project without installed dependencies, always updates"""
+        _make_project(tmp_path / "project")
+        
+        with patch('src.composer_manager.subprocess.run', return_value=Mock(stdout="", stderr="")) as mock_run:
+            ComposerManager().find_and_update_composer(str(tmp_path))
+            ComposerManager().find_and_update_composer(str(tmp_path))
+            assert mock_run.call_count == 2
+            
+            (tmp_path / "project" / "vendor").mkdir()
+            ComposerManager(force=True).find_and_update_composer(str(tmp_path))
+            assert mock_run.call_count == 3
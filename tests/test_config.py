@@ -1,10 +1,14 @@
 import os
+import subprocess
+import sys
 import tempfile
 import pytest
+import yaml
+from pathlib import Path
 from unittest.mock import patch, mock_open
 from src.config import (
     GitLabConfig, RepositoryConfig, GroupConfig, ComposerConfig, GitHubConfig,
-    ConfigManager
+    ConfigManager, _parse_yaml_file, default_max_workers, load_yaml_file
 )
 
 
@@ -17,6 +21,14 @@ class TestGitLabConfig:
         assert config.url == "https://gitlab.com"
         assert config.private_token == "test-token"
     
+    def test_config_classes_use_slots(self):
+        """Test that config records carry no per-instance __dict__"""
+        config = GitLabConfig(url="https://gitlab.com", private_token="test-token")
+        
+        assert not hasattr(config, '__dict__')
+        with pytest.raises(AttributeError):
+            config.unknown_option = True
+    
     def test_gitlab_config_from_env(self):
         """Test creating GitLabConfig from environment variables"""
         with patch.dict(os.environ, {
@@ -113,6 +125,28 @@ class TestRepositoryConfig:
             config = RepositoryConfig.from_config()
             assert config.repo_dir == "/config/path"
             assert config.max_concurrent_downloads == 20
+    
+    def test_repository_config_cwd_only_as_fallback(self):
+        """Test that the working directory is looked up only when repo_dir is unset"""
+        with patch('src.config.os.getcwd', return_value='/cwd') as mock_getcwd:
+            with patch('src.config.config_manager.load_config', return_value={'repository': {'repo_dir': '/config/path'}}):
+                assert RepositoryConfig.from_config().repo_dir == "/config/path"
+            mock_getcwd.assert_not_called()
+            
+            with patch('src.config.config_manager.load_config', return_value={'repository': {}}):
+                assert RepositoryConfig.from_config().repo_dir == "/cwd"
+    
+    def test_repository_config_defaults_workers_to_cpu_count(self):
+        """Test that an unset worker count scales with the CPUs and defaults to threads"""
+        with patch('src.config.os.cpu_count', return_value=16):
+            with patch('src.config.config_manager.load_config', return_value={'repository': {'repo_dir': '/config/path'}}):
+                config = RepositoryConfig.from_config()
+        
+        assert config.max_concurrent_downloads == 12
+        assert config.executor == "thread"
+        
+        with patch('src.config.os.cpu_count', return_value=2):
+            assert default_max_workers() == 4
 
 
 class TestGroupConfig:
@@ -205,6 +239,17 @@ class TestConfigManager:
             assert merged_config['repository']['repo_dir'] == 'new-dir'
             assert merged_config['repository']['max_concurrent_downloads'] == 10
     
+    def test_merge_with_env_without_overrides(self):
+        """Test that the config is returned untouched when no override variables are set"""
+        manager = ConfigManager()
+        config = {'gitlab': {'url': 'old-url', 'private_token': 'old-token'}}
+        
+        with patch.dict(os.environ, {'UNRELATED': 'value'}, clear=True):
+            merged_config = manager._merge_with_env(config)
+        
+        assert merged_config is config
+        assert merged_config['gitlab'] == {'url': 'old-url', 'private_token': 'old-token'}
+    
     def test_load_config_file_exists(self):
         """Test loading configuration from existing file"""
         mock_config_data = {
@@ -231,4 +276,103 @@ class TestConfigManager:
             assert 'github' in config
             assert 'repository' in config
             assert 'groups' in config
-            assert 'composer' in config 
\ No newline at end of file
+            assert 'composer' in config 
+    
+    def test_load_config_parses_file_once(self, tmp_path):
+        """Test that managers reading the same unchanged file share one parse"""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("groups:\n  target_group_ids: [1, 2]\n")
+        
+        with patch('yaml.load', wraps=yaml.load) as mock_load:
+            first = ConfigManager(str(config_file)).load_config()
+            second = ConfigManager(str(config_file)).load_config()
+        
+        assert mock_load.call_count == 1
+        assert first == second == {'groups': {'target_group_ids': [1, 2]}}
+        assert first is not second
+    
+    def test_flush_cache_picks_up_environment_changes(self, tmp_path):
+        """Test that load_config is memoized until flush_cache is called"""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("gitlab:\n  url: file-url\n")
+        manager = ConfigManager(str(config_file))
+        
+        with patch.dict(os.environ, {'GITLAB_URL': 'env-url'}):
+            first = manager.load_config()
+            assert first['gitlab']['url'] == 'env-url'
+        
+        assert manager.load_config() is first
+        manager.flush_cache()
+        assert manager.load_config()['gitlab']['url'] == 'file-url'
+    
+    def test_section_tolerates_missing_and_empty_sections(self, tmp_path):
+        """Test that absent or empty sections come back as empty dicts"""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("github:\ngroups:\n  target_group_ids: [1]\n")
+        manager = ConfigManager(str(config_file))
+        
+        assert manager.section('groups') == {'target_group_ids': [1]}
+        assert manager.section('github') == {}
+        assert manager.section('composer') == {}
+    
+    def test_load_config_uses_disk_cache_across_processes(self, tmp_path):
+        """Test that a fresh process reads the pickled parse instead of the YAML"""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("groups:\n  target_group_ids: [1, 2]\n")
+        ConfigManager(str(config_file)).load_config()
+        
+        # Simulate a new process: the in-memory cache is empty, the disk cache is not
+        _parse_yaml_file.cache_clear()
+        with patch('yaml.load') as mock_load:
+            config = ConfigManager(str(config_file)).load_config()
+        
+        mock_load.assert_not_called()
+        assert config == {'groups': {'target_group_ids': [1, 2]}}
+    
+    def test_disk_cache_is_private(self, tmp_path):
+        """Test that the pickled config, which holds API tokens, is readable by the user only"""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("gitlab:\n  private_token: SECRET123\n")
+        ConfigManager(str(config_file)).load_config()
+        
+        cache_dir = Path(os.environ['XDG_CACHE_HOME']) / 'git-repo-manager'
+        (cache_file,) = cache_dir.glob('config-*.pickle')
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+        assert not list(cache_dir.glob('*.tmp'))
+    
+    def test_warm_cache_does_not_import_yaml(self, tmp_path):
+        """Test that a fresh process loading a cached config never imports yaml"""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("groups:\n  target_group_ids: [1, 2]\n")
+        ConfigManager(str(config_file)).load_config()
+        
+        script = (
+            "import sys\n"
+            "from src.config import ConfigManager\n"
+            f"config = ConfigManager({str(config_file)!r}).load_config()\n"
+            "assert config == {'groups': {'target_group_ids': [1, 2]}}, config\n"
+            "assert 'yaml' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], cwd=Path(__file__).parent.parent,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+    
+    def test_load_yaml_file_returns_a_copy(self, tmp_path):
+        """Test that changing a loaded config does not leak into later loads of the cached parse"""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("groups:\n  target_group_ids: [1, 2]\n")
+        
+        load_yaml_file(str(config_file))['groups']['target_group_ids'].append(3)
+        
+        assert load_yaml_file(str(config_file)) == {'groups': {'target_group_ids': [1, 2]}}
+        assert ConfigManager(str(config_file)).section('groups') == {'target_group_ids': [1, 2]}
+    
+    def test_load_config_reparses_changed_file(self, tmp_path):
+        """Test that editing the config file invalidates the parse cache"""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("groups:\n  target_group_ids: [1]\n")
+        assert ConfigManager(str(config_file)).load_config()['groups']['target_group_ids'] == [1]
+        
+        config_file.write_text("groups:\n  target_group_ids: [1, 2, 3]\n")
+        assert ConfigManager(str(config_file)).load_config()['groups']['target_group_ids'] == [1, 2, 3]
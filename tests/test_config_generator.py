@@ -0,0 +1,54 @@
+import yaml
+from unittest.mock import patch
+from src.config_generator import ConfigGenerator
+
+
+class TestGenerateConfig:
+    """Test writing the generated config file"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.generator = ConfigGenerator()
+    
+    def test_writes_config_atomically(self, tmp_path):
+        """Test that the config is renamed into place and no temporary file is left"""
+        self.generator.config_path = tmp_path / "config.yml"
+        
+        assert self.generator.generate_config(interactive=False)
+        
+        with open(self.generator.config_path, encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        assert list(data) == ['gitlab', 'repository', 'groups', 'composer']
+        assert list(tmp_path.iterdir()) == [self.generator.config_path]
+    
+    def test_failed_write_keeps_existing_config(self, tmp_path):
+        """Test that an error while dumping leaves the previous config untouched"""
+        self.generator.config_path = tmp_path / "config.yml"
+        self.generator.config_path.write_text("gitlab: {}\n", encoding='utf-8')
+        
+        with patch('yaml.dump', side_effect=yaml.YAMLError("boom")):
+            assert not self.generator.generate_config(force=True, interactive=False)
+        
+        assert self.generator.config_path.read_text(encoding='utf-8') == "gitlab: {}\n"
+        assert list(tmp_path.iterdir()) == [self.generator.config_path]
+    
+    def test_overwritten_config_stays_private(self, tmp_path):
+        """Test that --force on a user-only config does not widen its permissions"""
+        self.generator.config_path = tmp_path / "config.yml"
+        self.generator.config_path.write_text("gitlab: {private_token: SECRET123}\n", encoding='utf-8')
+        self.generator.config_path.chmod(0o600)
+        
+        assert self.generator.generate_config(force=True, interactive=False)
+        
+        assert self.generator.config_path.stat().st_mode & 0o777 == 0o600
+    
+    def test_existing_config_is_reported_through_logging(self, tmp_path, caplog):
+        """Test that refusing to overwrite an existing config is logged as a warning"""
+        self.generator.config_path = tmp_path / "config.yml"
+        self.generator.config_path.write_text("gitlab: {}\n", encoding='utf-8')
+        
+        with caplog.at_level("WARNING", logger="src.config_generator"):
+            assert not self.generator.generate_config(interactive=False)
+        
+        assert caplog.records[0].levelname == "WARNING"
+        assert "Config file already exists" in caplog.records[0].getMessage()
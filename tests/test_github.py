@@ -1,92 +1,49 @@
-#!/usr/bin/env python3
 """
-Simple test script for GitHub functionality
+Live checks of the GitHub functionality against the real API
+
+The tests that talk to GitHub are skipped unless GITHUB_ACCESS_TOKEN is set.
 """
 
 import os
-import sys
+import pytest
 from src.config import GitHubConfig, RepositoryConfig
 from src.github_client import GitHubClient
 from src.services import GitHubUserService, GitHubOrganizationService
 
 
-def test_github_config():
-    """Test GitHub configuration loading"""
-    print("Testing GitHub configuration...")
-    
-    # Test from environment
-    config = GitHubConfig.from_env()
-    print(f"GitHub URL: {config.url}")
-    print(f"Token configured: {'Yes' if config.access_token else 'No'}")
-    
-    # Test from config file
-    try:
-        config = GitHubConfig.from_config()
-        print(f"Config file - GitHub URL: {config.url}")
-        print(f"Config file - Token configured: {'Yes' if config.access_token else 'No'}")
-    except Exception as e:
-        print(f"Config file error: {e}")
+requires_token = pytest.mark.skipif(not os.getenv('GITHUB_ACCESS_TOKEN'), reason="GITHUB_ACCESS_TOKEN is not set")
 
 
-def test_github_client():
-    """Test GitHub client functionality"""
-    print("\nTesting GitHub client...")
-    
-    config = GitHubConfig.from_env()
-    if not config.access_token:
-        print("No GitHub token found. Skipping client tests.")
-        return
-    
-    client = GitHubClient(config)
-    
-    try:
-        # Test current user
-        user = client.get_current_user()
-        print(f"Authenticated as: {user.get('login', 'Unknown')}")
-        
-        # Test user repositories (limit to first few)
-        repos = client.get_user_repositories(user['login'])
-        print(f"Found {len(repos)} repositories for user {user['login']}")
-        
-        if repos:
-            print("Sample repositories:")
-            for repo in repos[:3]:
-                print(f"  - {repo['full_name']}: {repo['clone_url']}")
-                
-    except Exception as e:
-        print(f"GitHub client test failed: {e}")
+@pytest.fixture(scope='module')
+def github_config():
+    """GitHub configuration read from the environment once per module"""
+    return GitHubConfig.from_env()
 
 
-def test_github_services():
-    """Test GitHub services"""
-    print("\nTesting GitHub services...")
-    
-    github_config = GitHubConfig.from_env()
-    repo_config = RepositoryConfig.from_env()
+def test_github_config(github_config):
+    """Test GitHub configuration loading from the environment and the config file"""
+    assert github_config.url
+    assert GitHubConfig.from_config().url
+
+
+@pytest.mark.integration
+@requires_token
+def test_github_client(github_config):
+    """Test that the token authenticates and the user's repositories can be listed"""
+    client = GitHubClient(github_config)
     
-    if not github_config.access_token:
-        print("No GitHub token found. Skipping service tests.")
-        return
+    user = client.get_current_user()
+    assert user['login']
     
-    try:
-        # Test user service
-        user_service = GitHubUserService(github_config, repo_config)
-        print("GitHubUserService created successfully")
-        
-        # Test organization service
-        org_service = GitHubOrganizationService(github_config, repo_config)
-        print("GitHubOrganizationService created successfully")
-        
-    except Exception as e:
-        print(f"Service test failed: {e}")
+    repos = client.get_user_repositories(user['login'])
+    assert all('clone_url' in repo for repo in repos)
 
 
-if __name__ == "__main__":
-    print("GitHub Functionality Test")
-    print("=" * 30)
-    
-    test_github_config()
-    test_github_client()
-    test_github_services()
+@pytest.mark.integration
+@requires_token
+def test_github_services(github_config):
+    """Test creating the GitHub services"""
+    repo_config = RepositoryConfig.from_env()
     
-    print("\nTest completed!") 
\ No newline at end of file
+    assert GitHubUserService(github_config, repo_config).github_client.config is github_config
+    assert GitHubOrganizationService(github_config, repo_config).github_client.config is github_config
@@ -1,154 +1,195 @@
-from unittest.mock import patch, Mock
-from src.github_client import GitHubClient
+import threading
+import time
+import requests
+from unittest.mock import patch
+from src.github_client import GitHubClient, GitHubAPIError, GitHubAuthError
 from src.config import GitHubConfig
 import pytest
+from tests._fakes import fake_response
 
 
 class TestGitHubClient:
     """Test GitHubClient class"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.config = GitHubConfig(
-            access_token="test-token",
-            url="https://api.github.com"
-        )
-        self.client = GitHubClient(self.config)
-    
-    def test_github_client_creation(self):
+    def test_github_client_creation(self, github_client):
         """Test creating GitHubClient instance"""
-        assert self.client.config == self.config
-        assert "Authorization" in self.client.headers
-        assert "token test-token" in self.client.headers["Authorization"]
-        assert "Accept" in self.client.headers
-        assert "application/vnd.github.v3+json" in self.client.headers["Accept"]
+        assert github_client.config == GitHubConfig(access_token="test-token", url="https://api.github.com")
+        assert "Authorization" in github_client.headers
+        assert "token test-token" in github_client.headers["Authorization"]
+        assert "Accept" in github_client.headers
+        assert "application/vnd.github.v3+json" in github_client.headers["Accept"]
+    
+    def test_clients_share_a_session(self, github_client, api_fixtures):
+        """Test that clients handed one session send every request over its connection pool"""
+        other = GitHubClient(GitHubConfig(access_token="other-token", url="https://api.github.com"), github_client.session)
+        
+        with patch.object(github_client.session, 'get', return_value=fake_response(api_fixtures["github.user"])) as mock_get:
+            github_client.get_current_user()
+            other.get_current_user()
+        
+        assert other.session is github_client.session
+        assert mock_get.call_count == 2
     
-    def test_get_current_user_success(self):
+    def test_get_current_user_success(self, github_client, api_fixtures):
         """Test successful get_current_user call"""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "id": 1,
-            "login": "testuser",
-            "name": "Test User"
-        }
-        mock_response.raise_for_status.return_value = None
-        
-        with patch('requests.get', return_value=mock_response):
-            user = self.client.get_current_user()
+        mock_response = fake_response(api_fixtures["github.user"])
+        
+        with patch('requests.Session.get', return_value=mock_response):
+            user = github_client.get_current_user()
             assert user["id"] == 1
             assert user["login"] == "testuser"
             assert user["name"] == "Test User"
     
-    def test_get_current_user_authentication_error(self):
+    def test_get_current_user_authentication_error(self, github_client):
         """Test get_current_user with authentication error"""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = Exception("401 Unauthorized")
+        mock_response = fake_response(status_code=401, error=requests.exceptions.HTTPError("401 Unauthorized"))
+        
+        with patch('requests.Session.get', return_value=mock_response):
+            with pytest.raises(GitHubAuthError):
+                github_client.get_current_user()
+    
+    def test_get_current_user_connection_error(self, github_client):
+        """Test that connection failures raise instead of exiting"""
+        with patch('requests.Session.get', side_effect=requests.exceptions.ConnectionError("refused")):
+            with pytest.raises(GitHubAPIError) as exc_info:
+                github_client.get_current_user()
         
-        with patch('requests.get', return_value=mock_response):
-            with pytest.raises(SystemExit):
-                self.client.get_current_user()
+        assert not isinstance(exc_info.value, GitHubAuthError)
     
-    def test_get_user_repositories_success(self):
+    def test_get_user_repositories_success(self, github_client):
         """Test successful get_user_repositories call"""
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response = fake_response([
             {"id": 1, "full_name": "user/repo1", "clone_url": "https://github.com/user/repo1.git"},
             {"id": 2, "full_name": "user/repo2", "clone_url": "https://github.com/user/repo2.git"}
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_response.links = {}
+        ])
         
-        with patch('requests.get', return_value=mock_response):
-            repos = self.client.get_user_repositories("testuser")
+        with patch('requests.Session.get', return_value=mock_response):
+            repos = github_client.get_user_repositories("testuser")
             assert len(repos) == 2
             assert repos[0]["full_name"] == "user/repo1"
             assert repos[1]["full_name"] == "user/repo2"
     
-    def test_get_user_repositories_pagination(self):
+    def test_get_user_repositories_logs_progress(self, github_client, caplog):
+        """Test that listing progress is reported through logging"""
+        mock_response = fake_response([{"id": 1, "full_name": "user/repo1"}])
+        
+        with patch('requests.Session.get', return_value=mock_response), caplog.at_level("INFO", logger="src.github_client"):
+            github_client.get_user_repositories("testuser")
+        
+        assert "Found 1 repositories for user 'testuser'." in caplog.messages
+    
+    def test_get_user_repositories_pagination(self, github_client):
         """Test get_user_repositories with pagination"""
-        # First page response
-        mock_response1 = Mock()
-        mock_response1.json.return_value = [{"id": 1, "full_name": "user/repo1"}]
-        mock_response1.raise_for_status.return_value = None
-        mock_response1.links = {"next": {"url": "https://api.github.com/users/testuser/repos?page=2"}}
-        
-        # Second page response
-        mock_response2 = Mock()
-        mock_response2.json.return_value = [{"id": 2, "full_name": "user/repo2"}]
-        mock_response2.raise_for_status.return_value = None
-        mock_response2.links = {}
-        
-        with patch('requests.get', side_effect=[mock_response1, mock_response2]):
-            repos = self.client.get_user_repositories("testuser")
+        mock_response1 = fake_response([{"id": 1, "full_name": "user/repo1"}],
+                                       links={"next": {"url": "https://api.github.com/users/testuser/repos?page=2"}})
+        mock_response2 = fake_response([{"id": 2, "full_name": "user/repo2"}])
+        
+        with patch('requests.Session.get', side_effect=[mock_response1, mock_response2]):
+            repos = github_client.get_user_repositories("testuser")
             assert len(repos) == 2
             assert repos[0]["full_name"] == "user/repo1"
             assert repos[1]["full_name"] == "user/repo2"
     
-    def test_get_user_repositories_not_found(self):
-        """Test get_user_repositories with user not found"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = Exception("404 Not Found")
-        
-        with patch('requests.get', return_value=mock_response):
-            repos = self.client.get_user_repositories("nonexistent")
-            assert repos == []
+    def test_get_user_repositories_fetches_known_pages_concurrently(self, github_client):
+        """Test that pages 2..last are all fetched when the Link header names the last page"""
+        def fake_get(url, **kwargs):
+            page = int(url.rsplit("page=", 1)[1])
+            return fake_response([{"id": page, "full_name": f"user/repo{page}"}], links={
+                "next": {"url": "https://api.github.com/user/1/repos?per_page=100&page=2"},
+                "last": {"url": "https://api.github.com/user/1/repos?per_page=100&page=4"},
+            } if page == 1 else None)
+        
+        with patch('requests.Session.get', side_effect=fake_get) as mock_get:
+            repos = github_client.get_user_repositories("testuser")
+        
+        assert mock_get.call_count == 4
+        assert [repo["id"] for repo in repos] == [1, 2, 3, 4]
     
-    def test_get_organization_repositories_success(self):
+    def test_get_user_repositories_page_fetches_are_bounded(self, github_client):
+        """Test that no more than max_workers pages are in flight and page order is kept"""
+        client = GitHubClient(github_client.config, github_client.session, max_workers=2)
+        lock = threading.Lock()
+        in_flight = peak = 0
+        
+        def fake_get(url, **kwargs):
+            nonlocal in_flight, peak
+            page = int(url.rsplit("page=", 1)[1])
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            # Let concurrent fetches overlap; later pages finish first
+            time.sleep(0.01 * (6 - page))
+            with lock:
+                in_flight -= 1
+            return fake_response([{"id": page}], links={
+                "last": {"url": "https://api.github.com/user/1/repos?per_page=100&page=5"},
+            } if page == 1 else None)
+        
+        with patch('requests.Session.get', side_effect=fake_get):
+            repos = client.get_user_repositories("testuser")
+        
+        assert [repo["id"] for repo in repos] == [1, 2, 3, 4, 5]
+        assert peak == 2
+    
+    def test_get_user_repositories_revalidates_with_etag(self, github_client):
+        """Test that an unchanged page is served from the cache after a 304"""
+        first = fake_response([{"id": 1, "full_name": "user/repo1"}], headers={"ETag": '"abc"'})
+        # An empty body: decoding it instead of using the cache would fail the comparison below
+        not_modified = fake_response(status_code=304)
+        
+        with patch('requests.Session.get', side_effect=[first, not_modified]) as mock_get:
+            assert github_client.get_user_repositories("testuser") == [{"id": 1, "full_name": "user/repo1"}]
+            repos = github_client.get_user_repositories("testuser")
+        
+        assert repos == [{"id": 1, "full_name": "user/repo1"}]
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+    
+    @pytest.mark.parametrize('method_name, args, get', [
+        ('get_user_repositories', ("nonexistent",),
+         {'return_value': fake_response(status_code=404, error=requests.exceptions.HTTPError("404 Not Found"))}),
+        ('get_organization_repositories', ("nonexistent",),
+         {'return_value': fake_response(status_code=404, error=requests.exceptions.HTTPError("404 Not Found"))}),
+        ('get_authenticated_user_repositories', (),
+         {'return_value': fake_response(status_code=401, error=requests.exceptions.HTTPError("401 Unauthorized"))}),
+        ('get_user_repositories', ("testuser",), {'side_effect': requests.exceptions.ConnectionError("Network error")}),
+    ], ids=['user-not-found', 'organization-not-found', 'unauthorized', 'network-error'])
+    def test_listing_errors_return_empty(self, github_client, method_name, args, get):
+        """Test that a listing comes back empty when the API answers with an error or cannot be reached"""
+        with patch('requests.Session.get', **get):
+            assert getattr(github_client, method_name)(*args) == []
+    
+    def test_get_organization_repositories_success(self, github_client):
         """Test successful get_organization_repositories call"""
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response = fake_response([
             {"id": 1, "full_name": "org/repo1", "clone_url": "https://github.com/org/repo1.git"},
             {"id": 2, "full_name": "org/repo2", "clone_url": "https://github.com/org/repo2.git"}
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_response.links = {}
+        ])
         
-        with patch('requests.get', return_value=mock_response):
-            repos = self.client.get_organization_repositories("testorg")
+        with patch('requests.Session.get', return_value=mock_response):
+            repos = github_client.get_organization_repositories("testorg")
             assert len(repos) == 2
             assert repos[0]["full_name"] == "org/repo1"
             assert repos[1]["full_name"] == "org/repo2"
     
-    def test_get_organization_repositories_not_found(self):
-        """Test get_organization_repositories with organization not found"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = Exception("404 Not Found")
-        
-        with patch('requests.get', return_value=mock_response):
-            repos = self.client.get_organization_repositories("nonexistent")
-            assert repos == []
+    def test_get_organization_repositories_not_found_message(self, github_client, caplog):
+        """Test that a 404 names the organization that could not be listed"""
+        mock_response = fake_response(status_code=404, error=requests.exceptions.HTTPError("404 Not Found"))
+        
+        with patch('requests.Session.get', return_value=mock_response):
+            repos = github_client.get_organization_repositories("ghost-org")
+        
+        assert repos == []
+        assert "Organization 'ghost-org' not found" in caplog.text
     
-    def test_get_authenticated_user_repositories_success(self):
+    def test_get_authenticated_user_repositories_success(self, github_client):
         """Test successful get_authenticated_user_repositories call"""
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response = fake_response([
             {"id": 1, "full_name": "user/repo1", "clone_url": "https://github.com/user/repo1.git"},
             {"id": 2, "full_name": "user/repo2", "clone_url": "https://github.com/user/repo2.git"}
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_response.links = {}
+        ])
         
-        with patch('requests.get', return_value=mock_response):
-            repos = self.client.get_authenticated_user_repositories()
+        with patch('requests.Session.get', return_value=mock_response):
+            repos = github_client.get_authenticated_user_repositories()
             assert len(repos) == 2
             assert repos[0]["full_name"] == "user/repo1"
             assert repos[1]["full_name"] == "user/repo2"
-    
-    def test_get_authenticated_user_repositories_authentication_error(self):
-        """Test get_authenticated_user_repositories with authentication error"""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = Exception("401 Unauthorized")
-        
-        with patch('requests.get', return_value=mock_response):
-            repos = self.client.get_authenticated_user_repositories()
-            assert repos == []
-    
-    def test_request_exception_handling(self):
-        """Test handling of request exceptions"""
-        with patch('requests.get', side_effect=Exception("Network error")):
-            repos = self.client.get_user_repositories("testuser")
-            assert repos == [] 
\ No newline at end of file
@@ -1,134 +1,154 @@
+import requests
 import pytest
 from unittest.mock import patch, Mock
 from src.gitlab_client import GitLabClient
 from src.config import GitLabConfig
+from tests._fakes import fake_response
 
 
 class TestGitLabClient:
     """Test GitLabClient class"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.config = GitLabConfig(
-            url="https://gitlab.com",
-            private_token="test-token"
-        )
-        self.client = GitLabClient(self.config)
-    
-    def test_gitlab_client_creation(self):
+    def test_gitlab_client_creation(self, gitlab_client):
         """Test creating GitLabClient instance"""
-        assert self.client.config == self.config
-        assert "Private-Token" in self.client.headers
-        assert "test-token" in self.client.headers["Private-Token"]
+        assert gitlab_client.config == GitLabConfig(url="https://gitlab.com", private_token="test-token")
+        assert "Private-Token" in gitlab_client.headers
+        assert "test-token" in gitlab_client.headers["Private-Token"]
+    
+    def test_default_session_is_pooled_and_closed(self, gitlab_client):
+        """Test that a client-created session retries and is closed with the client"""
+        with patch('requests.Session.close') as mock_close:
+            with GitLabClient(gitlab_client.config) as client:
+                assert client.session.get_adapter("https://gitlab.com").max_retries.total == 3
+        mock_close.assert_called_once()
+    
+    def test_shared_session_is_left_open(self, gitlab_client):
+        """Test that closing the client leaves a caller-provided session alone"""
+        session = Mock()
+        GitLabClient(gitlab_client.config, session).close()
+        session.close.assert_not_called()
+    
+    def test_clients_share_a_session(self, gitlab_client, api_fixtures):
+        """Test that clients handed one session send every request over its connection pool"""
+        other = GitLabClient(GitLabConfig(url="https://gitlab.example.com", private_token="other-token"),
+                             gitlab_client.session)
+        
+        with patch.object(gitlab_client.session, 'get', return_value=fake_response(api_fixtures["gitlab.user"])) as mock_get:
+            gitlab_client.get_current_user_id()
+            other.get_current_user_id()
+        
+        assert other.session is gitlab_client.session
+        assert mock_get.call_count == 2
     
-    def test_get_current_user_id_success(self):
+    def test_get_current_user_id_success(self, gitlab_client, api_fixtures):
         """Test successful get_current_user_id call"""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "id": 1,
-            "username": "testuser",
-            "name": "Test User"
-        }
-        mock_response.raise_for_status.return_value = None
+        mock_response = fake_response(api_fixtures["gitlab.user"])
         
-        with patch('requests.get', return_value=mock_response):
-            user_id = self.client.get_current_user_id()
+        with patch('requests.Session.get', return_value=mock_response):
+            user_id = gitlab_client.get_current_user_id()
             assert user_id == 1
     
-    def test_get_current_user_id_authentication_error(self):
+    def test_get_current_user_id_authentication_error(self, gitlab_client):
         """Test get_current_user_id with authentication error"""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = Exception("401 Unauthorized")
+        mock_response = fake_response(status_code=401, error=requests.exceptions.HTTPError("401 Unauthorized"))
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with pytest.raises(SystemExit):
-                self.client.get_current_user_id()
+                gitlab_client.get_current_user_id()
     
-    def test_get_user_owned_projects_success(self):
+    def test_get_user_owned_projects_success(self, gitlab_client):
         """Test successful get_user_owned_projects call"""
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response = fake_response([
             {"id": 1, "name": "project1", "http_url_to_repo": "https://gitlab.com/project1.git"},
             {"id": 2, "name": "project2", "http_url_to_repo": "https://gitlab.com/project2.git"}
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_response.headers = {}
+        ])
         
-        with patch('requests.get', return_value=mock_response):
-            projects = self.client.get_user_owned_projects(1)
+        with patch('requests.Session.get', return_value=mock_response) as mock_get:
+            projects = gitlab_client.get_user_owned_projects(1)
             assert len(projects) == 2
             assert projects[0]["name"] == "project1"
             assert projects[1]["name"] == "project2"
+        
+        # Always request the largest page size rather than GitLab's default of 20,
+        # and only the basic project fields
+        assert "per_page=100" in mock_get.call_args.args[0]
+        assert "simple=true" in mock_get.call_args.args[0]
     
-    def test_get_user_owned_projects_pagination(self):
+    def test_get_user_owned_projects_pagination(self, gitlab_client):
         """Test get_user_owned_projects with pagination"""
-        # First page response
-        mock_response1 = Mock()
-        mock_response1.json.return_value = [{"id": 1, "name": "project1"}]
-        mock_response1.raise_for_status.return_value = None
-        mock_response1.headers = {"X-Next-Page": "2"}
+        mock_response1 = fake_response([{"id": 1, "name": "project1"}], headers={"X-Next-Page": "2"})
+        mock_response2 = fake_response([{"id": 2, "name": "project2"}])
         
-        # Second page response
-        mock_response2 = Mock()
-        mock_response2.json.return_value = [{"id": 2, "name": "project2"}]
-        mock_response2.raise_for_status.return_value = None
-        mock_response2.headers = {}
-        
-        with patch('requests.get', side_effect=[mock_response1, mock_response2]):
-            projects = self.client.get_user_owned_projects(1)
+        with patch('requests.Session.get', side_effect=[mock_response1, mock_response2]):
+            projects = gitlab_client.get_user_owned_projects(1)
             assert len(projects) == 2
             assert projects[0]["name"] == "project1"
             assert projects[1]["name"] == "project2"
     
-    def test_get_user_owned_projects_authentication_error(self):
+    def test_get_user_owned_projects_fetches_known_pages_concurrently(self, gitlab_client):
+        """Test that pages 2..X-Total-Pages are all fetched when the page count is known"""
+        def fake_get(url, **kwargs):
+            page = int(url.rsplit("page=", 1)[1])
+            return fake_response([{"id": page, "name": f"project{page}"}],
+                                 headers={"X-Total-Pages": "4", "X-Next-Page": str(page + 1) if page < 4 else ""})
+        
+        with patch('requests.Session.get', side_effect=fake_get) as mock_get:
+            projects = gitlab_client.get_user_owned_projects(1)
+        
+        assert mock_get.call_count == 4
+        assert [project["id"] for project in projects] == [1, 2, 3, 4]
+    
+    def test_get_group_projects_revalidates_with_etag(self, gitlab_client):
+        """Test that an unchanged page and its pagination headers are served from the cache after a 304"""
+        first = fake_response([{"id": 1, "name": "group-project1"}],
+                              headers={"ETag": 'W/"abc"', "X-Total-Pages": "1", "X-Next-Page": ""})
+        not_modified = fake_response(status_code=304, error=AssertionError("a 304 must be served from the cache"))
+        
+        with patch('requests.Session.get', side_effect=[first, not_modified]) as mock_get:
+            assert gitlab_client.get_group_projects(123) == [{"id": 1, "name": "group-project1"}]
+            projects = gitlab_client.get_group_projects(123)
+        
+        assert projects == [{"id": 1, "name": "group-project1"}]
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == 'W/"abc"'
+    
+    def test_get_user_owned_projects_authentication_error(self, gitlab_client):
         """Test get_user_owned_projects with authentication error"""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = Exception("401 Unauthorized")
+        mock_response = fake_response(status_code=401, error=requests.exceptions.HTTPError("401 Unauthorized"))
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with pytest.raises(SystemExit):
-                self.client.get_user_owned_projects(1)
+                gitlab_client.get_user_owned_projects(1)
     
-    def test_get_group_projects_success(self):
+    def test_get_group_projects_success(self, gitlab_client):
         """Test successful get_group_projects call"""
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response = fake_response([
             {"id": 1, "name": "group-project1", "http_url_to_repo": "https://gitlab.com/group/project1.git"},
             {"id": 2, "name": "group-project2", "http_url_to_repo": "https://gitlab.com/group/project2.git"}
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_response.headers = {}
+        ])
         
-        with patch('requests.get', return_value=mock_response):
-            projects = self.client.get_group_projects(123)
+        with patch('requests.Session.get', return_value=mock_response):
+            projects = gitlab_client.get_group_projects(123)
             assert len(projects) == 2
             assert projects[0]["name"] == "group-project1"
             assert projects[1]["name"] == "group-project2"
     
-    def test_get_group_projects_not_found(self):
-        """Test get_group_projects with group not found"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = Exception("404 Not Found")
-        
-        with patch('requests.get', return_value=mock_response):
-            projects = self.client.get_group_projects(999)
-            assert projects == []
+    @pytest.mark.parametrize('get', [
+        {'return_value': fake_response(status_code=404, error=requests.exceptions.HTTPError("404 Not Found"))},
+        {'return_value': fake_response(status_code=403, error=requests.exceptions.HTTPError("403 Forbidden"))},
+        {'side_effect': requests.exceptions.ConnectionError("Network error")},
+    ], ids=['not-found', 'forbidden', 'network-error'])
+    def test_get_group_projects_errors_return_empty(self, gitlab_client, get):
+        """Test that group listing comes back empty when the API answers with an error or cannot be reached"""
+        with patch('requests.Session.get', **get):
+            assert gitlab_client.get_group_projects(123) == []
     
-    def test_get_group_projects_forbidden(self):
-        """Test get_group_projects with forbidden access"""
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.raise_for_status.side_effect = Exception("403 Forbidden")
+    def test_get_group_projects_logs_progress_and_errors(self, gitlab_client, caplog):
+        """Test that group listing progress and errors go through logging"""
+        mock_response = fake_response(status_code=404, error=requests.exceptions.HTTPError("404 Not Found"))
         
-        with patch('requests.get', return_value=mock_response):
-            projects = self.client.get_group_projects(123)
-            assert projects == []
-    
-    def test_get_group_projects_request_exception(self):
-        """Test handling of request exceptions in get_group_projects"""
-        with patch('requests.get', side_effect=Exception("Network error")):
-            projects = self.client.get_group_projects(123)
-            assert projects == [] 
\ No newline at end of file
+        with patch('requests.Session.get', return_value=mock_response), caplog.at_level("INFO", logger="src.gitlab_client"):
+            gitlab_client.get_group_projects(123)
+        
+        assert [(record.levelname, record.getMessage().split(" not found")[0]) for record in caplog.records] == [
+            ("INFO", "  Fetching projects for group ID 123..."), ("ERROR", "  Error: Group with ID 123"),
+        ]
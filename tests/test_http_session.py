@@ -0,0 +1,92 @@
+from unittest.mock import Mock, patch
+
+from src.http_session import create_session, decode_json, get_with_rate_limit
+
+
+class TestCreateSession:
+    """Test shared HTTP session creation"""
+    
+    def test_pool_sized_to_workers(self):
+        """Test that the connection pool matches the requested size"""
+        session = create_session(8)
+        adapter = session.get_adapter("https://gitlab.com")
+        
+        assert adapter._pool_connections == 8
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.total == 3
+    
+    def test_retries_transient_statuses(self):
+        """Test that 5xx responses are retried, then handed back, and rate limits are not"""
+        retry = create_session(1).get_adapter("https://api.github.com").max_retries
+        
+        assert {502, 503}.issubset(retry.status_forcelist)
+        # An uncapped Retry-After sleep here would bypass MAX_RATE_LIMIT_WAIT
+        assert 429 not in retry.status_forcelist
+        assert not retry.respect_retry_after_header
+        assert not retry.raise_on_status
+    
+    def test_http_and_https_share_adapter(self):
+        """Test that both schemes use the pooled adapter"""
+        session = create_session(2)
+        
+        assert session.get_adapter("http://example.com") is session.get_adapter("https://example.com")
+
+
+class TestDecodeJson:
+    """Test JSON decoding of response bodies"""
+    
+    def test_decodes_raw_bytes(self):
+        """Test that the body is parsed from the response bytes"""
+        response = Mock()
+        response.content = b'[{"id": 1, "name": "caf\xc3\xa9"}]'
+        
+        assert decode_json(response) == [{"id": 1, "name": "café"}]
+        response.json.assert_not_called()
+
+
+class TestGetWithRateLimit:
+    """Test waiting out API rate limits"""
+    
+    def _response(self, status_code, headers=None):
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        return response
+    
+    def test_waits_for_retry_after_then_retries(self):
+        """Test that a 429 is retried after its Retry-After delay"""
+        session = Mock()
+        session.get.side_effect = [self._response(429, {"Retry-After": "2"}), self._response(200)]
+        
+        with patch('src.http_session.time.sleep') as mock_sleep:
+            response = get_with_rate_limit(session, "https://gitlab.com/api/v4/user", {})
+        
+        assert response.status_code == 200
+        mock_sleep.assert_called_once_with(2.0)
+    
+    def test_exhausted_github_limit_waits_until_reset(self):
+        """Test that a 403 with no remaining requests sleeps until the reset timestamp"""
+        session = Mock()
+        session.get.side_effect = [
+            self._response(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"}),
+            self._response(200),
+        ]
+        
+        with patch('src.http_session.time.time', return_value=1000.0), patch('src.http_session.time.sleep') as mock_sleep:
+            get_with_rate_limit(session, "https://api.github.com/user", {})
+        
+        mock_sleep.assert_called_once_with(10.0)
+    
+    def test_forbidden_without_rate_limit_is_returned(self):
+        """Test that an ordinary 403 or a too-distant reset is handed back without waiting"""
+        session = Mock()
+        session.get.side_effect = [
+            self._response(403, {"X-RateLimit-Remaining": "42"}),
+            self._response(429, {"Retry-After": "3600"}),
+        ]
+        
+        with patch('src.http_session.time.sleep') as mock_sleep:
+            assert get_with_rate_limit(session, "https://api.github.com/orgs/x/repos", {}).status_code == 403
+            assert get_with_rate_limit(session, "https://api.github.com/orgs/x/repos", {}).status_code == 429
+        
+        mock_sleep.assert_not_called()
@@ -1,62 +1,22 @@
-#!/usr/bin/env python3
-"""
-Test script for output directory feature
-"""
-
-import os
-import tempfile
-import shutil
+from unittest.mock import patch
 from src.config import RepositoryConfig
 from src.repository_manager import RepositoryManager
 
 
-def test_output_directory():
-    """Test the output directory feature"""
-    print("🧪 Testing Output Directory Feature")
-    print("=" * 40)
+def test_output_directory(tmp_path):
+    """Test that clones go to repo_dir by default and to output_dir when one is given"""
+    default_dir = tmp_path / "default"
+    custom_dir = tmp_path / "custom"
+    repo_manager = RepositoryManager(RepositoryConfig(repo_dir=str(default_dir), max_concurrent_downloads=5))
+    repo_url = "https://github.com/test/repo1.git"
     
-    # Create temporary directories
-    with tempfile.TemporaryDirectory() as temp_dir:
-        default_dir = os.path.join(temp_dir, "default")
-        custom_dir = os.path.join(temp_dir, "custom")
-        
-        # Create directories
-        os.makedirs(default_dir, exist_ok=True)
-        os.makedirs(custom_dir, exist_ok=True)
-        
-        print(f"Default directory: {default_dir}")
-        print(f"Custom directory: {custom_dir}")
-        
-        # Test configuration
-        config = RepositoryConfig(repo_dir=default_dir, max_concurrent_downloads=5)
-        repo_manager = RepositoryManager(config)
-        
-        # Test with default directory
-        print("\n📁 Testing with default directory...")
-        repo_name = "test/repo1"
-        repo_url = "https://github.com/test/repo1.git"
-        
-        result_name, result_message = repo_manager.clone_or_pull_repo(repo_url, repo_name)
-        print(f"Result: {result_message}")
-        
-        # Test with custom output directory
-        print("\n📁 Testing with custom output directory...")
-        result_name, result_message = repo_manager.clone_or_pull_repo(repo_url, repo_name, output_dir=custom_dir)
-        print(f"Result: {result_message}")
-        
-        # List directories to see what was created
-        print(f"\n📋 Default directory contents:")
-        if os.path.exists(default_dir):
-            for item in os.listdir(default_dir):
-                print(f"  - {item}")
-        
-        print(f"\n📋 Custom directory contents:")
-        if os.path.exists(custom_dir):
-            for item in os.listdir(custom_dir):
-                print(f"  - {item}")
-        
-        print("\n✅ Output directory feature test completed!")
-
-
-if __name__ == "__main__":
-    test_output_directory() 
\ No newline at end of file
+    # git itself is stubbed out: only where the clone is pointed matters here
+    with patch('src.repository_manager._run_git') as mock_run_git:
+        assert repo_manager.clone_or_pull_repo(repo_url, "test/repo1") == ("test/repo1", "Cloned 'test/repo1'.")
+        repo_manager.clone_or_pull_repo(repo_url, "test/repo1", output_dir=str(custom_dir))
+    
+    assert [call.args[0][-1] for call in mock_run_git.call_args_list] == [
+        str(default_dir / "test" / "repo1"), str(custom_dir / "test" / "repo1")
+    ]
+    assert [path.name for path in default_dir.iterdir()] == ["test"]
+    assert [path.name for path in custom_dir.iterdir()] == ["test"]
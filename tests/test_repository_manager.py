@@ -0,0 +1,214 @@
+import concurrent.futures
+import subprocess
+import pytest
+from unittest.mock import patch
+from src.config import RepositoryConfig
+from src.repository_manager import GIT_PARALLEL_OPTS, RepositoryManager, _run_git
+
+
+def _git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def origin(tmp_path, monkeypatch):
+    """A bare origin repository with one commit on main, plus a scratch clone to push from"""
+    for name, value in (("GIT_AUTHOR_NAME", "Test"), ("GIT_AUTHOR_EMAIL", "test@example.com"),
+                        ("GIT_COMMITTER_NAME", "Test"), ("GIT_COMMITTER_EMAIL", "test@example.com")):
+        monkeypatch.setenv(name, value)
+    
+    bare = tmp_path / "origin.git"
+    _git(tmp_path, "init", "--bare", "--initial-branch=main", str(bare))
+    work = tmp_path / "work"
+    _git(tmp_path, "clone", str(bare), str(work))
+    (work / "README.md").write_text("v1\n")
+    _git(work, "add", "README.md")
+    _git(work, "commit", "-m", "v1")
+    _git(work, "push", "origin", "HEAD:main")
+    return bare, work
+
+
+class TestCloneOrPullRepo:
+    """Test cloning and updating a single repository"""
+    
+    def _manager(self, tmp_path):
+        return RepositoryManager(RepositoryConfig(repo_dir=str(tmp_path / "repos"), max_concurrent_downloads=2))
+    
+    def test_clone_then_fast_forward(self, tmp_path, origin):
+        """Test that an existing clone is fast-forwarded to the remote branch"""
+        bare, work = origin
+        manager = self._manager(tmp_path)
+        
+        _, message = manager.clone_or_pull_repo(str(bare), "group/project")
+        assert message == "Cloned 'group/project'."
+        
+        (work / "README.md").write_text("v2\n")
+        _git(work, "commit", "-am", "v2")
+        _git(work, "push", "origin", "HEAD:main")
+        
+        _, message = manager.clone_or_pull_repo(str(bare), "group/project")
+        assert message == "Pulled changes for 'group/project'."
+        assert (tmp_path / "repos" / "group" / "project" / "README.md").read_text() == "v2\n"
+    
+    def test_shallow_clone_then_fast_forward(self, tmp_path, origin):
+        """Test that a shallow clone holds one commit and still fast-forwards on update"""
+        bare, work = origin
+        (work / "README.md").write_text("v2\n")
+        _git(work, "commit", "-am", "v2")
+        _git(work, "push", "origin", "HEAD:main")
+        config = RepositoryConfig(repo_dir=str(tmp_path / "repos"), max_concurrent_downloads=2, shallow=True)
+        manager = RepositoryManager(config)
+        clone = tmp_path / "repos" / "group" / "project"
+        
+        # --depth is ignored for plain local paths, so go through file://
+        manager.clone_or_pull_repo(bare.as_uri(), "group/project")
+        assert _git(clone, "rev-list", "--count", "HEAD").strip() == "1"
+        
+        (work / "README.md").write_text("v3\n")
+        _git(work, "commit", "-am", "v3")
+        _git(work, "push", "origin", "HEAD:main")
+        
+        _, message = manager.clone_or_pull_repo(bare.as_uri(), "group/project")
+        assert message == "Pulled changes for 'group/project'."
+        assert (clone / "README.md").read_text() == "v3\n"
+        assert _git(clone, "rev-list", "--count", "HEAD").strip() == "2"
+    
+    def test_local_commits_are_not_overwritten(self, tmp_path, origin):
+        """Test that a diverged clone reports an error instead of discarding local work"""
+        bare, work = origin
+        manager = self._manager(tmp_path)
+        manager.clone_or_pull_repo(str(bare), "group/project")
+        clone = tmp_path / "repos" / "group" / "project"
+        
+        (clone / "README.md").write_text("local\n")
+        _git(clone, "commit", "-am", "local")
+        (work / "README.md").write_text("remote\n")
+        _git(work, "commit", "-am", "remote")
+        _git(work, "push", "origin", "HEAD:main")
+        
+        _, message = manager.clone_or_pull_repo(str(bare), "group/project")
+        assert message.startswith("Error pulling changes for 'group/project'")
+        assert (clone / "README.md").read_text() == "local\n"
+    
+    def test_existing_non_repository_directory(self, tmp_path, origin):
+        """Test that a plain directory in the way is reported, not treated as a repository"""
+        bare, _ = origin
+        (tmp_path / "repos" / "group" / "project").mkdir(parents=True)
+        
+        _, message = self._manager(tmp_path).clone_or_pull_repo(str(bare), "group/project")
+        assert "is not a Git repository" in message
+    
+    def test_clone_filter_makes_partial_clone(self, tmp_path):
+        """Test that a configured clone_filter is passed to git clone, and 'none' disables it"""
+        config = RepositoryConfig(repo_dir=str(tmp_path), max_concurrent_downloads=2, clone_filter="blob:none")
+        manager = RepositoryManager(config)
+        
+        with patch('src.repository_manager._run_git') as mock_run_git:
+            manager.clone_or_pull_repo("git@example.com:group/project.git", "group/project")
+            config.clone_filter = "none"
+            manager.clone_or_pull_repo("git@example.com:group/project.git", "group/project")
+        
+        target = str(tmp_path / "group" / "project")
+        assert mock_run_git.call_args_list[0].args[0] == ["clone", "--filter=blob:none", "git@example.com:group/project.git", target]
+        assert mock_run_git.call_args_list[1].args[0] == ["clone", "git@example.com:group/project.git", target]
+    
+    def test_group_directory_created_once(self, tmp_path):
+        """Test that clones into the same group directory create it only once"""
+        manager = self._manager(tmp_path)
+        
+        with patch('src.repository_manager._run_git'), patch('src.repository_manager.os.makedirs') as mock_makedirs:
+            manager.clone_or_pull_repo("a.git", "group/a")
+            manager.clone_or_pull_repo("b.git", "group/b")
+            manager.clone_or_pull_repo("c.git", "other/c")
+        
+        assert [call.args[0] for call in mock_makedirs.call_args_list] == [
+            str(tmp_path / "repos" / "group"), str(tmp_path / "repos" / "other")
+        ]
+
+
+class TestCloneOrPullAllBranches:
+    """Test cloning a repository with local copies of every branch"""
+    
+    def test_creates_missing_local_branches(self, tmp_path, origin):
+        """Test that every origin branch gets a tracking local branch on clone and on later fetches"""
+        bare, work = origin
+        _git(work, "push", "origin", "HEAD:feature")
+        manager = RepositoryManager(RepositoryConfig(repo_dir=str(tmp_path / "repos"), max_concurrent_downloads=2))
+        clone = tmp_path / "repos" / "group" / "project"
+        
+        _, status, _ = manager.clone_or_pull_all_branches(str(bare), "group/project")
+        assert status == "SUCCESS"
+        assert _git(clone, "for-each-ref", "--format=%(refname:short)", "refs/heads/").split() == ["feature", "main"]
+        
+        _git(work, "push", "origin", "HEAD:release")
+        _, status, _ = manager.clone_or_pull_all_branches(str(bare), "group/project")
+        assert status == "SUCCESS"
+        assert _git(clone, "for-each-ref", "--format=%(refname:short)", "refs/heads/").split() == ["feature", "main", "release"]
+        # Created branches track origin like git branch --track, so plain pull/push and @{u} work on them
+        assert _git(clone, "for-each-ref", "--format=%(upstream:short)", "refs/heads/").split() == [
+            "origin/feature", "origin/main", "origin/release"
+        ]
+        _git(clone, "checkout", "-q", "release")
+        assert _git(clone, "rev-parse", "--abbrev-ref", "@{u}").strip() == "origin/release"
+    
+    def test_branch_names_needing_config_quoting_track_themselves(self, tmp_path, origin):
+        """Test that branch names with config comment characters get their own upstream"""
+        bare, work = origin
+        for branch in ("feat#1", "a;b", "feat", "a"):
+            _git(work, "push", "origin", f"HEAD:{branch}")
+        manager = RepositoryManager(RepositoryConfig(repo_dir=str(tmp_path / "repos"), max_concurrent_downloads=2))
+        
+        manager.clone_or_pull_all_branches(str(bare), "group/project")
+        
+        clone = tmp_path / "repos" / "group" / "project"
+        upstreams = _git(clone, "for-each-ref", "--format=%(refname:short) %(upstream:short)", "refs/heads/")
+        assert "feat#1 origin/feat#1" in upstreams.splitlines()
+        assert "a;b origin/a;b" in upstreams.splitlines()
+    
+    def test_one_failing_branch_does_not_stop_the_others(self, tmp_path, origin):
+        """Test that branches are still created when another one cannot be, and the failure is reported"""
+        bare, work = origin
+        manager = RepositoryManager(RepositoryConfig(repo_dir=str(tmp_path / "repos"), max_concurrent_downloads=2))
+        manager.clone_or_pull_all_branches(str(bare), "group/project")
+        clone = tmp_path / "repos" / "group" / "project"
+        # A local branch 'x' makes refs/heads/x/y impossible to create
+        _git(clone, "branch", "x")
+        _git(work, "push", "origin", "HEAD:x/y")
+        _git(work, "push", "origin", "HEAD:z")
+        
+        _, status, message = manager.clone_or_pull_all_branches(str(bare), "group/project")
+        
+        assert status == "FAILED"
+        assert "x/y" in message
+        assert _git(clone, "rev-parse", "--abbrev-ref", "z@{u}").strip() == "origin/z"
+    
+    def test_process_executor(self, tmp_path, origin, caplog):
+        """Test that group projects can be processed in a process pool"""
+        caplog.set_level("INFO")
+        bare, _ = origin
+        config = RepositoryConfig(repo_dir=str(tmp_path / "repos"), max_concurrent_downloads=2, executor="process")
+        manager = RepositoryManager(config)
+        
+        assert isinstance(manager.executor(), concurrent.futures.ProcessPoolExecutor)
+        manager.process_group_projects([{"ssh_url_to_repo": str(bare), "namespace": {"name": "group"}, "name": "project"}])
+        
+        assert "  -> Cloned 'group/project' and created all local branches." in caplog.messages
+        assert (tmp_path / "repos" / "group" / "project" / "README.md").exists()
+
+
+class TestRunGit:
+    """Test the git subprocess wrapper"""
+    
+    def test_passes_parallel_options_and_disables_prompts(self, tmp_path):
+        """Test that every git call gets the parallelism options and never prompts"""
+        with patch('src.repository_manager.subprocess.run') as mock_run:
+            _run_git(["fetch", "--prune"], cwd=str(tmp_path))
+        
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["git", *GIT_PARALLEL_OPTS, "fetch", "--prune"]
+        assert "checkout.workers=0" in GIT_PARALLEL_OPTS
+        assert kwargs["env"]["GIT_TERMINAL_PROMPT"] == "0"
+        assert kwargs["check"] is True
+        # Output nobody reads is not piped back
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert kwargs["stderr"] is subprocess.PIPE
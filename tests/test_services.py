@@ -1,229 +1,271 @@
-from unittest.mock import patch, Mock, MagicMock
+import threading
+import pytest
+from unittest.mock import patch, Mock
 from src.services import (
     UserRepositoryService, GroupRepositoryService, ComposerService,
     GitHubUserService, GitHubOrganizationService
 )
-from src.config import GitLabConfig, RepositoryConfig, GroupConfig, GitHubConfig
+from src.config import RepositoryConfig, GroupConfig
+
+
+class FakeFuture:
+    """An already finished future"""
+    
+    def __init__(self, result):
+        self._result = result
+    
+    def result(self):
+        return self._result
+
+
+class FakeExecutor:
+    """Executor stand-in that runs each job inline as it is submitted"""
+    
+    def __init__(self, *args, **kwargs):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return None
+    
+    def submit(self, fn, *args, **kwargs):
+        return FakeFuture(fn(*args, **kwargs))
+    
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+
+@pytest.fixture
+def inline_pool():
+    """Swap the clone pools for FakeExecutor, with as_completed yielding in submission order"""
+    with patch('concurrent.futures.ThreadPoolExecutor', FakeExecutor), patch('concurrent.futures.as_completed', list):
+        yield
+
+
+def fake_clone(repo_url, relative_path, output_dir=None):
+    """Clone worker stand-in reporting success without running git"""
+    return relative_path, f"Cloned {relative_path}"
+
+
+def _user_projects(n):
+    """n GitLab projects shaped like the owned-projects listing"""
+    return [{"ssh_url_to_repo": f"git@gitlab.com:user/project{i}.git", "path_with_namespace": f"user/project{i}"}
+            for i in range(1, n + 1)]
 
 
 class TestUserRepositoryService:
     """Test UserRepositoryService class"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, http_session, gitlab_config, repo_config):
         """Set up test fixtures"""
-        self.gitlab_config = GitLabConfig(
-            url="https://gitlab.com",
-            private_token="test-token"
-        )
-        self.repo_config = RepositoryConfig(
-            repo_dir="/test/repos",
-            max_concurrent_downloads=5
-        )
-        self.service = UserRepositoryService(self.gitlab_config, self.repo_config)
-    
-    def test_service_creation(self):
-        """Test creating UserRepositoryService instance"""
-        assert self.service.gitlab_client.config == self.gitlab_config
-        assert self.service.repo_manager.config == self.repo_config
+        self.gitlab_config = gitlab_config
+        self.repo_config = repo_config
+        self.service = UserRepositoryService(self.gitlab_config, self.repo_config, http_session)
     
-    @patch('src.services.UserRepositoryService._get_executor')
-    @patch('src.services.UserRepositoryService._as_completed')
-    def test_clone_user_repositories_success(self, mock_as_completed, mock_executor):
-        """Test successful clone_user_repositories"""
-        # Mock the GitLab client
-        mock_projects = [
-            {"id": 1, "name": "project1", "http_url_to_repo": "https://gitlab.com/project1.git"},
-            {"id": 2, "name": "project2", "http_url_to_repo": "https://gitlab.com/project2.git"}
-        ]
+    @pytest.mark.usefixtures('inline_pool')
+    @pytest.mark.parametrize('n', [0, 2, 10, 100])
+    def test_clone_user_repositories_success(self, caplog, n):
+        """Test that clone_user_repositories clones every owned project, including none"""
+        caplog.set_level("INFO")
         self.service.gitlab_client.get_current_user_id = Mock(return_value=1)
-        self.service.gitlab_client.get_user_owned_projects = Mock(return_value=mock_projects)
+        self.service.gitlab_client.iter_user_owned_projects = Mock(return_value=iter(_user_projects(n)))
+        self.service.repo_manager.clone_or_pull_repo = fake_clone
         
-        # Mock the repository manager
-        mock_future1 = Mock()
-        mock_future1.result.return_value = ("project1", "Cloned project1")
-        mock_future2 = Mock()
-        mock_future2.result.return_value = ("project2", "Updated project2")
-        
-        mock_executor.return_value.__enter__.return_value.submit.side_effect = [
-            mock_future1, mock_future2
-        ]
-        mock_as_completed.return_value = [mock_future1, mock_future2]
+        self.service.clone_user_repositories()
         
-        # Mock futures dictionary
-        with patch.object(self.service, '_get_futures_dict', return_value={
-            mock_future1: "project1",
-            mock_future2: "project2"
-        }):
-            self.service.clone_user_repositories()
+        assert caplog.text.count("  -> Cloned user/project") == n
     
-    def test_clone_user_repositories_no_projects(self):
-        """Test clone_user_repositories with no projects"""
+    def test_clone_user_repositories_streams_projects(self):
+        """Test that cloning starts before the project listing is exhausted"""
+        first_clone_started = threading.Event()
+        streamed = []
+        
+        def projects():
+            first, second = _user_projects(2)
+            yield first
+            streamed.append(first_clone_started.wait(timeout=5))
+            yield second
+        
+        def clone(url, name, output_dir):
+            first_clone_started.set()
+            return name, f"Cloned {name}"
+        
         self.service.gitlab_client.get_current_user_id = Mock(return_value=1)
-        self.service.gitlab_client.get_user_owned_projects = Mock(return_value=[])
+        self.service.gitlab_client.iter_user_owned_projects = Mock(return_value=projects())
+        self.service.repo_manager.clone_or_pull_repo = Mock(side_effect=clone)
         
         self.service.clone_user_repositories()
+        
+        assert streamed == [True]
+        assert self.service.repo_manager.clone_or_pull_repo.call_count == 2
 
 
 class TestGroupRepositoryService:
     """Test GroupRepositoryService class"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, http_session, gitlab_config, repo_config):
         """Set up test fixtures"""
-        self.gitlab_config = GitLabConfig(
-            url="https://gitlab.com",
-            private_token="test-token"
-        )
-        self.repo_config = RepositoryConfig(
-            repo_dir="/test/repos",
-            max_concurrent_downloads=5
-        )
+        self.gitlab_config = gitlab_config
+        self.repo_config = repo_config
         self.group_config = GroupConfig(target_group_ids=[1, 2])
-        self.service = GroupRepositoryService(self.gitlab_config, self.repo_config, self.group_config)
+        self.service = GroupRepositoryService(self.gitlab_config, self.repo_config, self.group_config, http_session)
     
-    def test_service_creation(self):
-        """Test creating GroupRepositoryService instance"""
-        assert self.service.gitlab_client.config == self.gitlab_config
-        assert self.service.repo_manager.config == self.repo_config
-        assert self.service.group_config == self.group_config
-    
-    @patch('src.services.GroupRepositoryService._get_executor')
-    @patch('src.services.GroupRepositoryService._as_completed')
-    def test_clone_group_repositories_success(self, mock_as_completed, mock_executor):
+    @pytest.mark.usefixtures('inline_pool')
+    def test_clone_group_repositories_success(self, caplog):
         """Test successful clone_group_repositories"""
-        # Mock the GitLab client
-        mock_projects = [
-            {"id": 1, "name": "group-project1", "http_url_to_repo": "https://gitlab.com/group/project1.git"},
-            {"id": 2, "name": "group-project2", "http_url_to_repo": "https://gitlab.com/group/project2.git"}
-        ]
-        self.service.gitlab_client.get_group_projects = Mock(return_value=mock_projects)
+        caplog.set_level("INFO")
+        self.service.gitlab_client.get_group_projects = Mock(side_effect=lambda group_id: [
+            {"ssh_url_to_repo": f"git@gitlab.com:group{group_id}/project.git", "namespace": {"name": f"group{group_id}"},
+             "name": "project"}
+        ])
+        self.service.repo_manager.clone_or_pull_all_branches = fake_clone
         
-        # Mock the repository manager
-        mock_future1 = Mock()
-        mock_future1.result.return_value = ("group-project1", "Cloned group-project1")
-        mock_future2 = Mock()
-        mock_future2.result.return_value = ("group-project2", "Updated group-project2")
+        self.service.clone_group_repositories()
         
-        mock_executor.return_value.__enter__.return_value.submit.side_effect = [
-            mock_future1, mock_future2
-        ]
-        mock_as_completed.return_value = [mock_future1, mock_future2]
+        output = caplog.text
+        assert "Total projects to process: 2" in output
+        assert output.index("Cloned group1/project") < output.index("Cloned group2/project")
+    
+    def test_clone_group_repositories_lists_groups_concurrently_in_order(self):
+        """Test that every group is listed and projects keep the configured group order"""
+        self.group_config.target_group_ids = [3, 1, 2]
+        self.service.gitlab_client.get_group_projects = Mock(side_effect=lambda group_id: [{"id": group_id * 10}])
+        processed = []
+        self.service.repo_manager.process_group_projects = Mock(
+            side_effect=lambda projects, output_dir: processed.extend(projects)
+        )
         
-        # Mock futures dictionary
-        with patch.object(self.service, '_get_futures_dict', return_value={
-            mock_future1: "group-project1",
-            mock_future2: "group-project2"
-        }):
-            self.service.clone_group_repositories()
-
+        self.service.clone_group_repositories()
+        
+        assert sorted(call.args[0] for call in self.service.gitlab_client.get_group_projects.call_args_list) == [1, 2, 3]
+        assert processed == [{"id": 30}, {"id": 10}, {"id": 20}]
 
 class TestGitHubUserService:
     """Test GitHubUserService class"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, http_session, github_config, repo_config):
         """Set up test fixtures"""
-        self.github_config = GitHubConfig(
-            access_token="test-token",
-            url="https://api.github.com"
-        )
-        self.repo_config = RepositoryConfig(
-            repo_dir="/test/repos",
-            max_concurrent_downloads=5
-        )
-        self.service = GitHubUserService(self.github_config, self.repo_config)
+        self.github_config = github_config
+        self.repo_config = repo_config
+        self.service = GitHubUserService(self.github_config, self.repo_config, http_session)
     
-    def test_service_creation(self):
-        """Test creating GitHubUserService instance"""
-        assert self.service.github_client.config == self.github_config
-        assert self.service.repo_manager.config == self.repo_config
-    
-    @patch('concurrent.futures.ThreadPoolExecutor')
-    @patch('concurrent.futures.as_completed')
-    def test_clone_user_repositories_success(self, mock_as_completed, mock_executor):
+    @pytest.mark.usefixtures('inline_pool')
+    def test_clone_user_repositories_success(self, caplog):
         """Test successful clone_user_repositories"""
-        # Mock the GitHub client
-        mock_repos = [
+        caplog.set_level("INFO")
+        self.service.github_client.get_user_repositories = Mock(return_value=[
             {"id": 1, "full_name": "user/repo1", "clone_url": "https://github.com/user/repo1.git"},
             {"id": 2, "full_name": "user/repo2", "clone_url": "https://github.com/user/repo2.git"}
-        ]
-        self.service.github_client.get_user_repositories = Mock(return_value=mock_repos)
+        ])
+        self.service.repo_manager.clone_or_pull_repo = fake_clone
         
-        # Mock the repository manager
-        mock_future1 = Mock()
-        mock_future1.result.return_value = ("user/repo1", "Cloned user/repo1")
-        mock_future2 = Mock()
-        mock_future2.result.return_value = ("user/repo2", "Updated user/repo2")
-        
-        mock_executor_instance = Mock()
-        mock_executor_instance.submit.side_effect = [mock_future1, mock_future2]
-        mock_executor.return_value.__enter__.return_value = mock_executor_instance
-        mock_as_completed.return_value = [mock_future1, mock_future2]
+        self.service.clone_user_repositories("testuser")
         
-        # Mock futures dictionary
-        futures_dict = {mock_future1: "user/repo1", mock_future2: "user/repo2"}
+        output = caplog.text
+        assert "  -> Cloned user/repo1" in output
+        assert "  -> Cloned user/repo2" in output
+    
+    def test_clone_user_repositories_largest_first(self):
+        """Test that repositories are submitted in descending size order"""
+        self.service.github_client.get_user_repositories = Mock(return_value=[
+            {"full_name": "user/small", "clone_url": "small.git", "size": 10},
+            {"full_name": "user/unknown", "clone_url": "unknown.git"},
+            {"full_name": "user/large", "clone_url": "large.git", "size": 5000},
+        ])
         
-        with patch.object(self.service.repo_manager, 'clone_or_pull_repo'):
+        with patch.object(self.service.repo_manager, 'run_clone_batch') as mock_run:
             self.service.clone_user_repositories("testuser")
-    
-    def test_clone_user_repositories_no_repos(self):
-        """Test clone_user_repositories with no repositories"""
-        self.service.github_client.get_user_repositories = Mock(return_value=[])
         
-        self.service.clone_user_repositories("testuser")
+        tasks, output_dir = mock_run.call_args.args
+        assert list(tasks) == [
+            ("large.git", "user/large", False),
+            ("small.git", "user/small", False),
+            ("unknown.git", "user/unknown", False),
+        ]
 
 
 class TestGitHubOrganizationService:
     """Test GitHubOrganizationService class"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, http_session, github_config, repo_config):
         """Set up test fixtures"""
-        self.github_config = GitHubConfig(
-            access_token="test-token",
-            url="https://api.github.com"
-        )
-        self.repo_config = RepositoryConfig(
-            repo_dir="/test/repos",
-            max_concurrent_downloads=5
-        )
-        self.service = GitHubOrganizationService(self.github_config, self.repo_config)
+        self.github_config = github_config
+        self.repo_config = repo_config
+        self.service = GitHubOrganizationService(self.github_config, self.repo_config, http_session)
     
-    def test_service_creation(self):
-        """Test creating GitHubOrganizationService instance"""
-        assert self.service.github_client.config == self.github_config
-        assert self.service.repo_manager.config == self.repo_config
-    
-    @patch('concurrent.futures.ThreadPoolExecutor')
-    @patch('concurrent.futures.as_completed')
-    def test_clone_organization_repositories_success(self, mock_as_completed, mock_executor):
+    @pytest.mark.usefixtures('inline_pool')
+    def test_clone_organization_repositories_success(self, caplog):
         """Test successful clone_organization_repositories"""
-        # Mock the GitHub client
-        mock_repos = [
+        caplog.set_level("INFO")
+        self.service.github_client.get_organization_repositories = Mock(return_value=[
             {"id": 1, "full_name": "org/repo1", "clone_url": "https://github.com/org/repo1.git"},
             {"id": 2, "full_name": "org/repo2", "clone_url": "https://github.com/org/repo2.git"}
-        ]
-        self.service.github_client.get_organization_repositories = Mock(return_value=mock_repos)
-        
-        # Mock the repository manager
-        mock_future1 = Mock()
-        mock_future1.result.return_value = ("org/repo1", "Cloned org/repo1")
-        mock_future2 = Mock()
-        mock_future2.result.return_value = ("org/repo2", "Updated org/repo2")
-        
-        mock_executor_instance = Mock()
-        mock_executor_instance.submit.side_effect = [mock_future1, mock_future2]
-        mock_executor.return_value.__enter__.return_value = mock_executor_instance
-        mock_as_completed.return_value = [mock_future1, mock_future2]
+        ])
+        self.service.repo_manager.clone_or_pull_repo = fake_clone
         
-        # Mock futures dictionary
-        futures_dict = {mock_future1: "org/repo1", mock_future2: "org/repo2"}
+        self.service.clone_organization_repositories("testorg")
         
-        with patch.object(self.service.repo_manager, 'clone_or_pull_repo'):
-            self.service.clone_organization_repositories("testorg")
+        output = caplog.text
+        assert "  -> Cloned org/repo1" in output
+        assert "  -> Cloned org/repo2" in output
     
-    def test_clone_organization_repositories_no_repos(self):
-        """Test clone_organization_repositories with no repositories"""
-        self.service.github_client.get_organization_repositories = Mock(return_value=[])
-        
-        self.service.clone_organization_repositories("testorg")
+
+
+@pytest.mark.parametrize('service_cls, api_config_fixture, extra_args, client_attr', [
+    (UserRepositoryService, 'gitlab_config', (), 'gitlab_client'),
+    (GroupRepositoryService, 'gitlab_config', (GroupConfig(target_group_ids=[1, 2]),), 'gitlab_client'),
+    (GitHubUserService, 'github_config', (), 'github_client'),
+    (GitHubOrganizationService, 'github_config', (), 'github_client'),
+])
+def test_service_creation(request, http_session, repo_config, service_cls, api_config_fixture, extra_args, client_attr):
+    """Test that each service wires its configs into its client and repository manager"""
+    api_config = request.getfixturevalue(api_config_fixture)
+    service = service_cls(api_config, repo_config, *extra_args, session=http_session)
+    
+    assert getattr(service, client_attr).config == api_config
+    assert getattr(service, client_attr).session is http_session
+    assert service.repo_manager.config == repo_config
+    if extra_args:
+        assert service.group_config == extra_args[0]
+
+
+@pytest.mark.parametrize('concurrency', [1, 5, 16])
+@pytest.mark.parametrize('service_cls, api_config_fixture, client_attr', [
+    (UserRepositoryService, 'gitlab_config', 'gitlab_client'),
+    (GitHubUserService, 'github_config', 'github_client'),
+])
+def test_service_creation_concurrency(request, http_session, service_cls, api_config_fixture, client_attr, concurrency):
+    """Test that max_concurrent_downloads reaches the repository manager and bounds the client's page fetches"""
+    repo_config = RepositoryConfig(repo_dir="/test/repos", max_concurrent_downloads=concurrency)
+    service = service_cls(request.getfixturevalue(api_config_fixture), repo_config, session=http_session)
+    
+    assert service.repo_manager.config.max_concurrent_downloads == concurrency
+    assert getattr(service, client_attr).max_workers == concurrency
+
+
+@pytest.mark.parametrize('service_cls, client_attr, stubs, invoke', [
+    (GitHubUserService, 'github_client',
+     {'get_user_repositories': []}, lambda service: service.clone_user_repositories("testuser")),
+    (GitHubOrganizationService, 'github_client',
+     {'get_organization_repositories': []}, lambda service: service.clone_organization_repositories("testorg")),
+], ids=['github-user', 'github-organization'])
+def test_empty_listing_clones_nothing(http_session, github_config, repo_config, service_cls, client_attr, stubs, invoke):
+    """Test that a service with nothing to list finishes without cloning"""
+    service = service_cls(github_config, repo_config, session=http_session)
+    client = getattr(service, client_attr)
+    for name, value in stubs.items():
+        setattr(client, name, Mock(return_value=value))
+    service.repo_manager.clone_or_pull_repo = Mock()
+    
+    invoke(service)
+    
+    service.repo_manager.clone_or_pull_repo.assert_not_called()
 
 
 class TestComposerService: